@@ -10,8 +10,11 @@ from funcoes.pressionar_teclas import pressionar_atalho_combinado, pressionar_te
 from funcoes.clicar_com_botao_direito import clicar_com_botao_direito
 from funcoes.processar_log_clipboard import obter_ultimo_usuario_do_log
 from funcoes.clicar_elemento import clicar_elemento
+from funcoes.esperar_elemento import esperar_elemento
 from uteis.logica_vendedores import obter_codigo_divisao_por_usuario
 from assistente.executor import executar_acao_assistida
+from uteis.ritmo import pausar
+from funcoes.area_transferencia import copiar_por, preservar_area_transferencia
 
 
 def preencher_aba_caracteristicas():
@@ -20,32 +23,33 @@ def preencher_aba_caracteristicas():
 # 1. Navegar para a aba Características
 # ============================================================
     executar_acao_assistida(lambda: ir_para_aba("caracteristicas"), nome_acao="Navegar para a Aba Características")
-    time.sleep(1)
 
 # ============================================================
 # 2. pressionar o atalho para abrir o log de modificações Alt + F + L
 # ============================================================
     executar_acao_assistida(lambda: pressionar_atalho_combinado('alt', 'f'), nome_acao="Pressionar atalho 'Alt+F'")
-    time.sleep(1)
+    pausar("abrir_menu")
     executar_acao_assistida(lambda: pressionar_tecla_unica('l'), nome_acao="Pressionar tecla 'L' para abrir o Log")
-    time.sleep(1)
+    executar_acao_assistida(lambda: esperar_elemento("caracteristicas_logmodif"), nome_acao="Aguardar a janela do Log abrir")
 
 
 # ============================================================
 # 3. Copia tabela do log de modificações para a área de transferência e fecha janela do log.
 # ============================================================
     executar_acao_assistida(lambda: clicar_com_botao_direito("caracteristicas_logmodif", ajuste_x_override=-50, ajuste_y_override=30), nome_acao="Clicar com botão direito no log para copiar")
-    time.sleep(2)
-    executar_acao_assistida(lambda: pressionar_tecla_unica('t'), nome_acao="Pressionar tecla 'T' para Copiar Tudo")
-    time.sleep(1)
+    pausar("abrir_menu_log")
+    def copiar_log():
+        with preservar_area_transferencia():
+            return copiar_por(lambda: pressionar_tecla_unica('t'))
+    log_copiado = executar_acao_assistida(copiar_log, nome_acao="Pressionar tecla 'T' para Copiar Tudo")
     executar_acao_assistida(lambda: pressionar_tecla_unica('esc'), nome_acao="Pressionar tecla 'Esc' para Fechar o Log")
-    time.sleep(1)
+    executar_acao_assistida(lambda: esperar_elemento("caracteristicas_logmodif", desaparecer=True), nome_acao="Aguardar a janela do Log fechar")
 
 
 # ============================================================
 # 4. Processar o log e obter o ultimo usuário.
 # ============================================================
-    ultimo_usuario = executar_acao_assistida(obter_ultimo_usuario_do_log,nome_acao="Processar log da área de transferência")
+    ultimo_usuario = executar_acao_assistida(lambda: obter_ultimo_usuario_do_log(log_copiado),nome_acao="Processar log da área de transferência")
 
 
 # ============================================================
@@ -61,7 +65,7 @@ def preencher_aba_caracteristicas():
         executar_acao_assistida(lambda: clicar_elemento("caracteristicas_pet7"),nome_acao=f"Definir divisão como PET7 (Usuário: {ultimo_usuario})")
     else: # Usuário é SERILON (ou outro), clica em Y.
         executar_acao_assistida(lambda: clicar_elemento("caracteristicas_serilon"),nome_acao=f"Definir divisão como SERILON (Usuário: {ultimo_usuario})")
-    time.sleep(0.5)
+    pausar("apos_clique")
     return codigo_divisao
 
 
@@ -8,6 +8,7 @@ import time
 from navegacao.navegacao_abas import ir_para_aba
 from funcoes.clicar_elemento import clicar_elemento
 from assistente.executor import executar_acao_assistida
+from uteis.ritmo import pausar
 
 
 def preencher_aba_condicoespgto():
@@ -16,15 +17,14 @@ def preencher_aba_condicoespgto():
 # ============================================================
 # Passo 1: Navegar para a aba.
 # ============================================================
-    time.sleep(1)
+    pausar("antes_aba")
     executar_acao_assistida(lambda: ir_para_aba("condicoespgto"), nome_acao="Navegar para a Aba Condições de Pagamento")
-    time.sleep(1)
 
 # ============================================================
 # Passo 2: Clicar no elemento de entrega parcial.
 # ============================================================
     executar_acao_assistida(lambda: clicar_elemento("condicoespgto_entregparcial"), nome_acao="Marcar/Desmarcar 'Permitir Entrega Parcial'")
-    time.sleep(0.5)
+    pausar("apos_clique")
 
 
 # --- Camada de Teste Direto ---
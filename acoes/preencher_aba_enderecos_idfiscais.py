@@ -8,6 +8,7 @@ import time
 from navegacao.navegacao_abas import ir_para_aba
 from funcoes.clicar_elemento import clicar_elemento
 from funcoes.digitar_texto import digitar_texto
+from funcoes.esperar_elemento import esperar_elemento
 from uteis.formatadores import contar_caracteres, limpar_documento
 from uteis.extrator_documento_tela import scraping_cnpj_cpf
 from servicos.consulta_cnpj import obter_dados_cnpj
@@ -15,6 +16,7 @@ from assistente.executor import executar_acao_assistida
 from uteis.cores import AMARELO, VERDE, VERMELHO, RESET
 from funcoes.selecionar_dropdown import selecionar_dropdown
 from uteis.gestor_sessao import ler_dados_sessao, escrever_dados_sessao
+from uteis.ritmo import pausar
 
 
 def preencher_aba_enderecos_idfiscais():
@@ -27,14 +29,13 @@ def preencher_aba_enderecos_idfiscais():
     # Passo 1: Navegar para Aba Endereços
     # ============================================================
     executar_acao_assistida(lambda: ir_para_aba("enderecos"), nome_acao="Navegar para a Aba Endereços")
-    time.sleep(1)
 
 
     # ============================================================
     # Passo 2: Abrir IDs Fiscais
     # ============================================================
     executar_acao_assistida(lambda: clicar_elemento("enderecos_idfiscais"), nome_acao="Abrir IDs Fiscais")
-    time.sleep(1)
+    executar_acao_assistida(lambda: esperar_elemento("enderecos_idfiscais_ie"), nome_acao="Aguardar a janela de IDs Fiscais abrir")
 
 
     # ============================================================
@@ -83,19 +84,18 @@ def preencher_aba_enderecos_idfiscais():
 
     else: # Se for CPF (tipo_pessoa == 1)
         print(f"   - Documento é CPF: {VERDE}{documento_copiado}{RESET}. Definindo IE como 'Isento'.")
-    time.sleep(1.5)
+    pausar("antes_ie")
 
     executar_acao_assistida(lambda: digitar_texto("enderecos_idfiscais_ie", inscricao_estadual_final), nome_acao=f"Digitar Inscrição Estadual ('{inscricao_estadual_final}')")
-    time.sleep(0.5)
+    pausar("confirmar_entrada")
 
 
     # ============================================================
     # Passo 7: Clicar Atualizar e OK
     # ============================================================
-    executar_acao_assistida(lambda: clicar_elemento("enderecos_idfiscais_atualizar"), nome_acao="Clicar 'Atualizar'")
-    time.sleep(2)
+    executar_acao_assistida(lambda: clicar_elemento("enderecos_idfiscais_atualizar", aguardar_tela=True), nome_acao="Clicar 'Atualizar'")
     executar_acao_assistida(lambda: clicar_elemento("enderecos_idfiscais_ok"), nome_acao="Clicar 'OK'")
-    time.sleep(1)
+    pausar("fechar_janela")
 
 
     # ============================================================
@@ -112,7 +112,7 @@ def preencher_aba_enderecos_idfiscais():
 
         print(f"   - Status Simples Nacional: ({VERDE}{status_simples}{RESET}). Selecionando '{nome_opcao}'...")
         executar_acao_assistida(lambda: selecionar_dropdown("enderecos_simplesnac", valor_dropdown_simples), nome_acao=f"Selecionar Simples Nacional como '{nome_opcao}'")
-        time.sleep(0.5)
+        pausar("apos_clique")
     else:
         print("   - Documento é CPF. Pulando etapa do Simples Nacional.")
 
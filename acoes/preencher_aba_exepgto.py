@@ -7,8 +7,10 @@ Módulo para preenchimento da aba Execução de Pagamentos.
 import time
 from navegacao.navegacao_abas import ir_para_aba
 from funcoes.clicar_elemento import clicar_elemento
-from funcoes.rolar_mouse import rolar_mouse_linhas
+from funcoes.rolar_mouse import rolar_ate_elemento
+from funcoes.esperar_elemento import esperar_elemento
 from assistente.executor import executar_acao_assistida
+from uteis.ritmo import pausar
 
 def preencher_aba_exepgto(divisao_pn: int):
     """(Orquestradora) Executa o fluxo completo para a Aba Execução de Pagamentos.
@@ -18,21 +20,20 @@ def preencher_aba_exepgto(divisao_pn: int):
     # 1. Navegar para a aba.
     # ============================================================
     executar_acao_assistida(lambda: ir_para_aba("exepgto"), nome_acao="Navegar para a Aba Execução de Pagamentos")
-    time.sleep(1)
 
 
     # ============================================================
     # 2. Abrir janela de formas de pgto.
     # ============================================================
     executar_acao_assistida(lambda: clicar_elemento("exepgto_abrirformas"), nome_acao="Abrir janela de Formas de Pagamento")
-    time.sleep(1)
+    executar_acao_assistida(lambda: esperar_elemento("exepgto_bonif"), nome_acao="Aguardar a janela de Formas de Pagamento abrir")
 
 
     # ============================================================
     # 3. Selecionar forma de pgto 'Bonificação'.
     # ============================================================
     executar_acao_assistida(lambda: clicar_elemento("exepgto_bonif"), nome_acao="Selecionar forma de pgto 'Bonificação'")
-    time.sleep(0.5)
+    pausar("apos_clique")
 
 
     if divisao_pn != 4:
@@ -40,35 +41,34 @@ def preencher_aba_exepgto(divisao_pn: int):
     # 4. Clicar nas formas de pgto 'Crédito'.
     # ============================================================ 
         executar_acao_assistida(lambda: clicar_elemento("exepgto_cred"), nome_acao="Selecionar forma de pgto 'Crédito'")
-        time.sleep(0.5)
+        pausar("apos_clique")
 
 
     # ============================================================
     # 5. Clicar na forma de pgto 'Depósito'.
     # ============================================================
     executar_acao_assistida(lambda: clicar_elemento("exepgto_deposito"), nome_acao="Selecionar forma de pgto 'Depósito'")
-    time.sleep(0.5)
+    pausar("apos_clique")
 
 
     # ============================================================
-    # 6. Rolar a lista para baixo.
+    # 6. Rolar a lista para baixo até a forma de pgto 'Misto' aparecer.
     # ============================================================
-    executar_acao_assistida(lambda: rolar_mouse_linhas(11, direcao='baixo'), nome_acao="Rolar 8 linhas para baixo na lista de formas de pgto")
-    time.sleep(0.5)
+    executar_acao_assistida(lambda: rolar_ate_elemento("exepgto_misto", direcao='baixo', chave_referencia="exepgto_deposito"), nome_acao="Rolar a lista de formas de pgto até 'Misto'")
 
 
     # ============================================================
     # 7. Clicar na forma de pgto 'Misto'.
     # ============================================================
     executar_acao_assistida(lambda: clicar_elemento("exepgto_misto"), nome_acao="Selecionar forma de pgto 'Misto'")
-    time.sleep(0.5)
+    pausar("apos_clique")
 
 
     # ============================================================
     # 8. Clicar para fechar a janela.
     # ============================================================
     executar_acao_assistida(lambda: clicar_elemento("exepgto_fecharformas"), nome_acao="Fechar janela de Formas de Pagamento")
-    time.sleep(1) # Pausa para a janela fechar
+    pausar("fechar_janela") # Pausa para a janela fechar
 
 
 # --- Camada de Teste Direto ---
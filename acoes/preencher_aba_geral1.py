@@ -1,74 +1,61 @@
 # acoes/preencher_aba_geral.py
 
 """
-Módulo de preenchimento da primeira parte da Aba Geral,
-com cada passo executado individualmente pelo 'assistente.executor'.
+Módulo de preenchimento da primeira parte da Aba Geral.
+
+Os passos são declarados como dados e executados por um plano compilado
+('assistente.plano_acoes'): cada passo continua a passar individualmente
+pelo 'assistente.executor'.
 """
 
 import time
 from datetime import date
-from navegacao.navegacao_abas import ir_para_aba
-from funcoes.selecionar_dropdown import selecionar_dropdown
-from funcoes.digitar_texto import digitar_texto
-from assistente.executor import executar_acao_assistida
-
-
-def processar_aba_geral_parte1():
-    """(Orquestradora) Executa o fluxo completo para a Aba Geral.
-
-    Esta função de alto nível orquestra a sequência de ações, passando
-    cada passo individualmente pelo Assistente de execução assistida para
-    controle granular de falhas e retentativas.
-    """
-    
-    # ============================================================
-    # 1. Navega para a aba correta
-    # ============================================================
-    executar_acao_assistida(lambda: ir_para_aba("geral"), nome_acao="Navegar para a Aba Geral")
-    time.sleep(1)
+from assistente.plano_acoes import compilar_plano, executar_plano
 
 
-    # ============================================================
-    # 2. Define o tipo do PN.
-    # ============================================================
-    executar_acao_assistida(lambda: selecionar_dropdown("geral1_tipopn", "Cliente"),nome_acao="Definir Tipo do PN como 'Cliente'")
-    time.sleep(2)
-
+def _montar_passos():
+    """Função interna: os passos da Aba Geral (parte 1), por ordem."""
+    data_hoje = date.today().strftime("%d/%m/%Y")
+    return [
+        # 1. Navega para a aba correta.
+        {"acao": "aba", "valor": "geral", "nome": "Navegar para a Aba Geral"},
+        {"acao": "esperar", "chave": "geral1_tipopn", "nome": "Aguardar a Aba Geral carregar"},
 
-    # ============================================================
-    # 3. Define a Moeda.
-    # ============================================================
-    executar_acao_assistida(lambda: selecionar_dropdown("geral1_moeda", "Real", ajuste_x_override=150),nome_acao="Definir Moeda como 'Real'")
-    time.sleep(1)
+        # 2. Define o tipo do PN.
+        {"acao": "dropdown", "chave": "geral1_tipopn", "valor": "Cliente", "pausa": "mudar_tipo_pn",
+         "nome": "Definir Tipo do PN como 'Cliente'"},
 
+        # 3. Define a Moeda.
+        {"acao": "dropdown", "chave": "geral1_moeda", "valor": "Real", "ajuste_x": 150, "pausa": "apos_campo",
+         "nome": "Definir Moeda como 'Real'"},
 
-    # ============================================================
-    # 4. Define o Tipo de envio.
-    # ============================================================
-    executar_acao_assistida(lambda: selecionar_dropdown("geral1_tipoenvio", "sem", ajuste_x_override=150),nome_acao="Definir Tipo de Envio como 'Sem-frete'")
-    time.sleep(1)
+        # 4. Define o Tipo de envio.
+        {"acao": "dropdown", "chave": "geral1_tipoenvio", "valor": "sem", "ajuste_x": 150, "pausa": "apos_campo",
+         "nome": "Definir Tipo de Envio como 'Sem-frete'"},
 
+        # 5. Define a Data de início.
+        {"acao": "digitar", "chave": "geral1_datainicio", "valor": "H", "ajuste_x": 150, "pausa": "apos_campo",
+         "nome": f"Definir Data de Início como 'Hoje' ({data_hoje})"},
 
-    # ============================================================
-    # 5. Define a Data de início.
-    # ============================================================
-    data_hoje = date.today().strftime("%d/%m/%Y")
-    executar_acao_assistida(lambda: digitar_texto("geral1_datainicio", "H", ajuste_x_override=150),nome_acao=f"Definir Data de Início como 'Hoje' ({data_hoje})")
-    time.sleep(1)
+        # 6. Define o Uso-principal.
+        {"acao": "dropdown", "chave": "geral1_usoprincipal", "valor": "s-venda", "ajuste_x": 120, "pausa": "apos_campo",
+         "nome": "Definir Uso Principal como 'S-Vendas'"},
 
+        # 7. Define Enviar p/revisão.
+        {"acao": "dropdown", "chave": "geral1_enviarrevisao", "valor": "N", "ajuste_x": 120, "pausa": "apos_campo",
+         "nome": "Definir 'Enviar p/ Revisão' como 'Não'"},
+    ]
 
-    # ============================================================
-    # 6. Define o Uso-principal.
-    # ============================================================
-    executar_acao_assistida(lambda: selecionar_dropdown("geral1_usoprincipal", "s-venda", ajuste_x_override=120),nome_acao="Definir Uso Principal como 'S-Vendas'")
-    time.sleep(1)
 
+def processar_aba_geral_parte1():
+    """(Orquestradora) Executa o fluxo completo para a Aba Geral.
 
-    # ============================================================
-    # 7. Define Enviar p/revisão.
-    # ============================================================
-    executar_acao_assistida(lambda: selecionar_dropdown("geral1_enviarrevisao", "N", ajuste_x_override=120),nome_acao="Definir 'Enviar p/ Revisão' como 'Não'")
-    time.sleep(1)
+    Esta função de alto nível compila os passos declarados da aba num plano
+    (as âncoras do formulário são localizadas numa só captura) e executa-o,
+    passando cada passo individualmente pelo Assistente de execução assistida
+    para controle granular de falhas e retentativas.
+    """
+    executar_plano(compilar_plano(_montar_passos()))
 
 # --- Camada de Teste Direto ---
 if __name__ == '__main__':
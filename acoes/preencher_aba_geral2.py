@@ -12,43 +12,30 @@ Ela preenche:
 """
 
 import time
-from assistente.executor import executar_acao_assistida
-from uteis.cores import AMARELO, VERDE, RESET
-from funcoes.colar_texto import colar_texto
-from funcoes.selecionar_dropdown import selecionar_dropdown
+from uteis.cores import AMARELO, RESET
 from uteis.gestor_sessao import ler_dados_sessao
 from datetime import datetime
-from navegacao.navegacao_abas import ir_para_aba
+from assistente.plano_acoes import compilar_plano, executar_plano
+from uteis.ritmo import pausar
 
 
 
 
 
-def preencher_aba_geral2():
-    """
-    (Orquestradora/Consumidor) Executa o fluxo de preenchimento
-    da segunda parte da Aba Geral (Data Abertura, Tipo Pessoa, Regra CC).
-    """
+def _montar_passos(dados_sessao: dict) -> list:
+    """Função interna: os passos da Aba Geral (parte 2), conforme os dados da sessão."""
+    data_abertura = dados_sessao.get("data_abertura", "")
+    tipo_pessoa_num = dados_sessao.get("tipo_pessoa", 0)
+    status_ie = dados_sessao.get("inscricao_estadual", "Isento")
 
     # ============================================================
     # 1. Navega para a aba correta
     # ============================================================
-    time.sleep(1)
-    executar_acao_assistida(lambda: ir_para_aba("geral"), nome_acao="Navegar para a Aba Geral")
-    time.sleep(3)
-
-
-    # ============================================================
-    # 2. Ler Dados da Sessão JSON
-    # ============================================================
-    dados_sessao = ler_dados_sessao()
-    data_abertura = dados_sessao.get("data_abertura", "")
-    tipo_pessoa_num = dados_sessao.get("tipo_pessoa", 0)
-    status_ie = dados_sessao.get("inscricao_estadual", "Isento")
+    passos = [{"acao": "aba", "valor": "geral", "pausa": "carregar_aba", "nome": "Navegar para a Aba Geral"}]
 
 
     # ============================================================
-    # 3. Preencher Data de Abertura
+    # 2. Preencher Data de Abertura
     # ============================================================
     if not data_abertura:
         print(f"   {AMARELO}⚠️  Data de Abertura não encontrada no JSON. Pulando passo.{RESET}")
@@ -58,27 +45,27 @@ def preencher_aba_geral2():
             data_obj = datetime.strptime(data_abertura, "%Y-%m-%d")
             # 2. Formata o objeto data para a string DD/MM/AAAA
             data_formatada_br = data_obj.strftime("%d/%m/%Y")
-            executar_acao_assistida(lambda: colar_texto("geral2_data_abertura", data_formatada_br), nome_acao=f"Preencher Data de Abertura ({data_formatada_br})")
-            time.sleep(1)
-        
+            passos.append({"acao": "colar", "chave": "geral2_data_abertura", "valor": data_formatada_br, "pausa": "apos_campo",
+                           "nome": f"Preencher Data de Abertura ({data_formatada_br})"})
+
         except ValueError:
             # Se a data no JSON estiver num formato inesperado (ex: "Isento")
             print(f"   {AMARELO}⚠️  Data de Abertura '{data_abertura}' está em formato inválido (esperado AAAA-MM-DD). Pulando passo.{RESET}")
 
 
     # ============================================================
-    # 4. Definir Tipo de Pessoa
+    # 3. Definir Tipo de Pessoa
     # ============================================================
     if tipo_pessoa_num == 0:
         print(f"   {AMARELO}⚠️  Tipo de Pessoa (1 ou 2) não encontrado no JSON. Pulando passo.{RESET}")
     else:
         valor_tipo_pessoa_sap = str(tipo_pessoa_num)
-        executar_acao_assistida(lambda: selecionar_dropdown("geral2_tipo_pessoa", valor_tipo_pessoa_sap), nome_acao=f"Selecionar Tipo Pessoa ({valor_tipo_pessoa_sap})")
-        time.sleep(1)
+        passos.append({"acao": "dropdown", "chave": "geral2_tipo_pessoa", "valor": valor_tipo_pessoa_sap, "pausa": "apos_campo",
+                       "nome": f"Selecionar Tipo Pessoa ({valor_tipo_pessoa_sap})"})
 
 
     # ============================================================
-    # 5. Executar "Regra CC"
+    # 4. Executar "Regra CC"
     # ============================================================
     if str(status_ie).strip().lower() == "isento":
         valor_ind_ie = "9"
@@ -87,21 +74,30 @@ def preencher_aba_geral2():
         # (Qualquer coisa diferente de 'isento' (um número))
         valor_ind_ie = "1"
         valor_op_cons = "0"
-        
+
 
     # ============================================================
-    # 6. Definir Ind. IE 
+    # 5. Definir Ind. IE e Ind. Op Cons
     # ============================================================
-    executar_acao_assistida(lambda: selecionar_dropdown("geral2_indicador_ie", valor_ind_ie), nome_acao=f"Selecionar Indicador IE ({valor_ind_ie})")
-    time.sleep(1)
+    passos.append({"acao": "dropdown", "chave": "geral2_indicador_ie", "valor": valor_ind_ie, "pausa": "apos_campo",
+                   "nome": f"Selecionar Indicador IE ({valor_ind_ie})"})
+    passos.append({"acao": "dropdown", "chave": "geral2_op_consumidor", "valor": valor_op_cons, "pausa": "apos_campo",
+                   "nome": f"Selecionar Ind. Op. Consumidor ({valor_op_cons})"})
+    return passos
 
 
-    # ============================================================
-    # 7. Definir Ind. Op Cons
-    # ============================================================
-    executar_acao_assistida(lambda: selecionar_dropdown("geral2_op_consumidor", valor_op_cons), nome_acao=f"Selecionar Ind. Op. Consumidor ({valor_op_cons})")
-    time.sleep(1)
-    
+def preencher_aba_geral2():
+    """
+    (Orquestradora/Consumidor) Executa o fluxo de preenchimento
+    da segunda parte da Aba Geral (Data Abertura, Tipo Pessoa, Regra CC).
+
+    Os passos são montados a partir do JSON de sessão e executados por um
+    plano compilado ('assistente.plano_acoes').
+    """
+    passos = _montar_passos(ler_dados_sessao())
+    pausar("antes_aba")
+    executar_plano(compilar_plano(passos))
+
 
 # --- Camada de Teste Direto ---
 if __name__ == '__main__':
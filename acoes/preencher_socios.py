@@ -14,6 +14,7 @@ from funcoes.colar_texto import colar_texto
 from assistente.executor import executar_acao_assistida
 from uteis.cores import AMARELO, VERDE, VERMELHO, RESET
 from uteis.gestor_sessao import ler_dados_sessao
+from uteis.ritmo import pausar
 
 
 def preencher_aba_socios():
@@ -44,7 +45,6 @@ def preencher_aba_socios():
     # Passo 2: Navegar para Aba Pessoas de Contato
     # ============================================================
     executar_acao_assistida(lambda: ir_para_aba("socio"), nome_acao="Navegar para a Aba Pessoas de Contato (Sócios)")
-    time.sleep(1)
     print(f"   - Iniciando o preenchimento de {len(lista_de_socios)} sócio(s)...")
 
 
@@ -56,32 +56,29 @@ def preencher_aba_socios():
             print(f"     - Preenchendo sócio: {VERDE}{socio}{RESET}")
             
             # --- Bloco do Clique - (DENIFIR NOVO)---
-            try:
-                clicar_elemento("pessoascontato_novosocio")
-                time.sleep(1)
-            except Exception:
-                clicar_elemento("pessoascontato_novosocio2")
-                time.sleep(1)
+            # As duas versões do botão (grupo de variantes) são comparadas numa só captura.
+            clicar_elemento("pessoascontato_botao_novosocio")
+            pausar("abrir_linha")
             
             # --- Passo 2: Colar ---
             executar_acao_assistida(lambda: colar_texto('pessoascontato_idsocio', socio), nome_acao=f"Colar nome '{socio}'")
-            time.sleep(1)
+            pausar("apos_campo")
             
             # --- Passo 3: Shift+Tab ---
             executar_acao_assistida(lambda: pressionar_atalho_combinado('shift', 'tab'), nome_acao="Sair do campo (Shift+Tab)")
-            time.sleep(1)
+            pausar("apos_campo")
 
              # --- Passo 4: Shift+Tab novamente---
             executar_acao_assistida(lambda: pressionar_atalho_combinado('shift', 'tab'), nome_acao="Sair do campo (Shift+Tab)")
-            time.sleep(1)
+            pausar("apos_campo")
             
             # --- Passo 4: 'y' ---
             executar_acao_assistida(lambda: pressionar_tecla_unica('y'), nome_acao="Selecionar 'Y' (Sim) para Sócio")
-            time.sleep(1)
+            pausar("apos_campo")
         
         except Exception as e:
             print(f"   {VERMELHO}❌ Falha ao preencher o sócio '{socio}': {e}{RESET}")
-            time.sleep(1) # Pausa e continua o loop
+            pausar("apos_falha") # Pausa e continua o loop
 
 
 # --- Camada de Teste Direto
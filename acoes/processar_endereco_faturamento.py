@@ -7,7 +7,6 @@ obter coordenadas e atualizar a tabela.
 
 import time
 import pandas as pd
-import pyperclip
 from funcoes.clicar_com_botao_direito import clicar_com_botao_direito
 from funcoes.pressionar_teclas import pressionar_tecla_unica, pressionar_atalho_combinado
 from funcoes.clicar_elemento import clicar_elemento
@@ -17,6 +16,8 @@ from uteis.validadores import validar_tabela_endereco
 from uteis.formatadores import formatar_endereco_para_api
 from assistente.executor import executar_acao_assistida
 from uteis.cores import VERMELHO, RESET, AMARELO
+from uteis.ritmo import pausar
+from funcoes.area_transferencia import copiar_por, colar_por, preservar_area_transferencia
 
 
 def processar_endereco_faturamento():
@@ -26,15 +27,17 @@ def processar_endereco_faturamento():
     # Passo 1: Copiar Tabela de Endereço
     # ============================================================
     executar_acao_assistida(lambda: clicar_com_botao_direito("enderecos_tabela"), nome_acao="Clicar com botão direito na Tabela de Endereços")
-    time.sleep(1)
-    executar_acao_assistida(lambda: pressionar_tecla_unica('t'), nome_acao="Pressionar tecla 'T' para Copiar Tabela de Endereço")
-    time.sleep(1)
+    pausar("abrir_menu")
+    def copiar_tabela():
+        with preservar_area_transferencia():
+            return copiar_por(lambda: pressionar_tecla_unica('t'))
+    tabela_copiada = executar_acao_assistida(copiar_tabela, nome_acao="Pressionar tecla 'T' para Copiar Tabela de Endereço")
 
 
     # ============================================================
     # Passo 2: Ler Tabela do Clipboard
     # ============================================================
-    df_endereco: pd.DataFrame = executar_acao_assistida(ler_tabela_clipboard_para_dataframe, nome_acao="Ler tabela de endereço do clipboard")
+    df_endereco: pd.DataFrame = executar_acao_assistida(lambda: ler_tabela_clipboard_para_dataframe(tabela_copiada), nome_acao="Ler tabela de endereço do clipboard")
 
 
     # ============================================================
@@ -117,17 +120,16 @@ def processar_endereco_faturamento():
     # Passo 8: Colar Tabela de Volta no SAP
     # ============================================================
     try:
-        pyperclip.copy(tabela_formatada_string)
-        time.sleep(0.3)
-        executar_acao_assistida(lambda: clicar_elemento("enderecos_idfaturamento"), nome_acao="Clicar na área da tabela para colar")
-        time.sleep(0.5)
-        executar_acao_assistida(lambda: pressionar_atalho_combinado('ctrl', 'v'), nome_acao="Colar tabela atualizada (Ctrl+V)")
-        time.sleep(1)
-        executar_acao_assistida(lambda: pressionar_atalho_combinado('enter'), nome_acao="Colar tabela atualizada (Ctrl+V)")
-        time.sleep(1)
+        with preservar_area_transferencia():
+            executar_acao_assistida(lambda: clicar_elemento("enderecos_idfaturamento"), nome_acao="Clicar na área da tabela para colar")
+            pausar("apos_clique")
+            executar_acao_assistida(lambda: colar_por(tabela_formatada_string, lambda: pressionar_atalho_combinado('ctrl', 'v')), nome_acao="Colar tabela atualizada (Ctrl+V)")
+            pausar("colar_tabela")
+            executar_acao_assistida(lambda: pressionar_atalho_combinado('enter'), nome_acao="Colar tabela atualizada (Ctrl+V)")
+            pausar("colar_tabela")
     except Exception as e:
         raise RuntimeError(f"Erro ao colar a tabela de volta no SAP: {e}")
-    time.sleep(3)
+    pausar("gravar_tabela")
 
 # --- Camada de Teste Direto ---
 if __name__ == '__main__':
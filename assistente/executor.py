@@ -2,12 +2,12 @@
 
 """Módulo executor que gerencia a execução, captura exceções e repassa o retorno."""
 
-import time
 from typing import Callable, Any
 
 from interface.menu_de_erro import exibir_menu_de_falha
 from uteis.cores import VERDE, VERMELHO, CIANO, RESET
 from assistente.excecoes import AutomacaoAbortadaPeloUsuario
+from uteis.ritmo import pausar
 
 def executar_acao_assistida(funcao_acao: Callable[..., Any], nome_acao: str = None) -> Any:
     """
@@ -35,7 +35,7 @@ def executar_acao_assistida(funcao_acao: Callable[..., Any], nome_acao: str = No
                 print(f"{CIANO}🦾 Executando: {nome_acao}...{RESET}")
                 ultimo_erro = e
                 print(f"{VERMELHO}   ✖ Falha na tentativa {tentativa}/3.{RESET}")
-                time.sleep(0.5)
+                pausar("retentativa")
 
         escolha = exibir_menu_de_falha(nome_acao, ultimo_erro)
 
@@ -0,0 +1,234 @@
+# assistente/plano_acoes.py
+
+"""
+Módulo do plano de ações: os passos de uma aba declarados como dados.
+
+Cada passo é um dicionário ("acao", "chave", "valor", ajustes, "pausa", "nome"). O
+compilador transforma a lista de passos num plano de execução que:
+- localiza de uma só vez (uma captura, ver `localizar_elementos`) as âncoras de cada trecho
+  da aba, deixando as buscas dos passos seguintes no cache de localização;
+- descarta pausas redundantes (antes de uma espera por âncora ou de uma troca de aba);
+- com a cadeia de foco ativa (`FOCUS_CHAIN`), alcança pelo teclado (Tab/Shift+Tab) os campos
+  que declaram `"foco"` a partir do campo do passo anterior, sem localizar a âncora deles;
+- continua a executar cada passo pelo Assistente executor, com as falhas reportadas por passo.
+"""
+
+import time
+from typing import Dict, Any, List, Tuple, Optional
+
+from navegacao.navegacao_abas import ir_para_aba
+from funcoes.clicar_elemento import clicar_elemento
+from funcoes.colar_texto import colar_texto
+from funcoes.digitar_texto import digitar_texto
+from funcoes.selecionar_dropdown import selecionar_dropdown
+from funcoes.esperar_elemento import esperar_elemento
+from funcoes.localizar_elemento import localizar_elementos
+from funcoes.foco_teclado import (
+    obter_ligacao_foco, mover_foco, digitar_no_foco, colar_no_foco, selecionar_no_foco, clicar_no_foco
+)
+from assistente.executor import executar_acao_assistida
+from configuracoes.carregar_config import USAR_CADEIA_FOCO
+from uteis.ritmo import atraso
+
+# Ações suportadas e se cada uma precisa de "chave" e de "valor".
+ACOES_PLANO = {
+    "aba": {"chave": False, "valor": True},        # ir_para_aba(valor)
+    "esperar": {"chave": True, "valor": False},    # esperar_elemento(chave)
+    "clicar": {"chave": True, "valor": False},     # clicar_elemento(chave, ajustes)
+    "digitar": {"chave": True, "valor": True},     # digitar_texto(chave, valor, ajustes)
+    "colar": {"chave": True, "valor": True},       # colar_texto(chave, valor, ajustes)
+    "dropdown": {"chave": True, "valor": True},    # selecionar_dropdown(chave, valor, ajustes)
+}
+
+# Ações depois das quais a tela muda (outra aba, elemento novo): as âncoras seguintes são
+# localizadas de novo, num novo lote. Antes delas, uma pausa fixa é redundante.
+ACOES_BARREIRA = ("aba", "esperar")
+
+# Quantos campos cada ação já avança o foco ao terminar (digitar/colar confirmam com Tab).
+AVANCO_FOCO = {"clicar": 0, "digitar": 1, "colar": 1, "dropdown": 0}
+
+
+def _validar_passo(indice: int, passo: Dict[str, Any]):
+    """
+    Função interna: confere se o passo tem uma ação conhecida e os campos que ela exige.
+
+    Raises:
+        ValueError: Se o passo estiver mal declarado.
+    """
+    acao = passo.get("acao")
+    if acao not in ACOES_PLANO:
+        raise ValueError(f"Passo {indice} ('{passo.get('nome')}'): ação '{acao}' inválida. Ações válidas: {list(ACOES_PLANO)}")
+    for campo, obrigatorio in ACOES_PLANO[acao].items():
+        if obrigatorio and passo.get(campo) is None:
+            raise ValueError(f"Passo {indice} ('{passo.get('nome')}'): a ação '{acao}' exige o campo '{campo}'.")
+
+
+def _teclas_foco(passo: Dict[str, Any], anterior: Optional[Dict[str, Any]]) -> Optional[int]:
+    """
+    Função interna: quantas teclas Tab levam do campo do passo anterior ao campo deste passo
+    (pela ligação `"foco"` da âncora), ou None se o passo tiver de localizar a sua âncora.
+    """
+    if not USAR_CADEIA_FOCO or anterior is None:
+        return None
+    if passo["acao"] in ACOES_BARREIRA or anterior["acao"] in ACOES_BARREIRA:
+        return None
+    ligacao = obter_ligacao_foco(passo["chave"])
+    if ligacao is None or ligacao[0] != anterior["chave"]:
+        return None
+    return ligacao[1] - AVANCO_FOCO[anterior["acao"]]
+
+
+def compilar_plano(passos: List[Dict[str, Any]]) -> List[Tuple[str, Any]]:
+    """
+    Compila os passos declarados num plano de execução.
+
+    Args:
+        passos (List[Dict[str, Any]]): Os passos, por ordem. Campos de cada passo:
+            - "acao" (str): uma das `ACOES_PLANO`.
+            - "chave" (str): a âncora do passo (todas as ações menos "aba").
+            - "valor" (str): o texto/opção (ou o nome da aba, na ação "aba").
+            - "ajuste_x" / "ajuste_y" (int, opcionais): overrides dos ajustes do JSON.
+            - "pausa" (str ou float, opcional): espera depois do passo, pelo nome (ver `uteis.ritmo`)
+              ou em segundos.
+            - "nome" (str, opcional): o nome mostrado pelo Assistente executor.
+
+    Returns:
+        List[Tuple[str, Any]]: As operações do plano: ("localizar", [chaves]), ("passo", passo),
+        ("foco", passo) (passo alcançado pelo teclado, com "teclas_foco") e ("pausa", segundos).
+
+    Raises:
+        ValueError: Se algum passo estiver mal declarado.
+    """
+    # 1. Valida todos os passos antes de executar qualquer um.
+    for indice, passo in enumerate(passos, start=1):
+        _validar_passo(indice, passo)
+
+    # 2. Marca os passos alcançados pelo teclado a partir do passo anterior (cadeia de foco).
+    passos = [dict(passo) for passo in passos]
+    for anterior, passo in zip([None] + passos[:-1], passos):
+        teclas = _teclas_foco(passo, anterior)
+        if teclas is not None:
+            passo["teclas_foco"] = teclas
+
+    plano = []
+    lote_pendente = True
+    for indice, passo in enumerate(passos):
+        barreira = passo["acao"] in ACOES_BARREIRA
+
+        # 3. No início de cada trecho sem barreiras, localiza todas as âncoras dele numa só captura
+        #    (só compensa com duas ou mais âncoras diferentes; os passos pelo teclado não precisam da sua).
+        if not barreira and lote_pendente:
+            chaves = []
+            for seguinte in passos[indice:]:
+                if seguinte["acao"] in ACOES_BARREIRA:
+                    break
+                if "teclas_foco" not in seguinte and seguinte["chave"] not in chaves:
+                    chaves.append(seguinte["chave"])
+            if len(chaves) > 1:
+                plano.append(("localizar", chaves))
+            lote_pendente = False
+
+        # 4. Uma pausa imediatamente antes de uma barreira é redundante (a barreira já espera a tela).
+        if barreira and plano and plano[-1][0] == "pausa":
+            plano.pop()
+
+        plano.append(("foco" if "teclas_foco" in passo else "passo", passo))
+        lote_pendente = lote_pendente or barreira
+
+        # 5. Pausa depois do passo.
+        pausa = passo.get("pausa") or 0
+        pausa = atraso(pausa) if isinstance(pausa, str) else float(pausa)
+        if pausa > 0:
+            plano.append(("pausa", pausa))
+
+    return plano
+
+
+def _executar_passo(passo: Dict[str, Any]) -> Any:
+    """Função interna: executa um passo com a função de `funcoes/` (ou da navegação) correspondente."""
+    acao, chave, valor = passo["acao"], passo.get("chave"), passo.get("valor")
+    ajuste_x, ajuste_y = passo.get("ajuste_x"), passo.get("ajuste_y")
+    if acao == "aba":
+        return ir_para_aba(valor)
+    if acao == "esperar":
+        return esperar_elemento(chave)
+    if acao == "clicar":
+        return clicar_elemento(chave, ajuste_x, ajuste_y)
+    if acao == "digitar":
+        return digitar_texto(chave, valor, ajuste_x, ajuste_y)
+    if acao == "colar":
+        return colar_texto(chave, valor, ajuste_x, ajuste_y)
+    return selecionar_dropdown(chave, valor, ajuste_x, ajuste_y)
+
+
+def _executar_passo_foco(passo: Dict[str, Any]) -> Any:
+    """Função interna: move o foco pelo teclado até o campo do passo e executa-o sem localizar a âncora."""
+    acao, chave, valor = passo["acao"], passo["chave"], passo.get("valor")
+    mover_foco(passo["teclas_foco"])
+    if acao == "clicar":
+        return clicar_no_foco(chave)
+    if acao == "digitar":
+        return digitar_no_foco(chave, valor)
+    if acao == "colar":
+        return colar_no_foco(chave, valor)
+    return selecionar_no_foco(chave, valor)
+
+
+def executar_plano(plano: List[Tuple[str, Any]]):
+    """
+    Executa um plano compilado por `compilar_plano`.
+
+    A localização em lote é só uma otimização: uma falha nela é ignorada e cada passo volta a
+    localizar a sua âncora normalmente, com as retentativas e o menu de falha do Assistente executor.
+    Um passo pelo teclado só usa a cadeia de foco se o passo anterior terminou com sucesso; as
+    retentativas dele (e os passos depois de um passo ignorado) voltam a localizar a âncora.
+
+    Raises:
+        AutomacaoAbortadaPeloUsuario: Se o usuário abortar num dos passos.
+    """
+    foco_valido = False
+    for operacao, argumento in plano:
+        if operacao == "localizar":
+            try:
+                localizar_elementos(argumento)
+            except Exception:
+                pass
+        elif operacao == "pausa":
+            time.sleep(argumento)
+        else:
+            nome_acao = argumento.get("nome") or f"{argumento['acao']} '{argumento.get('chave') or argumento.get('valor')}'"
+            estado = {"via_foco": operacao == "foco" and foco_valido, "concluido": False}
+
+            def acao(passo=argumento, estado=estado):
+                # Só a primeira tentativa usa o teclado: as teclas podem já ter movido o foco.
+                via_foco, estado["via_foco"] = estado["via_foco"], False
+                resultado = _executar_passo_foco(passo) if via_foco else _executar_passo(passo)
+                estado["concluido"] = True
+                return resultado
+
+            executar_acao_assistida(acao, nome_acao=nome_acao)
+            foco_valido = estado["concluido"]
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para conferir a compilação de um plano (não executa nada na tela).
+    Execute a partir da raiz: python -m assistente.plano_acoes
+    """
+    print(">>> Iniciando teste do compilador de planos...")
+
+    passos_teste = [
+        {"acao": "aba", "valor": "geral", "pausa": 1},
+        {"acao": "esperar", "chave": "geral1_tipopn"},
+        {"acao": "dropdown", "chave": "geral1_tipopn", "valor": "Cliente", "pausa": 2},
+        {"acao": "dropdown", "chave": "geral1_moeda", "valor": "Real", "ajuste_x": 150, "pausa": 1},
+    ]
+    plano_teste = compilar_plano(passos_teste)
+    for operacao in plano_teste:
+        print(f"--- {operacao[0]}: {operacao[1]['acao'] if operacao[0] in ('passo', 'foco') else operacao[1]}")
+    esperado = ["passo", "passo", "localizar", "passo", "pausa", "passo", "pausa"]
+    assert [operacao[0] for operacao in plano_teste] == esperado, "Teste 1 Falhou"
+    assert plano_teste[2][1] == ["geral1_tipopn", "geral1_moeda"], "Teste 2 Falhou"
+
+    print("\n--- Teste concluído com SUCESSO! ---")
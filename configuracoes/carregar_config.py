@@ -10,6 +10,80 @@ load_dotenv()
 # Nível de confiança padrão para busca de imagens (0.0 a 1.0)
 CONFIANCA_PADRAO_IMAGEM = float(os.getenv("DEFAULT_IMAGE_CONFIDENCE", 0.9))
 
+# Modo de busca de imagens padrão: "cor" (resolução total, colorido), "cinza" ou "piramide"
+# (tons de cinza com busca grossa numa pirâmide reduzida + refinamento). Pode ser sobrescrito
+# por âncora com a propriedade "modo_busca" no parametros.json.
+MODO_BUSCA_PADRAO = os.getenv("IMAGE_MATCH_MODE", "cor").strip().lower()
+
+# Número máximo de níveis reduzidos (por 2) da pirâmide usada no modo "piramide"
+NIVEIS_PIRAMIDE = int(os.getenv("IMAGE_PYRAMID_LEVELS", 2))
+
+# Motor de correspondência: "espacial" (cv2.matchTemplate), "fft" (domínio da frequência, espectros dos
+# templates em cache) ou "auto" (escolhe o mais barato para cada tamanho de template x tela)
+MOTOR_CORRESPONDENCIA = os.getenv("IMAGE_MATCH_ENGINE", "auto").strip().lower()
+
+# Memória máxima (MB) dos espectros FFT dos templates guardados em cache
+LIMITE_CACHE_FFT_MB = float(os.getenv("IMAGE_FFT_CACHE_MB", 256))
+
+# Escala tela/template: "auto" (detectada uma vez por sessão pela âncora mestre) ou um número fixo
+# (ex: 1.25 com o Windows a 125%). Os templates são redimensionados uma única vez em memória.
+ESCALA_TELA = os.getenv("SCREEN_SCALE", "auto").strip().lower()
+
+# Margem (em pixels) da busca por região ao redor da última posição conhecida de cada âncora
+MARGEM_BUSCA_REGIAO = int(os.getenv("ANCHOR_ROI_MARGIN", 150))
+
+# Guarda as últimas posições das âncoras em temp/ para a próxima execução começar "aquecida"
+PERSISTIR_POSICOES_ANCORAS = os.getenv("PERSIST_ANCHOR_POSITIONS", "true").strip().lower() in ("1", "true", "sim")
+
+# Prevê a posição dos campos pelo deslocamento (aprendido) em relação à âncora mestre do formulário de PN
+USAR_LAYOUT_ANCORAS = os.getenv("ANCHOR_LAYOUT", "true").strip().lower() in ("1", "true", "sim")
+
+# Reaproveita o último resultado de uma âncora enquanto a região da tela onde ela estava não mudar
+USAR_CACHE_LOCALIZACAO = os.getenv("LOCATE_RESULT_CACHE", "true").strip().lower() in ("1", "true", "sim")
+
+# Threads usadas para comparar templates em paralelo (várias âncoras ou faixas da tela). 1 = sem paralelismo
+THREADS_CORRESPONDENCIA = int(os.getenv("IMAGE_MATCH_THREADS", min(8, os.cpu_count() or 1)))
+
+# Tempo máximo (em segundos) que o robô espera um elemento aparecer/desaparecer antes de acusar falha
+TIMEOUT_ESPERA_ELEMENTO = float(os.getenv("ANCHOR_WAIT_TIMEOUT", 10))
+
+# Espera "tela estável" pós-ação: quantas capturas idênticas seguidas e o tempo máximo (s)
+QUADROS_TELA_ESTAVEL = int(os.getenv("SCREEN_SETTLE_FRAMES", 3))
+TIMEOUT_TELA_ESTAVEL = float(os.getenv("SCREEN_SETTLE_TIMEOUT", 3))
+# Tempo máximo (s) à espera de a tela mudar depois da ação, antes de contar os quadros iguais
+TIMEOUT_MUDANCA_TELA = float(os.getenv("SCREEN_CHANGE_TIMEOUT", 2))
+
+# Cadeia de foco: nos planos de ações, alcança pelo teclado (Tab) os campos que declaram "foco" no
+# parametros.json, a partir do campo vizinho, sem localizar a âncora deles. Desligado por padrão:
+# confira no SAP em uso a ordem de tabulação declarada antes de ligar
+USAR_CADEIA_FOCO = os.getenv("FOCUS_CHAIN", "false").strip().lower() in ("1", "true", "sim")
+
+# Confere, depois de escrever num campo (digitar_texto), se ele ficou com o valor esperado.
+# Pode ser desligado por âncora com a propriedade "verificar": false no parametros.json. Desligado por
+# padrão: confirme no formulário do SAP em uso que a leitura de volta (Home, Shift+End, Ctrl+C) funciona
+VERIFICAR_ENTRADA_TEXTO = os.getenv("TEXT_ENTRY_VERIFY", "false").strip().lower() in ("1", "true", "sim")
+
+# Perfil de ritmo da automação (uteis/ritmo.py): "seguro", "normal" ou "turbo". Decide a pausa automática
+# do PyAutoGUI e o fator das esperas entre ações. PACING_OVERRIDES fixa esperas por nome ("carregar_aba=2,...")
+PERFIL_RITMO = os.getenv("PACING_PROFILE", "normal").strip().lower()
+AJUSTES_RITMO = os.getenv("PACING_OVERRIDES", "").strip()
+
+# Tempo máximo (s) que uma cópia/colagem espera a área de transferência mudar (volta assim que muda)
+TIMEOUT_AREA_TRANSFERENCIA = float(os.getenv("CLIPBOARD_TIMEOUT", 2))
+# Tempo máximo (s) de uma cópia de um campo que pode estar vazio (ex: CNPJ/CPF sem saber qual está preenchido)
+TIMEOUT_CAMPO_VAZIO = float(os.getenv("CLIPBOARD_EMPTY_FIELD_TIMEOUT", 0.5))
+
+# Backend da área de transferência (uteis/area_transferencia_sistema.py): "auto" (o nativo da plataforma,
+# pyperclip só se não houver outro), "win32", "x11" ou "pyperclip"
+BACKEND_AREA_TRANSFERENCIA = os.getenv("CLIPBOARD_BACKEND", "auto").strip().lower()
+
+# Backend das ações de mouse/teclado: "pyautogui" (executa-as) ou o caminho de um ficheiro .jsonl onde cada
+# ação pretendida é gravada (hora, coordenadas) sem tocar no sistema operativo
+BACKEND_ENTRADA = os.getenv("INPUT_BACKEND", "pyautogui").strip()
+
+# Fonte das capturas de tela: "ao_vivo" (tela real) ou o caminho de uma pasta/.zip com quadros PNG gravados
+FONTE_TELA = os.getenv("SCREEN_SOURCE", "ao_vivo").strip()
+
 # ============================================================
 # 🔑 CHAVES E CONFIGURAÇÕES DE APIS EXTERNAS
 # ============================================================
@@ -53,6 +127,34 @@ if not CNPJA_API_URL_COMERCIAL_IE:
 if not CNPJA_API_KEY_COMERCIAL:
     raise ValueError("A chave CNPJA_API_KEY_COMERCIAL não foi encontrada no .env")
 
+# Valida o modo de busca de imagens padrão
+MODOS_BUSCA_SUPORTADOS = {"cor", "cinza", "piramide"}
+if MODO_BUSCA_PADRAO not in MODOS_BUSCA_SUPORTADOS:
+    raise ValueError(f"IMAGE_MATCH_MODE ({MODO_BUSCA_PADRAO}) não é suportado. Modos válidos: {MODOS_BUSCA_SUPORTADOS}")
+
+# Valida o motor de correspondência de imagens
+MOTORES_SUPORTADOS = {"auto", "espacial", "fft"}
+if MOTOR_CORRESPONDENCIA not in MOTORES_SUPORTADOS:
+    raise ValueError(f"IMAGE_MATCH_ENGINE ({MOTOR_CORRESPONDENCIA}) não é suportado. Motores válidos: {MOTORES_SUPORTADOS}")
+
+# Valida a escala da tela ("auto" ou um número positivo)
+if ESCALA_TELA != "auto":
+    try:
+        if float(ESCALA_TELA) <= 0:
+            raise ValueError
+    except ValueError:
+        raise ValueError(f"SCREEN_SCALE ({ESCALA_TELA}) inválido. Use 'auto' ou um número positivo (ex: 1.25).")
+
+# Valida o perfil de ritmo
+PERFIS_RITMO_SUPORTADOS = {"seguro", "normal", "turbo"}
+if PERFIL_RITMO not in PERFIS_RITMO_SUPORTADOS:
+    raise ValueError(f"PACING_PROFILE ({PERFIL_RITMO}) não é suportado. Perfis válidos: {PERFIS_RITMO_SUPORTADOS}")
+
+# Valida o backend da área de transferência
+BACKENDS_AREA_TRANSFERENCIA_SUPORTADOS = {"auto", "win32", "x11", "pyperclip"}
+if BACKEND_AREA_TRANSFERENCIA not in BACKENDS_AREA_TRANSFERENCIA_SUPORTADOS:
+    raise ValueError(f"CLIPBOARD_BACKEND ({BACKEND_AREA_TRANSFERENCIA}) não é suportado. Backends válidos: {BACKENDS_AREA_TRANSFERENCIA_SUPORTADOS}")
+
 # Valida se a API principal selecionada está entre as suportadas
 APIS_SUPORTADAS = {1}  # Por enquanto, só suportamos a API 1 (CNPJá Pública)
 if API_CNPJ_SELECIONADA not in APIS_SUPORTADAS:
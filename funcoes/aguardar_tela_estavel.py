@@ -0,0 +1,109 @@
+# funcoes/aguardar_tela_estavel.py
+
+"""
+Módulo para esperar a interface "assentar" depois de uma ação.
+
+Em vez de uma pausa fixa, uma região da tela é capturada em alta frequência e a
+espera termina assim que N quadros seguidos forem idênticos (ou o tempo esgotar).
+
+Quadros iguais logo depois da ação não provam que a interface já reagiu (o SAP pode
+começar a redesenhar só depois de uma ida ao servidor). Por isso, com um quadro de
+referência capturado antes da ação, a tela tem de mudar primeiro.
+"""
+
+import time
+import numpy as np
+from typing import Tuple, Optional
+from configuracoes.carregar_config import QUADROS_TELA_ESTAVEL, TIMEOUT_TELA_ESTAVEL, TIMEOUT_MUDANCA_TELA
+
+# Importa a captura de tela em memória (a mesma usada pela localização).
+from .capturar_tela import capturar_tela
+from uteis import reproducao_tela
+
+
+def aguardar_tela_estavel(regiao: Tuple[int, int, int, int] = None, quadros_iguais: int = None,
+                          intervalo: float = 0.05, timeout: float = None, espera_minima: float = 0.1,
+                          referencia: np.ndarray = None, espera_mudanca: float = None) -> bool:
+    """
+    Espera até a região da tela ficar igual durante `quadros_iguais` capturas seguidas.
+
+    Com `referencia` (a mesma região capturada antes da ação), só começa a contar os quadros
+    iguais depois de a tela ficar diferente da referência. Se nada mudar em `espera_mudanca`
+    segundos, a ação não teve efeito visível e a espera segue para a contagem.
+
+    Não levanta exceção quando o tempo esgota: é uma espera "pós-ação" e a próxima ação
+    (que localiza a sua âncora) é quem deve falhar se a tela não estiver pronta.
+
+    Args:
+        regiao (Tuple[int, int, int, int], optional): Região (left, top, largura, altura) a vigiar.
+                                                      Se omitida, vigia a tela inteira.
+        quadros_iguais (int, optional): Quantas capturas idênticas seguidas contam como "estável".
+                                        Padrão: `QUADROS_TELA_ESTAVEL` da configuração.
+        intervalo (float, optional): Pausa entre capturas, em segundos.
+        timeout (float, optional): Tempo máximo de espera. Padrão: `TIMEOUT_TELA_ESTAVEL`.
+        espera_minima (float, optional): Pausa inicial para a interface começar a reagir à ação.
+        referencia (np.ndarray, optional): Captura da região feita antes da ação (ver `capturar_referencia`).
+        espera_mudanca (float, optional): Tempo máximo à espera da primeira mudança em relação à
+                                          referência. Padrão: `TIMEOUT_MUDANCA_TELA`.
+
+    Returns:
+        bool: True se a tela estabilizou, False se o tempo esgotou antes disso.
+    """
+    quadros_a_usar = quadros_iguais if quadros_iguais is not None else QUADROS_TELA_ESTAVEL
+    timeout_a_usar = timeout if timeout is not None else TIMEOUT_TELA_ESTAVEL
+    limite = time.perf_counter() + timeout_a_usar
+
+    # 1. Dá tempo à interface para começar a mudar (um clique não redesenha a tela no mesmo instante).
+    time.sleep(espera_minima)
+
+    # 2. Com referência, espera a tela mudar (ex: o SAP redesenhar depois da resposta do servidor).
+    quadro_anterior = capturar_tela(regiao)
+    if referencia is not None:
+        limite_mudanca = time.perf_counter() + (espera_mudanca if espera_mudanca is not None else TIMEOUT_MUDANCA_TELA)
+        while np.array_equal(quadro_anterior, referencia) and time.perf_counter() < limite_mudanca:
+            time.sleep(intervalo)
+            quadro_anterior = capturar_tela(regiao)
+        limite = max(limite, time.perf_counter() + timeout_a_usar)
+
+    # 3. Captura quadros até haver `quadros_a_usar` iguais seguidos (o primeiro conta como 1).
+    iguais = 1
+    while iguais < quadros_a_usar:
+        if time.perf_counter() >= limite:
+            return False
+        time.sleep(intervalo)
+        quadro_atual = capturar_tela(regiao)
+        iguais = iguais + 1 if np.array_equal(quadro_atual, quadro_anterior) else 1
+        quadro_anterior = quadro_atual
+
+    return True
+
+
+def capturar_referencia(regiao: Tuple[int, int, int, int] = None) -> Optional[np.ndarray]:
+    """
+    Captura a região antes de uma ação, para `aguardar_tela_estavel(referencia=...)` exigir uma mudança.
+
+    Returns:
+        Optional[np.ndarray]: A captura, ou None com telas gravadas (um quadro gravado não reage à ação).
+    """
+    if reproducao_tela.gravacao_ativa():
+        return None
+    return capturar_tela(regiao)
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar a função 'aguardar_tela_estavel' de forma isolada.
+    Execute-o a partir da raiz do projeto com: python -m funcoes.aguardar_tela_estavel
+    """
+    print(">>> Iniciando teste da função 'aguardar_tela_estavel'...")
+    print(">>> Mexa (ou não) em alguma janela durante o teste.")
+
+    try:
+        inicio = time.perf_counter()
+        estavel = aguardar_tela_estavel(timeout=5)
+        print(f"--- Tela estável: {estavel} após {time.perf_counter() - inicio:.2f}s")
+        print("--- Teste concluído com SUCESSO!")
+
+    except Exception as e:
+        print(f"--- Teste FALHOU! Erro: {e}")
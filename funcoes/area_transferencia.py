@@ -0,0 +1,145 @@
+# funcoes/area_transferencia.py
+
+"""
+Módulo das "transações" com a área de transferência (copiar/colar no SAP).
+
+Em vez de pausas fixas à volta de cada Ctrl+C/Ctrl+V:
+- `copiar_por` põe um marcador único na área de transferência, executa a ação de cópia e
+  consulta a área de transferência até o conteúdo mudar (devolve no instante em que muda);
+- `colar_por` põe o texto, confirma que ele já está lá e só então executa a ação de colar;
+- `preservar_area_transferencia` guarda o conteúdo do usuário antes e devolve-o no fim.
+
+Com as ações só gravadas num rastro (`INPUT_BACKEND`), a área de transferência não é tocada.
+"""
+
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Any
+
+from configuracoes.carregar_config import TIMEOUT_AREA_TRANSFERENCIA
+from uteis.area_transferencia_sistema import ler_texto, escrever_texto
+from .comandos_entrada import entrada_simulada
+
+INTERVALO_CONSULTA = 0.005  # Segundos entre consultas à área de transferência (cada consulta é em memória).
+
+
+def ler_area_transferencia() -> str:
+    """Retorna o texto atual da área de transferência (vazio se não houver texto)."""
+    return ler_texto()
+
+
+def _aguardar(condicao: Callable[[str], bool], timeout: float) -> Any:
+    """
+    Função interna: consulta a área de transferência até `condicao(conteudo)` ser verdadeira.
+
+    Returns:
+        O conteúdo que satisfez a condição, ou None se o tempo esgotar.
+    """
+    limite = time.perf_counter() + timeout
+    while True:
+        conteudo = ler_area_transferencia()
+        if condicao(conteudo):
+            return conteudo
+        if time.perf_counter() >= limite:
+            return None
+        time.sleep(INTERVALO_CONSULTA)
+
+
+def copiar_por(acao_copiar: Callable[[], Any], timeout: float = None) -> str:
+    """
+    Executa uma ação de cópia (ex: clique + Ctrl+C) e devolve o texto copiado assim que ele chega.
+
+    Args:
+        acao_copiar (Callable): A ação que copia para a área de transferência.
+        timeout (float, optional): Tempo máximo de espera pela cópia (padrão: `CLIPBOARD_TIMEOUT`).
+
+    Returns:
+        str: O texto copiado, ou vazio se nada chegou à área de transferência no tempo (ex: campo vazio).
+        Nesse caso o marcador é retirado: volta o texto anterior (ou a área de transferência fica vazia).
+    """
+    if entrada_simulada():
+        acao_copiar()
+        return ""
+
+    # 1. Marcador único: qualquer cópia (mesmo de um texto igual ao anterior) é detectada.
+    anterior = ler_area_transferencia()
+    marcador = f"<copia-pendente-{uuid.uuid4().hex}>"
+    escrever_texto(marcador)
+
+    # 2. Copia e espera o conteúdo mudar.
+    acao_copiar()
+    copiado = _aguardar(lambda conteudo: conteudo != marcador, timeout if timeout is not None else TIMEOUT_AREA_TRANSFERENCIA)
+
+    # 3. Nada chegou: o marcador não fica na área de transferência do usuário.
+    if copiado is None:
+        escrever_texto(anterior)
+        return ""
+    return copiado
+
+
+def colar_por(texto: str, acao_colar: Callable[[], Any], timeout: float = None):
+    """
+    Põe o texto na área de transferência, confirma que ele já está lá e executa a ação de colar.
+
+    Raises:
+        RuntimeError: Se o texto não chegar à área de transferência no tempo.
+    """
+    if entrada_simulada():
+        acao_colar()
+        return
+
+    texto = str(texto)
+    escrever_texto(texto)
+    if _aguardar(lambda conteudo: conteudo == texto, timeout if timeout is not None else TIMEOUT_AREA_TRANSFERENCIA) is None:
+        raise RuntimeError("O texto a colar não chegou à área de transferência.")
+    acao_colar()
+
+
+@contextmanager
+def preservar_area_transferencia():
+    """
+    Guarda o texto que o usuário tinha na área de transferência e devolve-o no fim do bloco.
+
+    O bloco deve incluir a confirmação da colagem (Tab/Enter) para o SAP já ter lido o conteúdo
+    colado quando o texto do usuário volta. Se a área de transferência não tinha texto (ex: uma
+    imagem), nada é reposto, para não a apagar.
+    """
+    anterior = "" if entrada_simulada() else ler_area_transferencia()
+    try:
+        yield
+    finally:
+        if anterior:
+            try:
+                escrever_texto(anterior)
+            except Exception:
+                pass
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar as transações com a área de transferência (sem o SAP).
+    Execute a partir da raiz: python -m funcoes.area_transferencia
+    """
+    print(">>> Iniciando teste da área de transferência...")
+
+    escrever_texto("conteúdo do usuário")
+    with preservar_area_transferencia():
+        inicio = time.perf_counter()
+        copiado = copiar_por(lambda: escrever_texto("12.345.678/0001-90"))
+        print(f"--- Copiado: '{copiado}' em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+        assert copiado == "12.345.678/0001-90", "Teste 1 Falhou"
+
+        copiado = copiar_por(lambda: None, timeout=0.1)
+        print(f"--- Nada copiado: '{copiado}' (Esperado: vazio)")
+        assert copiado == "", "Teste 2 Falhou"
+
+    print(f"--- Restaurado: '{ler_area_transferencia()}'")
+    assert ler_area_transferencia() == "conteúdo do usuário", "Teste 3 Falhou"
+
+    copiar_por(lambda: None, timeout=0.1)
+    print(f"--- Depois de uma cópia sem resultado (fora do bloco): '{ler_area_transferencia()}'")
+    assert ler_area_transferencia() == "conteúdo do usuário", "Teste 4 Falhou"
+
+    print("\n--- Teste concluído com SUCESSO! ---")
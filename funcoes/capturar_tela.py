@@ -0,0 +1,137 @@
+# funcoes/capturar_tela.py
+
+"""
+Módulo para capturar a tela (ou uma região dela) como array do OpenCV.
+
+A fonte das capturas é configurável: a tela real (padrão) ou uma gravação de
+quadros PNG (`uteis.reproducao_tela`), para rodar a visão sem monitor.
+"""
+
+import numpy as np
+import cv2
+import pyautogui
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Tuple
+from configuracoes.carregar_config import FONTE_TELA
+from uteis import reproducao_tela
+
+# Fonte padrão da configuração já aplicada (feito na primeira captura).
+_FONTE_INICIALIZADA = False
+
+
+def definir_fonte_tela(fonte: str):
+    """
+    Troca a fonte das capturas de tela.
+
+    Args:
+        fonte (str): "ao_vivo" para a tela real, ou o caminho de uma pasta/.zip com quadros PNG gravados.
+
+    Raises:
+        FileNotFoundError: Se a gravação indicada não existir ou não tiver quadros PNG.
+    """
+    global _FONTE_INICIALIZADA
+    _FONTE_INICIALIZADA = True
+    if not fonte or fonte.lower() == "ao_vivo":
+        reproducao_tela.descarregar_gravacao()
+    else:
+        reproducao_tela.carregar_gravacao(fonte)
+
+
+def _garantir_fonte_inicializada():
+    """Função interna: aplica a fonte configurada em `SCREEN_SOURCE` na primeira captura."""
+    if not _FONTE_INICIALIZADA:
+        definir_fonte_tela(FONTE_TELA)
+
+
+def capturar_tela(regiao: Tuple[int, int, int, int] = None) -> np.ndarray:
+    """
+    Captura a tela inteira (ou uma região) e retorna a imagem no formato BGR do OpenCV.
+
+    O formato BGR é o mesmo usado pelos templates do registro de âncoras, permitindo
+    comparar diretamente vários templates contra o mesmo quadro capturado.
+
+    Args:
+        regiao (Tuple[int, int, int, int], optional): Região (left, top, largura, altura)
+                                                      a capturar. Se omitida, captura a tela inteira.
+
+    Returns:
+        np.ndarray: A imagem capturada em BGR (altura x largura x 3).
+
+    Raises:
+        RuntimeError: Se ocorrer falha ao capturar a tela com o PyAutoGUI.
+    """
+    # 0. Com uma gravação carregada, devolve o quadro gravado em vez da tela real.
+    _garantir_fonte_inicializada()
+    if reproducao_tela.gravacao_ativa():
+        return reproducao_tela.capturar_quadro(regiao)
+
+    # 1. Captura a tela (ou região) com o PyAutoGUI (retorna uma imagem PIL em RGB).
+    try:
+        imagem_pil = pyautogui.screenshot(region=regiao)
+
+    # 2. Captura exceções do PyAutoGUI e relança como RuntimeError com mensagem clara.
+    except Exception as e:
+        raise RuntimeError(f"Falha ao capturar a tela (região: {regiao}): {e}")
+
+    # 3. Converte RGB -> BGR para ficar no mesmo formato dos templates do OpenCV.
+    return cv2.cvtColor(np.asarray(imagem_pil), cv2.COLOR_RGB2BGR)
+
+#=========================================================================================================
+
+def obter_tamanho_tela() -> Tuple[int, int]:
+    """
+    Retorna o tamanho (largura, altura) da tela principal, usado para limitar regiões de captura.
+
+    Returns:
+        Tuple[int, int]: Largura e altura da tela em pixels.
+    """
+    _garantir_fonte_inicializada()
+    if reproducao_tela.gravacao_ativa():
+        return reproducao_tela.obter_tamanho_quadro()
+    tamanho = pyautogui.size()
+    return tamanho.width, tamanho.height
+
+#=========================================================================================================
+
+def gravar_tela(pasta: str) -> Path:
+    """
+    Guarda a captura atual da tela como PNG numa pasta (para montar gravações reprodutíveis).
+
+    Args:
+        pasta (str): A pasta de destino (criada se não existir).
+
+    Returns:
+        Path: O caminho do PNG gravado (nome com data/hora, para manter a ordem).
+    """
+    destino = Path(pasta)
+    destino.mkdir(parents=True, exist_ok=True)
+    caminho = destino / f"tela_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.png"
+    sucesso, buffer = cv2.imencode(".png", capturar_tela())
+    if not sucesso:
+        raise RuntimeError(f"Falha ao codificar a captura em PNG: {caminho}")
+    buffer.tofile(str(caminho))
+    return caminho
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar a função 'capturar_tela' de forma isolada.
+    Execute-o a partir da raiz do projeto com: python -m funcoes.capturar_tela
+    """
+    print(">>> Iniciando teste da função 'capturar_tela'...")
+
+    try:
+        inicio = time.perf_counter()
+        quadro = capturar_tela()
+        print(f"--- Tela inteira capturada: {quadro.shape} em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+        inicio = time.perf_counter()
+        quadro_regiao = capturar_tela(regiao=(0, 0, 400, 300))
+        print(f"--- Região capturada: {quadro_regiao.shape} em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+        print("--- Teste concluído com SUCESSO!")
+
+    except Exception as e:
+        print(f"--- Teste FALHOU! Erro: {e}")
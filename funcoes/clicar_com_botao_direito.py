@@ -2,11 +2,11 @@
 
 """Módulo para a ação de clicar com o botão direito do mouse."""
 
-import pyautogui
 import time
 
 # Importa nossa função de base para encontrar a âncora e seus dados.
-from .localizar_elemento import localizar_elemento
+from .localizar_elemento import localizar_elemento, escalar_ajuste
+from .comandos_entrada import clicar_direito
 
 
 def clicar_com_botao_direito(nome_chave: str, ajuste_x_override: int = None, ajuste_y_override: int = None):
@@ -46,13 +46,14 @@ def clicar_com_botao_direito(nome_chave: str, ajuste_x_override: int = None, aju
         ajuste_y_final = int(dados_elemento.get("ajuste_y") or 0)
 
     # 4. Calcula a posição final do alvo.
-    x_alvo = posicao_ancora.x + ajuste_x_final
-    y_alvo = posicao_ancora.y + ajuste_y_final
+    #    (Os ajustes estão na escala dos templates e acompanham a escala da tela.)
+    x_alvo = posicao_ancora.x + escalar_ajuste(ajuste_x_final)
+    y_alvo = posicao_ancora.y + escalar_ajuste(ajuste_y_final)
 
     # 5. Tenta executar a ação no alvo final.
     try:
-        # AQUI ESTÁ A DIFERENÇA: Usa pyautogui.rightClick()
-        pyautogui.rightClick(x_alvo, y_alvo)
+        # AQUI ESTÁ A DIFERENÇA: Usa clicar_direito() (botão direito)
+        clicar_direito(x_alvo, y_alvo)
     except Exception as e:
         raise RuntimeError(f"Falha ao tentar clicar com botão direito no elemento '{nome_chave}': {e}")
 
@@ -2,14 +2,15 @@
 
 """Módulo para a ação de clicar em um elemento com lógica de ajuste inteligente."""
 
-import pyautogui
 import time
 
 # Importa nossa função de base para encontrar a âncora e seus dados.
-from .localizar_elemento import localizar_elemento
+from .localizar_elemento import localizar_elemento, escalar_ajuste
+from .aguardar_tela_estavel import aguardar_tela_estavel, capturar_referencia
+from .comandos_entrada import clicar
 
 
-def clicar_elemento(nome_chave: str, ajuste_x_override: int = None, ajuste_y_override: int = None):
+def clicar_elemento(nome_chave: str, ajuste_x_override: int = None, ajuste_y_override: int = None, aguardar_tela: bool = False):
     """
     Clica em um elemento, aplicando uma lógica de ajuste flexível.
 
@@ -25,6 +26,8 @@ def clicar_elemento(nome_chave: str, ajuste_x_override: int = None, ajuste_y_ove
                                            qualquer valor do JSON.
         ajuste_y_override (int, optional): Um deslocamento Y que sobrescreve
                                            qualquer valor do JSON.
+        aguardar_tela (bool, optional): Se True, depois do clique espera a tela
+                                        mudar e estabilizar (em vez de uma pausa fixa).
 
     Raises:
         Exception: Levanta qualquer exceção vinda da localização do elemento
@@ -47,15 +50,21 @@ def clicar_elemento(nome_chave: str, ajuste_x_override: int = None, ajuste_y_ove
         ajuste_y_final = int(dados_elemento.get("ajuste_y") or 0)
 
     # 4. Calcula a posição final do alvo.
-    x_alvo = posicao_ancora.x + ajuste_x_final
-    y_alvo = posicao_ancora.y + ajuste_y_final
+    #    (Os ajustes estão na escala dos templates e acompanham a escala da tela.)
+    x_alvo = posicao_ancora.x + escalar_ajuste(ajuste_x_final)
+    y_alvo = posicao_ancora.y + escalar_ajuste(ajuste_y_final)
 
-    # 5. Tenta executar a ação no alvo final.
+    # 5. Tenta executar a ação no alvo final (com a tela de antes guardada, se for esperar por ela).
+    referencia = capturar_referencia() if aguardar_tela else None
     try:
-        pyautogui.click(x_alvo, y_alvo)
+        clicar(x_alvo, y_alvo)
     except Exception as e:
         raise RuntimeError(f"Falha ao tentar clicar no elemento '{nome_chave}': {e}")
 
+    # 6. Se pedido, espera a interface reagir ao clique e parar de mudar.
+    if aguardar_tela:
+        aguardar_tela_estavel(referencia=referencia)
+
 
 # --- Camada de Teste Direto ---
 if __name__ == '__main__':
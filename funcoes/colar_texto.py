@@ -2,12 +2,13 @@
 
 """Módulo para a ação de colar texto com lógica de ajuste inteligente."""
 
-import pyautogui
-import pyperclip
 import time
 
 # Importa nossa função de base para encontrar a âncora e seus dados.
-from .localizar_elemento import localizar_elemento
+from .localizar_elemento import localizar_elemento, escalar_ajuste
+from uteis.ritmo import pausar
+from .comandos_entrada import clicar, pressionar, atalho
+from .area_transferencia import colar_por, preservar_area_transferencia
 
 
 def colar_texto(nome_chave: str, texto_a_colar: str, ajuste_x_override: int = None, ajuste_y_override: int = None):
@@ -48,21 +49,22 @@ def colar_texto(nome_chave: str, texto_a_colar: str, ajuste_x_override: int = No
         ajuste_y_final = int(dados_elemento.get("ajuste_y") or 0)
 
     # 4. Calcula a posição final do alvo.
-    x_alvo = posicao_ancora.x + ajuste_x_final
-    y_alvo = posicao_ancora.y + ajuste_y_final
+    #    (Os ajustes estão na escala dos templates e acompanham a escala da tela.)
+    x_alvo = posicao_ancora.x + escalar_ajuste(ajuste_x_final)
+    y_alvo = posicao_ancora.y + escalar_ajuste(ajuste_y_final)
 
-    # 5. Tenta executar a ação no alvo final.
+    # 5. Tenta executar a ação no alvo final (a área de transferência do usuário volta no fim).
     try:
-        pyautogui.click(x_alvo, y_alvo)
-        time.sleep(0.5)
-        # Limpa o campo antes de colar
-        pyautogui.press('backspace')
-
-        # Ação de colar
-        pyperclip.copy(str(texto_a_colar))
-        pyautogui.hotkey('ctrl', 'v')
-        time.sleep(0.5)
-        pyautogui.press('tab') # Pressiona Tab para confirmar a entrada.
+        with preservar_area_transferencia():
+            clicar(x_alvo, y_alvo)
+            pausar("foco_campo")
+            # Limpa o campo antes de colar
+            pressionar('backspace')
+
+            # Ação de colar (só depois de o texto estar na área de transferência)
+            colar_por(texto_a_colar, lambda: atalho('ctrl', 'v'))
+            pausar("confirmar_entrada")
+            pressionar('tab') # Pressiona Tab para confirmar a entrada.
     except Exception as e:
         raise RuntimeError(f"Falha ao tentar colar no elemento '{nome_chave}': {e}")
 
@@ -0,0 +1,84 @@
+# funcoes/comandos_entrada.py
+
+"""
+Módulo dos comandos de entrada (mouse e teclado) usados por todas as `funcoes/`.
+
+O backend é configurável (`INPUT_BACKEND`): o PyAutoGUI (padrão, executa as ações no
+sistema operativo) ou o caminho de um ficheiro `.jsonl`, onde cada ação pretendida é
+gravada com a hora e as coordenadas, sem tocar no mouse nem no teclado
+(`uteis.rastro_entrada`).
+"""
+
+import pyautogui
+from configuracoes.carregar_config import BACKEND_ENTRADA
+from uteis import rastro_entrada
+
+# Backend padrão da configuração já aplicado (feito no primeiro comando).
+_BACKEND_INICIALIZADO = False
+
+
+def definir_backend_entrada(backend: str):
+    """
+    Troca o backend dos comandos de entrada.
+
+    Args:
+        backend (str): "pyautogui" para executar as ações, ou o caminho de um `.jsonl` para só as gravar.
+    """
+    global _BACKEND_INICIALIZADO
+    _BACKEND_INICIALIZADO = True
+    if not backend or backend.lower() == "pyautogui":
+        rastro_entrada.encerrar_rastro()
+    else:
+        rastro_entrada.iniciar_rastro(backend)
+
+
+def entrada_simulada() -> bool:
+    """
+    Indica se as ações estão só a ser gravadas (nada chega ao SAP, não há o que ler de volta).
+    Aplica o backend de `INPUT_BACKEND` na primeira chamada.
+    """
+    if not _BACKEND_INICIALIZADO:
+        definir_backend_entrada(BACKEND_ENTRADA)
+    return rastro_entrada.rastro_ativo()
+
+
+def clicar(x: int, y: int):
+    """Clique com o botão esquerdo em (x, y)."""
+    if entrada_simulada():
+        return rastro_entrada.registrar_acao("clique", x=int(x), y=int(y))
+    pyautogui.click(x, y)
+
+
+def clicar_direito(x: int, y: int):
+    """Clique com o botão direito em (x, y)."""
+    if entrada_simulada():
+        return rastro_entrada.registrar_acao("clique_direito", x=int(x), y=int(y))
+    pyautogui.rightClick(x, y)
+
+
+def pressionar(tecla: str):
+    """Pressiona uma única tecla (ex: 'tab', 'enter', 't')."""
+    if entrada_simulada():
+        return rastro_entrada.registrar_acao("tecla", tecla=tecla)
+    pyautogui.press(tecla)
+
+
+def atalho(*teclas: str):
+    """Pressiona uma combinação de teclas em simultâneo (ex: 'ctrl', 'v')."""
+    if entrada_simulada():
+        return rastro_entrada.registrar_acao("atalho", teclas=list(teclas))
+    pyautogui.hotkey(*teclas)
+
+
+def escrever(texto: str, intervalo: float = 0.0):
+    """Escreve um texto tecla a tecla, com `intervalo` segundos entre teclas."""
+    if entrada_simulada():
+        return rastro_entrada.registrar_acao("escrever", texto=str(texto), intervalo=intervalo)
+    pyautogui.write(str(texto), interval=intervalo)
+
+
+def rolar(cliques: int):
+    """Rola a roda do mouse (positivo = para cima, negativo = para baixo)."""
+    if entrada_simulada():
+        return rastro_entrada.registrar_acao("rolar", cliques=int(cliques))
+    pyautogui.scroll(cliques)
@@ -2,18 +2,20 @@
 
 """Módulo para a ação de clicar em um elemento e copiar seu conteúdo."""
 
-import pyautogui
-import pyperclip
 import time
 
 # Importa nossa função de base para encontrar a âncora e seus dados.
-from .localizar_elemento import localizar_elemento
+from .localizar_elemento import localizar_elemento, escalar_ajuste
+from uteis.ritmo import pausar
+from .comandos_entrada import clicar, atalho
+from .area_transferencia import copiar_por, preservar_area_transferencia
 
 
 def copiar_texto_elemento(
     nome_chave: str,
     ajuste_x_override: int = None,
-    ajuste_y_override: int = None
+    ajuste_y_override: int = None,
+    timeout: float = None
 ) -> str:
     """
     Clica em um elemento na tela e copia seu conteúdo para a área de transferência.
@@ -26,13 +28,14 @@ def copiar_texto_elemento(
         nome_chave (str): Chave do elemento no arquivo `parametros.json` usada como âncora.
         ajuste_x_override (int, optional): Deslocamento em X que sobrescreve o valor do JSON.
         ajuste_y_override (int, optional): Deslocamento em Y que sobrescreve o valor do JSON.
+        timeout (float, optional): Espera máxima pela cópia (padrão: `CLIPBOARD_TIMEOUT`). Use um valor
+            curto quando o campo puder estar vazio, pois um campo vazio só devolve vazio ao esgotá-lo.
 
     Returns:
         str: Texto copiado da área de transferência. Retorna uma string vazia se o campo estiver vazio.
 
     Raises:
         RuntimeError: Se ocorrer falha ao localizar o elemento, clicar ou copiar o texto.
-        ValueError: Se houver erro ao acessar o conteúdo da área de transferência.
     """
     # 1. Localiza a âncora na tela e obtém seus dados do JSON via `localizar_elemento`.  
     posicao_ancora, dados_elemento = localizar_elemento(nome_chave)
@@ -50,33 +53,26 @@ def copiar_texto_elemento(
         ajuste_y_final = int(dados_elemento.get("ajuste_y") or 0)
 
     # 4. Calcula a posição final do clique com base na âncora e nos ajustes determinados.
-    x_alvo = posicao_ancora.x + ajuste_x_final
-    y_alvo = posicao_ancora.y + ajuste_y_final
-
-    # 5. Limpa a área de transferência com `pyperclip.copy('')` antes de qualquer ação.  
+    #    (Os ajustes estão na escala dos templates e acompanham a escala da tela.)
+    x_alvo = posicao_ancora.x + escalar_ajuste(ajuste_x_final)
+    y_alvo = posicao_ancora.y + escalar_ajuste(ajuste_y_final)
+
+    # 5. Clica no campo para focar e selecionar o conteúdo (comportamento SAP) e copia com Ctrl+C.
+    def copiar():
+        clicar(x_alvo, y_alvo)
+        pausar("copiar_campo")
+        atalho('ctrl', 'c') # Copia o texto selecionado
+
+    # 6. Lê o texto assim que ele chega à área de transferência (vazio se o campo estiver vazio),
+    #    devolvendo no fim o que o usuário tinha copiado.
     try:
-        pyperclip.copy('')
-        time.sleep(0.1)
-
-    # 6. Clica no campo para focar e selecionar o conteúdo (comportamento SAP).
-        pyautogui.click(x_alvo, y_alvo)
-        time.sleep(0.3)
-
-    # 7. Executa Ctrl+C para copiar o texto selecionado.
-        pyautogui.hotkey('ctrl', 'c') # Copia o texto selecionado
-        time.sleep(0.3)
-    
-    # 8. Lê o conteúdo do clipboard com `pyperclip.paste()`.
-        texto_copiado = pyperclip.paste()
-
-    # 9. Levanta erro se o clipboard estiver vazio ou inacessível.  
-        if texto_copiado is None:
-             raise ValueError("Falha ao ler o conteúdo da área de transferência após a cópia.")
+        with preservar_area_transferencia():
+            texto_copiado = copiar_por(copiar, timeout)
 
-    # 10. Retorna o texto copiado, removendo espaços extras. 
-        return str(texto_copiado).strip()
+    # 7. Retorna o texto copiado, removendo espaços extras. 
+        return texto_copiado.strip()
     
-    # 11. Captura exceções e relança como `RuntimeError` com contexto.  
+    # 8. Captura exceções e relança como `RuntimeError` com contexto.  
     except Exception as e:
         raise RuntimeError(f"Falha ao tentar copiar texto do elemento '{nome_chave}': {e}")
 
@@ -2,11 +2,15 @@
 
 """Módulo para a ação de digitar texto com lógica de ajuste inteligente."""
 
-import pyautogui
 import time
 
 # Importa nossa função de base para encontrar a âncora e seus dados.
-from .localizar_elemento import localizar_elemento
+from .localizar_elemento import localizar_elemento, escalar_ajuste
+from .entrada_texto import resolver_estrategia, inserir_texto, campo_contem, selecionar_conteudo
+from configuracoes.carregar_config import VERIFICAR_ENTRADA_TEXTO
+from uteis.ritmo import pausar
+from .comandos_entrada import clicar, pressionar, entrada_simulada
+from .area_transferencia import preservar_area_transferencia
 
 
 def digitar_texto(nome_chave: str, texto_a_digitar: str, ajuste_x_override: int = None, ajuste_y_override: int = None):
@@ -14,8 +18,10 @@ def digitar_texto(nome_chave: str, texto_a_digitar: str, ajuste_x_override: int
     Digita um texto em um campo na tela utilizando uma âncora e lógica de ajuste inteligente.
 
     A função localiza a âncora definida no arquivo `parametros.json`, calcula a posição exata
-    onde o texto deve ser inserido aplicando ajustes em X e Y, e executa a digitação por meio
-    do PyAutoGUI. Os ajustes são determinados com a seguinte prioridade:
+    onde o texto deve ser inserido aplicando ajustes em X e Y, e escreve o texto com a
+    estratégia de entrada do campo (propriedade `"entrada"` da âncora: "colar", o padrão, ou
+    "digitar"). Depois confere se o campo ficou com o valor esperado; se a colagem não pegou,
+    tenta digitar. Os ajustes são determinados com a seguinte prioridade:
 
     1. O ajuste de override passado diretamente à função.
     2. O ajuste padrão definido no `parametros.json`.
@@ -28,7 +34,8 @@ def digitar_texto(nome_chave: str, texto_a_digitar: str, ajuste_x_override: int
         ajuste_y_override (int, optional): Deslocamento em Y que sobrescreve o valor do JSON.
 
     Raises:
-        RuntimeError: Se ocorrer falha ao localizar o elemento ou ao executar a digitação.
+        RuntimeError: Se ocorrer falha ao localizar o elemento, ao executar a digitação
+                      ou se o campo não ficar com o valor esperado.
     """
     # 1. Encontra a âncora e seus dados. Se falhar, levanta uma exceção.
     posicao_ancora, dados_elemento = localizar_elemento(nome_chave)
@@ -46,16 +53,35 @@ def digitar_texto(nome_chave: str, texto_a_digitar: str, ajuste_x_override: int
         ajuste_y_final = int(dados_elemento.get("ajuste_y") or 0)
 
     # 4. Calcula a posição final do alvo.
-    x_alvo = posicao_ancora.x + ajuste_x_final
-    y_alvo = posicao_ancora.y + ajuste_y_final
+    #    (Os ajustes estão na escala dos templates e acompanham a escala da tela.)
+    x_alvo = posicao_ancora.x + escalar_ajuste(ajuste_x_final)
+    y_alvo = posicao_ancora.y + escalar_ajuste(ajuste_y_final)
 
-    # 5. Tenta executar a ação no alvo final.
+    # 5. Decide a estratégia de entrada e se o valor será conferido.
+    estrategia = resolver_estrategia(nome_chave, dados_elemento, "colar")
+    #    (Com as ações só gravadas num rastro, não há valor no campo para conferir.)
+    verificar = VERIFICAR_ENTRADA_TEXTO and dados_elemento.get("verificar", True) is not False and not entrada_simulada()
+
+    # 6. Tenta executar a ação no alvo final (a área de transferência do usuário volta no fim).
     try:
-        pyautogui.click(x_alvo, y_alvo)
-        time.sleep(0.5)
-        pyautogui.write(str(texto_a_digitar), interval=0.05)
-        time.sleep(0.5)
-        pyautogui.press('tab') # Pressiona Tab para confirmar a entrada.
+        with preservar_area_transferencia():
+            clicar(x_alvo, y_alvo)
+            pausar("foco_campo")
+            selecionar_conteudo() # Numa retentativa o campo já tem o foco e o clique não seleciona nada.
+            inserir_texto(texto_a_digitar, estrategia)
+            pausar("confirmar_entrada")
+
+            # 7. Confere o campo. Se a colagem não pegou, seleciona o conteúdo e digita por cima.
+            if verificar and not campo_contem(x_alvo, y_alvo, texto_a_digitar):
+                if estrategia != "colar":
+                    raise ValueError(f"o campo não ficou com o valor '{texto_a_digitar}'")
+                selecionar_conteudo()
+                inserir_texto(texto_a_digitar, "digitar")
+                pausar("confirmar_entrada")
+                if not campo_contem(x_alvo, y_alvo, texto_a_digitar):
+                    raise ValueError(f"o campo não ficou com o valor '{texto_a_digitar}' (nem colando nem digitando)")
+
+            pressionar('tab') # Pressiona Tab para confirmar a entrada.
     except Exception as e:
         raise RuntimeError(f"Falha ao tentar digitar no elemento '{nome_chave}': {e}")
 
@@ -0,0 +1,101 @@
+# funcoes/entrada_texto.py
+
+"""
+Módulo das estratégias de entrada de texto num campo já focado.
+
+- "colar": copia o texto para a área de transferência e cola-o com Ctrl+V (uma só ação,
+  qualquer que seja o tamanho do texto).
+- "digitar": escreve o texto tecla a tecla. Necessário onde o SAP reage às teclas
+  (a pesquisa por digitação dos dropdowns, atalhos como "H" nos campos de data).
+
+Cada âncora pode declarar a estratégia que o campo suporta com a propriedade `"entrada"`
+no `parametros.json`; sem ela, vale o padrão da função que escreve no campo.
+"""
+
+from typing import Dict, Any
+from uteis.ritmo import pausar
+from .comandos_entrada import clicar, pressionar, atalho, escrever
+from .area_transferencia import copiar_por, colar_por
+
+ESTRATEGIAS_ENTRADA = ("colar", "digitar")
+INTERVALO_DIGITACAO = 0.05  # Segundos entre teclas na estratégia "digitar".
+
+
+def resolver_estrategia(nome_chave: str, dados_elemento: Dict[str, Any], padrao: str) -> str:
+    """
+    Decide a estratégia de entrada do campo: a propriedade `"entrada"` da âncora ou o padrão.
+
+    Raises:
+        ValueError: Se a âncora declarar uma estratégia desconhecida.
+    """
+    estrategia = str(dados_elemento.get("entrada") or padrao).strip().lower()
+    if estrategia not in ESTRATEGIAS_ENTRADA:
+        raise ValueError(f"Estratégia de entrada '{estrategia}' inválida para '{nome_chave}'. Estratégias válidas: {ESTRATEGIAS_ENTRADA}")
+    return estrategia
+
+
+def inserir_texto(texto: str, estrategia: str):
+    """Escreve o texto no campo focado (com o conteúdo já selecionado) usando a estratégia indicada."""
+    if estrategia == "colar":
+        colar_por(texto, lambda: atalho('ctrl', 'v'))
+    else:
+        escrever(texto, INTERVALO_DIGITACAO)
+
+
+def selecionar_conteudo():
+    """
+    Seleciona todo o conteúdo do campo focado (Home e Shift+End).
+
+    Um clique num campo que já tem o foco só move o cursor, sem selecionar nada; a seleção
+    tem de ser explícita antes de copiar ou de escrever por cima.
+    """
+    pressionar('home')
+    atalho('shift', 'end')
+
+
+def ler_campo(x: int, y: int) -> str:
+    """
+    Lê o conteúdo atual de um campo: clica nele, seleciona o conteúdo e copia-o com Ctrl+C.
+    O conteúdo fica selecionado (a escrita seguinte substitui-o).
+
+    Returns:
+        str: O texto do campo, sem espaços nas pontas (vazio se o campo estiver vazio).
+    """
+    def copiar():
+        clicar(x, y)
+        pausar("leitura_campo")
+        selecionar_conteudo()
+        atalho('ctrl', 'c')
+
+    return copiar_por(copiar).strip()
+
+
+def _normalizar(texto: str) -> str:
+    """Função interna: compara textos sem espaços nem diferenças de maiúsculas."""
+    return "".join(str(texto).split()).casefold()
+
+
+def campo_contem(x: int, y: int, texto_esperado: str) -> bool:
+    """Verifica se o campo em (x, y) contém o texto esperado (ignorando espaços e maiúsculas)."""
+    return _normalizar(ler_campo(x, y)) == _normalizar(texto_esperado)
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar a resolução de estratégias (não escreve nada na tela).
+    Execute a partir da raiz: python -m funcoes.entrada_texto
+    """
+    print(">>> Iniciando teste das estratégias de entrada...")
+
+    estrategia = resolver_estrategia("teste", {"entrada": "Digitar"}, "colar")
+    print(f"--- Propriedade da âncora: {estrategia} (Esperado: digitar)")
+    assert estrategia == "digitar", "Teste 1 Falhou"
+
+    estrategia = resolver_estrategia("teste", {"ajuste_x": ""}, "colar")
+    print(f"--- Sem propriedade: {estrategia} (Esperado: colar)")
+    assert estrategia == "colar", "Teste 2 Falhou"
+
+    assert _normalizar(" 123 456 ") == _normalizar("123456"), "Teste 3 Falhou"
+
+    print("\n--- Teste concluído com SUCESSO! ---")
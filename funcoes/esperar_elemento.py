@@ -0,0 +1,116 @@
+# funcoes/esperar_elemento.py
+
+"""
+Módulo para esperar que um elemento apareça (ou desapareça) da tela.
+
+Em vez de uma pausa fixa depois de cada ação, a tela é consultada em intervalos
+curtos que crescem aos poucos (backoff) até o elemento aparecer, e a espera
+termina assim que o SAP estiver pronto. O tempo real de cada espera fica registado.
+"""
+
+import time
+import threading
+import pyautogui
+from typing import Tuple, Dict, Any, Optional, List
+from configuracoes.carregar_config import TIMEOUT_ESPERA_ELEMENTO
+
+# Importa nossa função de base para encontrar a âncora e seus dados.
+from .localizar_elemento import localizar_elemento
+
+# --- Registo das Esperas (chave -> tempos reais de espera, em segundos) ---
+_TEMPOS_ESPERA: Dict[str, List[float]] = {}
+_TRAVA_ESPERA = threading.Lock()
+
+
+def _registrar_espera(nome_chave: str, duracao: float):
+    """Função interna: guarda quanto tempo a espera de uma chave realmente levou."""
+    with _TRAVA_ESPERA:
+        _TEMPOS_ESPERA.setdefault(nome_chave, []).append(duracao)
+
+
+def esperar_elemento(nome_chave: str, timeout: float = None, intervalo: float = 0.1,
+                     intervalo_maximo: float = 1.0, desaparecer: bool = False,
+                     confianca_override: float = None) -> Optional[Tuple[pyautogui.Point, Dict[str, Any]]]:
+    """
+    Espera um elemento aparecer na tela (ou desaparecer dela) consultando-a com backoff.
+
+    Args:
+        nome_chave (str): A chave do elemento no JSON a ser usado como âncora.
+        timeout (float, optional): Tempo máximo de espera em segundos.
+                                   Padrão: `TIMEOUT_ESPERA_ELEMENTO` da configuração.
+        intervalo (float, optional): Pausa inicial entre consultas (cresce 50% a cada consulta).
+        intervalo_maximo (float, optional): Limite da pausa entre consultas.
+        desaparecer (bool, optional): Se True, espera o elemento SAIR da tela.
+        confianca_override (float, optional): Confiança que substitui o padrão da configuração.
+
+    Returns:
+        Optional[Tuple[pyautogui.Point, Dict[str, Any]]]: A posição e os dados do elemento
+        (o mesmo retorno de `localizar_elemento`), ou None quando `desaparecer=True`.
+
+    Raises:
+        TimeoutError: Se o elemento não aparecer (ou não desaparecer) dentro do `timeout`.
+        Exception: Erros de dados (chave/imagem inexistente) vindos de `localizar_elemento`.
+    """
+    timeout_a_usar = timeout if timeout is not None else TIMEOUT_ESPERA_ELEMENTO
+    inicio = time.perf_counter()
+    limite = inicio + timeout_a_usar
+    pausa = intervalo
+
+    while True:
+        # 1. Consulta a tela (a busca por região + cache deixa cada consulta barata).
+        try:
+            resultado = localizar_elemento(nome_chave, confianca_override)
+        except pyautogui.ImageNotFoundException:
+            resultado = None
+
+        # 2. Condição atingida: regista o tempo real e devolve.
+        if (resultado is not None) != desaparecer:
+            _registrar_espera(nome_chave, time.perf_counter() - inicio)
+            return resultado
+
+        # 3. Tempo esgotado: levanta erro para o Assistente executor tratar.
+        agora = time.perf_counter()
+        if agora >= limite:
+            _registrar_espera(nome_chave, agora - inicio)
+            estado = "desaparecer" if desaparecer else "aparecer"
+            raise TimeoutError(f"Elemento '{nome_chave}' não chegou a {estado} na tela em {timeout_a_usar:.1f}s.")
+
+        # 4. Aguarda (sem passar do limite) e aumenta o intervalo da próxima consulta.
+        time.sleep(min(pausa, limite - agora))
+        pausa = min(pausa * 1.5, intervalo_maximo)
+
+
+def obter_estatisticas_espera() -> Dict[str, Dict[str, float]]:
+    """
+    Retorna, por chave, quantas esperas houve e quanto tempo levaram.
+
+    Returns:
+        Dict[str, Dict[str, float]]: {chave: {"esperas": int, "media": float, "maximo": float}} (segundos).
+    """
+    with _TRAVA_ESPERA:
+        return {
+            chave: {"esperas": len(tempos), "media": sum(tempos) / len(tempos), "maximo": max(tempos)}
+            for chave, tempos in _TEMPOS_ESPERA.items()
+        }
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar a função 'esperar_elemento' de forma isolada.
+    Execute-o a partir da raiz do projeto com: python -m funcoes.esperar_elemento
+    """
+    print(">>> Iniciando teste da função 'esperar_elemento'...")
+    print(">>> Deixe (ou faça aparecer) a imagem alvo na tela nos próximos 10 segundos.")
+
+    try:
+        # --- Exemplo de Teste ---
+        chave_teste = "aba_geral"
+
+        print(f"--- Esperando o elemento '{chave_teste}'...")
+        posicao, _ = esperar_elemento(chave_teste, timeout=10)
+        print(f"--- Teste concluído com SUCESSO! Posição: {posicao}")
+        print(f"--- Estatísticas: {obter_estatisticas_espera()}")
+
+    except Exception as e:
+        print(f"--- Teste FALHOU! Erro: {e}")
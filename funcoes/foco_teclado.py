@@ -0,0 +1,105 @@
+# funcoes/foco_teclado.py
+
+"""
+Módulo das ações no campo com o foco do teclado (sem localizar âncora nem clicar).
+
+Usado pela cadeia de foco (`"foco"` no `parametros.json`): um campo declara de que campo
+vizinho é alcançado e com quantas teclas Tab (negativo = Shift+Tab). Só o primeiro campo
+de uma sequência é localizado na tela; os seguintes são alcançados pelo teclado.
+"""
+
+from typing import Optional, Tuple
+
+from .entrada_texto import resolver_estrategia, inserir_texto
+from .comandos_entrada import pressionar, atalho
+from .area_transferencia import preservar_area_transferencia
+from uteis.registro_ancoras import obter_dados_ancora
+from uteis.ritmo import pausar
+
+
+def obter_ligacao_foco(nome_chave: str) -> Optional[Tuple[str, int]]:
+    """
+    Retorna a ligação de foco declarada na âncora: (chave do campo de origem, teclas Tab).
+
+    Returns:
+        Optional[Tuple[str, int]]: None se a âncora não declarar `"foco"`.
+
+    Raises:
+        ValueError: Se a propriedade `"foco"` estiver mal declarada.
+    """
+    foco = obter_dados_ancora(nome_chave).get("foco")
+    if not foco:
+        return None
+    try:
+        return str(foco["de"]), int(foco["teclas"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Propriedade 'foco' inválida em '{nome_chave}': use {{\"de\": \"<chave>\", \"teclas\": <n>}}.")
+
+
+def mover_foco(teclas: int):
+    """Move o foco do teclado `teclas` campos para a frente (Tab) ou para trás (Shift+Tab, se negativo)."""
+    for _ in range(abs(teclas)):
+        if teclas > 0:
+            pressionar('tab')
+        else:
+            atalho('shift', 'tab')
+
+
+def digitar_no_foco(nome_chave: str, texto_a_digitar: str):
+    """Escreve no campo focado (como `digitar_texto`, sem o clique nem a leitura de volta) e confirma com Tab."""
+    estrategia = resolver_estrategia(nome_chave, obter_dados_ancora(nome_chave), "colar")
+    try:
+        with preservar_area_transferencia():
+            inserir_texto(texto_a_digitar, estrategia)
+            pausar("confirmar_entrada")
+            pressionar('tab') # Pressiona Tab para confirmar a entrada.
+    except Exception as e:
+        raise RuntimeError(f"Falha ao tentar digitar no campo focado '{nome_chave}': {e}")
+
+
+def colar_no_foco(nome_chave: str, texto_a_colar: str):
+    """Cola no campo focado (como `colar_texto`, sem o clique) e confirma com Tab."""
+    try:
+        with preservar_area_transferencia():
+            pressionar('backspace')
+            inserir_texto(texto_a_colar, "colar")
+            pausar("confirmar_entrada")
+            pressionar('tab') # Pressiona Tab para confirmar a entrada.
+    except Exception as e:
+        raise RuntimeError(f"Falha ao tentar colar no campo focado '{nome_chave}': {e}")
+
+
+def selecionar_no_foco(nome_chave: str, valor_a_selecionar: str):
+    """Abre o dropdown focado (Alt+↓), escreve o valor (pesquisa por digitação) e confirma com Enter."""
+    estrategia = resolver_estrategia(nome_chave, obter_dados_ancora(nome_chave), "digitar")
+    try:
+        atalho('alt', 'down')
+        pausar("abrir_dropdown")
+        inserir_texto(valor_a_selecionar, estrategia)
+        pausar("confirmar_entrada")
+        pressionar('enter') # Enter para confirmar a seleção.
+    except Exception as e:
+        raise RuntimeError(f"Falha ao interagir com o dropdown focado '{nome_chave}': {e}")
+
+
+def clicar_no_foco(nome_chave: str):
+    """Aciona o elemento focado (caixa de seleção ou botão) com a barra de espaço."""
+    try:
+        pressionar('space')
+    except Exception as e:
+        raise RuntimeError(f"Falha ao acionar o elemento focado '{nome_chave}': {e}")
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para conferir as ligações de foco declaradas no parametros.json (não executa nada na tela).
+    Execute a partir da raiz: python -m funcoes.foco_teclado
+    """
+    from uteis.registro_ancoras import listar_chaves
+
+    print(">>> Ligações de foco declaradas:")
+    for chave in listar_chaves():
+        ligacao = obter_ligacao_foco(chave)
+        if ligacao:
+            print(f"--- {ligacao[0]} --({ligacao[1]:+d} Tab)--> {chave}")
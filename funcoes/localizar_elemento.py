@@ -4,28 +4,313 @@
 Módulo para a função de mais baixo nível: localizar um elemento na tela.
 """
 
-import json
+import time
 import pyautogui
-from pathlib import Path
-from typing import Tuple, Dict, Any
-from configuracoes.carregar_config import CONFIANCA_PADRAO_IMAGEM
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Dict, Any, List, Optional
+from configuracoes.carregar_config import (
+    CONFIANCA_PADRAO_IMAGEM, MARGEM_BUSCA_REGIAO, PERSISTIR_POSICOES_ANCORAS, MODO_BUSCA_PADRAO, NIVEIS_PIRAMIDE,
+    USAR_CACHE_LOCALIZACAO, THREADS_CORRESPONDENCIA, MOTOR_CORRESPONDENCIA, LIMITE_CACHE_FFT_MB, USAR_LAYOUT_ANCORAS,
+    ESCALA_TELA
+)
+
+# 1. Importa o registro de âncoras (JSON + templates carregados uma única vez por processo).
+from uteis.registro_ancoras import (
+    obter_ancora, obter_template_cinza, obter_piramide_template, obter_espectro_template, obter_template_original,
+    definir_escala, obter_escala, listar_variantes
+)
+from uteis.correspondencia_imagem import (
+    MODOS_BUSCA, buscar_template_paralelo, buscar_template_piramide, buscar_template_fft, converter_para_cinza,
+    construir_piramide, preparar_quadro_fft, escolher_motor, detectar_escala
+)
+from uteis import memoria_posicoes, layout_ancoras, estatisticas_pontuacao
+from uteis.cache_localizacao import calcular_impressao_digital, consultar_cache, guardar_cache, obter_estatisticas_cache, invalidar_cache
+from funcoes.capturar_tela import capturar_tela, obter_tamanho_tela
+
+# Indica se as posições guardadas em temp/ já foram carregadas nesta execução.
+_MEMORIA_CARREGADA = False
+
+# Pool de threads da correspondência (criado na primeira busca, se THREADS_CORRESPONDENCIA > 1).
+_POOL_CORRESPONDENCIA = None
+
+# Escala tela/template: já resolvida nesta sessão? (Se a mestre não estava visível, nova tentativa
+# só depois de INTERVALO_NOVA_DETECCAO segundos, para não repetir a busca multi-escala a cada falha.)
+_ESCALA_RESOLVIDA = False
+_PROXIMA_DETECCAO = 0.0
+INTERVALO_NOVA_DETECCAO = 5.0
+
+
+def _obter_pool() -> Optional[ThreadPoolExecutor]:
+    """Função interna: devolve o pool de threads da correspondência (ou None se o paralelismo estiver desligado)."""
+    global _POOL_CORRESPONDENCIA
+    if THREADS_CORRESPONDENCIA <= 1:
+        return None
+    if _POOL_CORRESPONDENCIA is None:
+        _POOL_CORRESPONDENCIA = ThreadPoolExecutor(max_workers=THREADS_CORRESPONDENCIA, thread_name_prefix="correspondencia")
+    return _POOL_CORRESPONDENCIA
+
+
+def _garantir_escala() -> bool:
+    """
+    Função interna: resolve a escala tela/template uma vez por sessão (fixa pela configuração ou
+    detectada procurando a âncora mestre em várias escalas) e redimensiona os templates no registro.
+
+    Returns:
+        bool: True se a escala dos templates mudou (as buscas feitas na escala antiga devem ser repetidas).
+    """
+    global _ESCALA_RESOLVIDA, _PROXIMA_DETECCAO
+    if _ESCALA_RESOLVIDA or time.perf_counter() < _PROXIMA_DETECCAO:
+        return False
+
+    # 1. Escala fixa na configuração: aplica sem procurar nada.
+    if ESCALA_TELA != "auto":
+        _ESCALA_RESOLVIDA = True
+        return definir_escala(float(ESCALA_TELA))
+
+    # 2. Detecção: procura o template original da mestre (em cinza) na tela inteira, nas escalas candidatas.
+    try:
+        template_mestre = converter_para_cinza(obter_template_original(layout_ancoras.CHAVE_MESTRE))
+    except (KeyError, FileNotFoundError):
+        _ESCALA_RESOLVIDA = True
+        return False
+    escala, _ = detectar_escala(converter_para_cinza(capturar_tela()), template_mestre, CONFIANCA_PADRAO_IMAGEM)
+
+    # 3. A mestre não está visível: continua na escala atual e tenta de novo mais tarde.
+    if escala is None:
+        _PROXIMA_DETECCAO = time.perf_counter() + INTERVALO_NOVA_DETECCAO
+        return False
+
+    # 4. Aplica a escala vencedora; os resultados em cache (calculados na escala antiga) deixam de valer.
+    _ESCALA_RESOLVIDA = True
+    if not definir_escala(escala):
+        return False
+    invalidar_cache()
+    print(f"🔎 Escala da tela detectada: {escala:g}x (templates redimensionados em memória).")
+    return True
+
+
+def escalar_ajuste(ajuste: int) -> int:
+    """
+    Converte um ajuste (deslocamento em pixels medido na escala dos templates, como o "ajuste_x"
+    do JSON ou um override) para a escala atual da tela.
+    """
+    return int(round(ajuste * obter_escala()))
+
+
+def _resolver_modo_busca(nome_chave: str, dados_elemento: Dict[str, Any]) -> str:
+    """
+    Função interna: decide o modo de busca da âncora ("modo_busca" no JSON ou o padrão global).
+
+    Raises:
+        ValueError: Se o modo configurado não for suportado.
+    """
+    modo = str(dados_elemento.get("modo_busca") or MODO_BUSCA_PADRAO).strip().lower()
+    if modo not in MODOS_BUSCA:
+        raise ValueError(f"Modo de busca '{modo}' inválido para a chave '{nome_chave}'. Modos válidos: {MODOS_BUSCA}")
+    return modo
+
+
+def _resolver_confianca(dados_elemento: Dict[str, Any], confianca_override: Optional[float]) -> float:
+    """Função interna: decide a confiança (override, "confianca" da âncora no JSON ou o padrão global)."""
+    if confianca_override is not None:
+        return confianca_override
+    return float(dados_elemento.get("confianca") or CONFIANCA_PADRAO_IMAGEM)
+
+
+def _resolver_motor(tamanho_imagem: Tuple[int, int], template: np.ndarray, pool: Optional[ThreadPoolExecutor] = None) -> str:
+    """Função interna: decide o motor ("espacial" ou "fft") pela configuração ou pelo modelo de custo."""
+    if MOTOR_CORRESPONDENCIA != "auto":
+        return MOTOR_CORRESPONDENCIA
+    canais = template.shape[2] if template.ndim == 3 else 1
+    return escolher_motor(tamanho_imagem, template.shape, canais, THREADS_CORRESPONDENCIA if pool is not None else 1)
+
+
+def _obter_template_modo(nome_chave: str, modo: str) -> np.ndarray:
+    """Função interna: o template em resolução total no formato do modo ("cor" = BGR, senão cinza)."""
+    return obter_ancora(nome_chave)[1] if modo == "cor" else obter_template_cinza(nome_chave)
+
+
+def _preparar_derivados(quadro: np.ndarray, modos: List[str], derivados: Dict[str, Any], modos_fft: List[str] = ()):
+    """
+    Função interna: calcula as versões do quadro (cinza, pirâmide e, para o motor FFT, os espectros
+    do quadro colorido e/ou cinza) que os modos pedidos vão usar.
+    """
+    if "cinza" not in derivados and any(modo != "cor" for modo in list(modos) + list(modos_fft)):
+        derivados["cinza"] = converter_para_cinza(quadro)
+    if "piramide" not in derivados and "piramide" in modos:
+        derivados["piramide"] = construir_piramide(derivados["cinza"], NIVEIS_PIRAMIDE)
+    for modo in modos_fft:
+        if "fft_" + modo not in derivados:
+            derivados["fft_" + modo] = preparar_quadro_fft(quadro if modo == "cor" else derivados["cinza"])
+
+
+def _comparar_no_quadro(quadro: np.ndarray, nome_chave: str, modo: str, confianca: float,
+                        derivados: Dict[str, Any], pool: Optional[ThreadPoolExecutor] = None) -> Tuple[Optional[Tuple[int, int]], float]:
+    """
+    Função interna: compara o template da âncora com um quadro, no modo pedido.
+
+    O dicionário `derivados` guarda as versões do quadro (cinza, pirâmide) já calculadas,
+    para que várias âncoras buscadas no mesmo quadro não repitam a conversão. Com um `pool`,
+    o quadro é dividido em faixas comparadas em paralelo (motor espacial).
+    """
+    _preparar_derivados(quadro, [modo], derivados)
+
+    # 1. Modos "cor" (comportamento original) e "cinza": template em resolução total,
+    #    no motor espacial ou no FFT (o que o modelo de custo indicar como mais barato).
+    if modo in ("cor", "cinza"):
+        imagem = quadro if modo == "cor" else derivados["cinza"]
+        template = _obter_template_modo(nome_chave, modo)
+        if _resolver_motor(imagem.shape, template, pool) == "fft":
+            _preparar_derivados(quadro, [], derivados, [modo])
+            quadro_fft = derivados["fft_" + modo]
+            espectro = obter_espectro_template(nome_chave, modo, quadro_fft["tamanho_fft"], LIMITE_CACHE_FFT_MB)
+            return buscar_template_fft(quadro_fft, espectro, confianca)
+        return buscar_template_paralelo(imagem, template, confianca, pool, THREADS_CORRESPONDENCIA)
+
+    # 2. Modo "piramide": busca grossa no quadro reduzido + refinamento em resolução total.
+    piramide_template = obter_piramide_template(nome_chave, NIVEIS_PIRAMIDE)
+    return buscar_template_piramide(derivados["cinza"], piramide_template, confianca, piramide_tela=derivados["piramide"])
+
+
+def _guardar_resultado(nome_chave: str, quadro: np.ndarray, origem: Tuple[int, int], contexto: Tuple,
+                       centro_tela: Tuple[int, int], pontuacao: float, tamanho_template: Tuple[int, int]):
+    """
+    Função interna: memoriza a posição encontrada e guarda o resultado no cache de localização,
+    com a impressão digital da região de busca que será usada na próxima vez.
+
+    `origem` é o canto (left, top) do `quadro` em coordenadas da tela (0, 0 para a tela inteira).
+    """
+    memoria_posicoes.memorizar_posicao(nome_chave, centro_tela, tamanho_template)
+
+    # A mestre achada vale para a aba atual; as outras âncoras aprendem o deslocamento em relação a ela.
+    if USAR_LAYOUT_ANCORAS:
+        if nome_chave == layout_ancoras.CHAVE_MESTRE:
+            layout_ancoras.registrar_mestre(centro_tela)
+        else:
+            layout_ancoras.aprender_deslocamento(nome_chave, centro_tela)
+
+    if not USAR_CACHE_LOCALIZACAO:
+        return
+
+    # A região da próxima busca só pode ser "impressa" se estiver inteira dentro do quadro capturado.
+    regiao = memoria_posicoes.calcular_regiao_busca(nome_chave, MARGEM_BUSCA_REGIAO, *obter_tamanho_tela())
+    if regiao is None:
+        return
+    left, top = regiao[0] - origem[0], regiao[1] - origem[1]
+    if left < 0 or top < 0 or left + regiao[2] > quadro.shape[1] or top + regiao[3] > quadro.shape[0]:
+        return
+    recorte = quadro[top:top + regiao[3], left:left + regiao[2]]
+    guardar_cache(nome_chave, regiao, calcular_impressao_digital(recorte), contexto, centro_tela, pontuacao)
+
+
+def _garantir_mestre():
+    """
+    Função interna: localiza a âncora mestre uma vez por aba (o resultado, mesmo "não visível",
+    fica registado em `layout_ancoras` até a próxima troca de aba).
+    """
+    if layout_ancoras.mestre_procurado():
+        return
+    try:
+        dados_mestre, template_mestre = obter_ancora(layout_ancoras.CHAVE_MESTRE)
+        modo_mestre = _resolver_modo_busca(layout_ancoras.CHAVE_MESTRE, dados_mestre)
+    except (KeyError, FileNotFoundError):
+        layout_ancoras.registrar_mestre(None)
+        return
+    centro, _ = _buscar_na_tela(layout_ancoras.CHAVE_MESTRE, modo_mestre, template_mestre.shape, _resolver_confianca(dados_mestre, None))
+    layout_ancoras.registrar_mestre(centro)
+
+
+def _buscar_na_tela(nome_chave: str, modo: str, tamanho_template: Tuple[int, int], confianca: float,
+                    varrer_tela: bool = True) -> Tuple[Optional[Tuple[int, int]], float]:
+    """
+    Função interna: verifica primeiro a posição prevista pelo layout (deslocamento em relação à
+    âncora mestre), depois a região da última posição conhecida (ou reaproveita o resultado em
+    cache, se a região não mudou) e só varre a tela inteira se não a encontrar lá.
+
+    Com `varrer_tela=False`, fica pelas verificações baratas (quem chama varre a tela uma só vez
+    para várias âncoras, ex: as variantes de um grupo).
+
+    Returns:
+        Tuple[Optional[Tuple[int, int]], float]: Centro (x, y) em coordenadas da tela (ou None) e a pontuação.
+    """
+    global _MEMORIA_CARREGADA
+
+    # 1. Na primeira busca da execução, carrega as posições guardadas da execução anterior.
+    if not _MEMORIA_CARREGADA:
+        _MEMORIA_CARREGADA = True
+        if PERSISTIR_POSICOES_ANCORAS:
+            memoria_posicoes.carregar_posicoes()
+            layout_ancoras.carregar_layout()
+            estatisticas_pontuacao.carregar_estatisticas()
+
+    # 2. Layout: verificação barata numa janela minúscula na posição prevista a partir da mestre.
+    contexto = (confianca, modo)
+    pontuacao = 0.0
+    if USAR_LAYOUT_ANCORAS and nome_chave != layout_ancoras.CHAVE_MESTRE:
+        _garantir_mestre()
+        regiao_prevista = layout_ancoras.prever_regiao(nome_chave, tamanho_template, *obter_tamanho_tela())
+        if regiao_prevista is not None:
+            quadro_previsto = capturar_tela(regiao_prevista)
+            centro, pontuacao = _comparar_no_quadro(quadro_previsto, nome_chave, modo, confianca, {})
+            layout_ancoras.registrar_resultado_layout(centro is not None)
+            if centro is not None:
+                centro_tela = (centro[0] + regiao_prevista[0], centro[1] + regiao_prevista[1])
+                _guardar_resultado(nome_chave, quadro_previsto, regiao_prevista[:2], contexto, centro_tela, pontuacao, tamanho_template)
+                return centro_tela, pontuacao
+
+            # A previsão falhou: a janela pode ter mudado de lugar. Relocaliza a mestre agora, para
+            # que o deslocamento reaprendido na busca normal abaixo seja calculado a partir dela.
+            layout_ancoras.invalidar_mestre()
+            _garantir_mestre()
+
+    # 3. Busca por região: caixa memorizada + margem (se houver memória para a chave).
+    regiao = memoria_posicoes.calcular_regiao_busca(nome_chave, MARGEM_BUSCA_REGIAO, *obter_tamanho_tela())
+    if regiao is not None:
+        quadro_regiao = capturar_tela(regiao)
+
+        # 3.1. Se a região não mudou desde o último acerto, devolve o resultado guardado sem comparar.
+        if USAR_CACHE_LOCALIZACAO:
+            resultado_cache = consultar_cache(nome_chave, regiao, calcular_impressao_digital(quadro_regiao), contexto)
+            if resultado_cache is not None:
+                return resultado_cache
+
+        centro, pontuacao = _comparar_no_quadro(quadro_regiao, nome_chave, modo, confianca, {}, _obter_pool())
+        memoria_posicoes.registrar_resultado_regiao(centro is not None)
+        if centro is not None:
+            centro_tela = (centro[0] + regiao[0], centro[1] + regiao[1])
+            _guardar_resultado(nome_chave, quadro_regiao, regiao[:2], contexto, centro_tela, pontuacao, tamanho_template)
+            return centro_tela, pontuacao
+
+    # 4. Fallback: varre a tela inteira e atualiza a memória (e o cache) da chave.
+    if not varrer_tela:
+        return None, pontuacao
+    quadro = capturar_tela()
+    centro, pontuacao = _comparar_no_quadro(quadro, nome_chave, modo, confianca, {}, _obter_pool())
+    if centro is not None:
+        _guardar_resultado(nome_chave, quadro, (0, 0), contexto, centro, pontuacao, tamanho_template)
+    return centro, pontuacao
 
-# 1. Define constantes de caminho: projeto raiz e localização do `parametros.json`.
-CAMINHO_PROJETO = Path(__file__).resolve().parent.parent
-CAMINHO_JSON = CAMINHO_PROJETO / "parametros.json"
 
 def localizar_elemento(nome_chave: str, confianca_override: float = None) -> Tuple[pyautogui.Point, Dict[str, Any]]:
     """
     Localiza um elemento na tela com base em seu nome de chave e retorna sua posição e metadados.
 
-    A função busca as informações do elemento no arquivo `parametros.json`, carrega o caminho da
-    imagem associada e utiliza o PyAutoGUI para localizar o centro dessa imagem na tela. Caso a
-    imagem não seja encontrada ou os dados estejam inconsistentes, uma exceção é levantada.
+    O nome pode ser também o de um grupo de variantes ("grupo_variantes" no JSON): nesse caso
+    vale a melhor variante encontrada (ver `localizar_variante`).
+
+    A função busca as informações do elemento e o template já decodificado no registro de
+    âncoras em memória (`uteis.registro_ancoras`) e localiza o centro dessa imagem na tela,
+    no modo de busca da âncora ("modo_busca" no JSON ou `MODO_BUSCA_PADRAO`). A busca começa numa
+    região ao redor da última posição onde a chave foi encontrada e só varre a tela inteira se não
+    a encontrar lá. Se essa região não mudou desde o último acerto (mesma impressão digital), a
+    posição guardada é devolvida sem novo template matching. Caso a imagem não seja encontrada ou os
+    dados estejam inconsistentes, uma exceção é levantada.
 
     Args:
         nome_chave (str): Nome da chave do elemento no arquivo `parametros.json`.
         confianca_override (float, optional): Valor de confiança (entre 0 e 1) que substitui
-        o padrão definido em `CONFIANCA_PADRAO_IMAGEM`.
+        a "confianca" da âncora no JSON e o padrão definido em `CONFIANCA_PADRAO_IMAGEM`.
 
     Returns:
         Tuple[pyautogui.Point, Dict[str, Any]]:
@@ -36,51 +321,236 @@ def localizar_elemento(nome_chave: str, confianca_override: float = None) -> Tup
     Raises:
         FileNotFoundError: Se o arquivo `parametros.json` ou a imagem do elemento não existirem.
         KeyError: Se a chave ou propriedades esperadas não forem encontradas no JSON.
+        ValueError: Se o "modo_busca" da âncora não for suportado.
         pyautogui.ImageNotFoundException: Se o elemento não for localizado na tela."""
 
-    # 2. Abre e carrega o arquivo JSON com todos os elementos definidos.
+    # 1. Na primeira busca da sessão, resolve a escala da tela (os templates são redimensionados uma vez).
+    _garantir_escala()
+
+    # 2. Obtém os dados do JSON e o template já decodificado a partir do registro em memória.
+    #    (O registro só relê o `parametros.json` e as imagens quando o mtime do JSON muda.)
+    #    Um nome que não é chave pode ser o de um grupo de variantes: vale a melhor variante.
     try:
-        with open(CAMINHO_JSON, 'r', encoding='utf-8') as f:
-            dados_json_completo = json.load(f)
+        dados_elemento, template = obter_ancora(nome_chave)
+    except KeyError:
+        if not listar_variantes(nome_chave):
+            raise
+        _, posicao, dados_elemento = localizar_variante(nome_chave, confianca_override)
+        return posicao, dados_elemento
+    caminho_imagem_relativo = dados_elemento.get("path")
 
-    # 3. Levanta erro se o arquivo `parametros.json` não for encontrado.
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Arquivo de elementos não encontrado: {CAMINHO_JSON}")
+    # 3. Determina o nível de confiança ("confianca" da âncora ou o padrão) e o modo de busca
+    #    (colorido, cinza ou pirâmide) da âncora.
+    confianca_a_usar = _resolver_confianca(dados_elemento, confianca_override)
+    modo_busca = _resolver_modo_busca(nome_chave, dados_elemento)
 
-    # 4. Busca os dados do elemento pela chave informada; levanta KeyError se não existir.
-    dados_elemento = dados_json_completo.get(nome_chave)
-    if not dados_elemento:
-        raise KeyError(f"Chave '{nome_chave}' não encontrada no parametros.json.")
+    # 4. Procura o template (array em memória): primeiro na região memorizada, depois na tela inteira.
+    centro, pontuacao = _buscar_na_tela(nome_chave, modo_busca, template.shape, confianca_a_usar)
 
-    # 5. Extrai o caminho relativo da imagem do elemento; levanta erro se ausente.
-    caminho_imagem_relativo = dados_elemento.get("path")
-    if not caminho_imagem_relativo:
-        raise KeyError(f"Propriedade 'path' não encontrada para a chave '{nome_chave}'.")
+    # 4.1. Se falhou com a escala ainda por resolver (a mestre não estava visível antes), tenta detectá-la
+    #      agora; se a escala mudar, repete a busca com os templates redimensionados.
+    if centro is None and _garantir_escala():
+        dados_elemento, template = obter_ancora(nome_chave)
+        centro, pontuacao = _buscar_na_tela(nome_chave, modo_busca, template.shape, confianca_a_usar)
 
-    # 6. Constrói o caminho absoluto da imagem e verifica se o arquivo existe.
-    caminho_imagem_absoluto = CAMINHO_PROJETO / caminho_imagem_relativo
-    if not caminho_imagem_absoluto.exists():
-        raise FileNotFoundError(f"Arquivo de imagem não encontrado: {caminho_imagem_absoluto}")
+    # 4.2. Regista a melhor pontuação (encontrada ou não), para a afinação da confiança por âncora.
+    estatisticas_pontuacao.registrar_pontuacao(nome_chave, pontuacao, centro is not None)
 
-    # 7. Determina o nível de confiança a usar: override ou valor padrão da configuração.
-    confianca_a_usar = confianca_override if confianca_override is not None else CONFIANCA_PADRAO_IMAGEM
+    # 5. Se não houver correspondência acima da confiança, levanta `ImageNotFoundException` com mensagem clara.
+    if centro is None:
+        raise pyautogui.ImageNotFoundException(
+            f"Elemento '{nome_chave}' (imagem: {caminho_imagem_relativo}) não foi encontrado na tela."
+        )
 
-    # 8. Tenta localizar o centro da imagem na tela com `pyautogui.locateCenterOnScreen`.
-    try:
-        posicao = pyautogui.locateCenterOnScreen(str(caminho_imagem_absoluto), confidence=confianca_a_usar)
+    # 6. Retorna a posição (Point) e os dados completos do elemento do JSON.
+    return pyautogui.Point(*centro), dados_elemento
+
+#=========================================================================================================
+
+def localizar_elementos(nomes_chaves: List[str], confianca_override: float = None,
+                        quadro: np.ndarray = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Localiza VÁRIOS elementos a partir de uma única captura de tela.
+
+    A tela é capturada uma só vez e todos os templates pedidos são comparados contra esse
+    mesmo quadro. Ao contrário de `localizar_elemento`, a função não levanta exceção quando
+    um elemento não é encontrado: a posição fica como None e a pontuação é devolvida para
+    que o chamador decida o que fazer.
+
+    Args:
+        nomes_chaves (List[str]): Chaves dos elementos no arquivo `parametros.json`.
+        confianca_override (float, optional): Valor de confiança (entre 0 e 1) que substitui
+        a "confianca" da âncora no JSON e o padrão definido em `CONFIANCA_PADRAO_IMAGEM`.
+        quadro (np.ndarray, optional): Uma captura da tela inteira já feita pelo chamador (BGR),
+        para analisar outras coisas na mesma imagem. Se omitida, a tela é capturada aqui.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Um dicionário por chave com:
+            - "posicao": O centro do elemento (pyautogui.Point) ou None se não encontrado.
+            - "pontuacao": A melhor pontuação de correspondência (0 a 1).
+            - "dados": O dicionário de dados da chave no JSON.
+
+    Raises:
+        FileNotFoundError: Se o arquivo `parametros.json` ou alguma imagem não existirem.
+        KeyError: Se alguma chave não for encontrada no JSON.
+    """
+    # 1. Resolve a escala e todas as chaves no registro ANTES de capturar (erros de JSON aparecem logo).
+    _garantir_escala()
+    ancoras = {chave: obter_ancora(chave) for chave in nomes_chaves}
+
+    # 2. Determina o nível de confiança de cada âncora: override, "confianca" da âncora ou o padrão.
+    confiancas = {chave: _resolver_confianca(dados_elemento, confianca_override) for chave, (dados_elemento, _) in ancoras.items()}
+
+    # 3. Captura a tela UMA única vez (ou usa a captura recebida).
+    if quadro is None:
+        quadro = capturar_tela()
+
+    # 4. Compara cada template contra o mesmo quadro (em paralelo no pool, se houver).
+    #    As versões derivadas do quadro (cinza, pirâmide) são calculadas uma vez, antes, e reaproveitadas.
+    #    (Os espectros FFT do quadro também são preparados antes, se alguma âncora for usar esse motor.)
+    modos = {chave: _resolver_modo_busca(chave, dados_elemento) for chave, (dados_elemento, _) in ancoras.items()}
+    modos_fft = {
+        modo for chave, modo in modos.items()
+        if modo in ("cor", "cinza") and _resolver_motor(quadro.shape, _obter_template_modo(chave, modo)) == "fft"
+    }
+    derivados = {}
+    _preparar_derivados(quadro, list(modos.values()), derivados, list(modos_fft))
 
-    # 9. Se a posição for `None`, força uma exceção `ImageNotFoundException`.
-        if posicao is None:
-            raise pyautogui.ImageNotFoundException
+    #    Com várias âncoras, cada uma vai para uma thread; com uma só, o quadro é dividido em faixas.
+    def _comparar(chave: str, pool_faixas: Optional[ThreadPoolExecutor] = None) -> Tuple[Optional[Tuple[int, int]], float]:
+        return _comparar_no_quadro(quadro, chave, modos[chave], confiancas[chave], derivados, pool_faixas)
 
-    # 10. Captura `ImageNotFoundException` e relança com mensagem clara, incluindo nome e caminho da imagem.
-    except pyautogui.ImageNotFoundException:
+    pool = _obter_pool()
+    if pool is not None and len(ancoras) > 1:
+        comparacoes = list(pool.map(_comparar, ancoras))
+    else:
+        comparacoes = [_comparar(chave, pool) for chave in ancoras]
+
+    # 5. Monta os resultados (e memoriza/guarda em cache as posições encontradas).
+    resultados = {}
+    for (chave, (dados_elemento, template)), (centro, pontuacao) in zip(ancoras.items(), comparacoes):
+        estatisticas_pontuacao.registrar_pontuacao(chave, pontuacao, centro is not None)
+        if centro is not None:
+            _guardar_resultado(chave, quadro, (0, 0), (confiancas[chave], modos[chave]), centro, pontuacao, template.shape)
+        resultados[chave] = {
+            "posicao": pyautogui.Point(*centro) if centro is not None else None,
+            "pontuacao": pontuacao,
+            "dados": dados_elemento,
+        }
+
+    # 6. Retorna o dicionário de resultados por chave.
+    return resultados
+
+#=========================================================================================================
+
+def localizar_variante(nome_grupo: str, confianca_override: float = None) -> Tuple[str, pyautogui.Point, Dict[str, Any]]:
+    """
+    Localiza a melhor variante de um grupo de âncoras numa única captura de tela.
+
+    Âncoras com o mesmo `"grupo_variantes"` no `parametros.json` são versões alternativas do mesmo
+    elemento (ex: o botão "Novo sócio" com e sem linhas na tabela). Primeiro cada variante é
+    verificada pelas vias baratas de `localizar_elemento` (posição prevista, região memorizada,
+    cache); só se nenhuma acertar, todas são comparadas contra uma única captura da tela inteira.
+    Vence a de maior pontuação entre as encontradas.
+
+    Args:
+        nome_grupo (str): O valor de `"grupo_variantes"` partilhado pelas variantes.
+        confianca_override (float, optional): Valor de confiança (entre 0 e 1) que substitui
+        a "confianca" de cada variante no JSON e o padrão definido em `CONFIANCA_PADRAO_IMAGEM`.
+
+    Returns:
+        Tuple[str, pyautogui.Point, Dict[str, Any]]: A chave da variante vencedora, a sua posição
+        central na tela e o dicionário de dados dela no JSON.
+
+    Raises:
+        KeyError: Se nenhuma âncora pertencer ao grupo.
+        pyautogui.ImageNotFoundException: Se nenhuma variante for localizada na tela.
+    """
+    # 1. Resolve as variantes do grupo.
+    variantes = listar_variantes(nome_grupo)
+    if not variantes:
+        raise KeyError(f"Grupo de variantes '{nome_grupo}' não encontrado no parametros.json.")
+
+    # 2. Vias baratas: cada variante na sua posição prevista/região memorizada (sem varrer a tela).
+    _garantir_escala()
+    acertos = []
+    for chave in variantes:
+        dados_elemento, template = obter_ancora(chave)
+        confianca_a_usar = _resolver_confianca(dados_elemento, confianca_override)
+        centro, pontuacao = _buscar_na_tela(chave, _resolver_modo_busca(chave, dados_elemento), template.shape, confianca_a_usar, varrer_tela=False)
+        if centro is not None:
+            acertos.append((pontuacao, chave, centro, dados_elemento))
+    if acertos:
+        pontuacao, chave_vencedora, centro, dados_elemento = max(acertos, key=lambda acerto: acerto[0])
+        estatisticas_pontuacao.registrar_pontuacao(chave_vencedora, pontuacao, True)
+        return chave_vencedora, pyautogui.Point(*centro), dados_elemento
+
+    # 3. Nenhuma acertou: compara todas as variantes contra uma única captura da tela inteira.
+    resultados = localizar_elementos(variantes, confianca_override)
+
+    # 4. Escolhe a variante encontrada com a maior pontuação.
+    encontradas = [(resultado["pontuacao"], chave) for chave, resultado in resultados.items() if resultado["posicao"] is not None]
+    if not encontradas:
+        pontuacoes = ", ".join(f"{chave}={resultado['pontuacao']:.3f}" for chave, resultado in resultados.items())
         raise pyautogui.ImageNotFoundException(
-            f"Elemento '{nome_chave}' (imagem: {caminho_imagem_relativo}) não foi encontrado na tela."
+            f"Nenhuma variante do grupo '{nome_grupo}' foi encontrada na tela (melhores pontuações: {pontuacoes})."
         )
-    
-    # 11. Retorna a posição (Point) e os dados completos do elemento do JSON.
-    return posicao, dados_elemento
+    _, chave_vencedora = max(encontradas)
+    return chave_vencedora, resultados[chave_vencedora]["posicao"], resultados[chave_vencedora]["dados"]
+
+#=========================================================================================================
+
+def localizar_na_regiao(nome_chave: str, regiao: Tuple[int, int, int, int],
+                        confianca_override: float = None) -> Optional[pyautogui.Point]:
+    """
+    Procura um elemento SÓ numa região da tela (uma captura pequena, sem previsão, cache nem tela inteira).
+
+    Útil quando o chamador sabe onde o elemento tem de aparecer (ex: a coluna de uma lista que está a
+    ser rolada) e vai repetir a consulta várias vezes. Um acerto é memorizado como numa busca normal.
+
+    Args:
+        nome_chave (str): Nome da chave do elemento no arquivo `parametros.json`.
+        regiao (Tuple[int, int, int, int]): Região (left, top, largura, altura) em coordenadas da tela.
+        confianca_override (float, optional): Valor de confiança que substitui o da âncora/padrão.
+
+    Returns:
+        Optional[pyautogui.Point]: O centro do elemento na tela, ou None se não estiver na região.
+    """
+    _garantir_escala()
+    dados_elemento, template = obter_ancora(nome_chave)
+    confianca_a_usar = _resolver_confianca(dados_elemento, confianca_override)
+    modo_busca = _resolver_modo_busca(nome_chave, dados_elemento)
+
+    quadro_regiao = capturar_tela(regiao)
+    centro, pontuacao = _comparar_no_quadro(quadro_regiao, nome_chave, modo_busca, confianca_a_usar, {})
+    if centro is None:
+        return None
+    centro_tela = (centro[0] + regiao[0], centro[1] + regiao[1])
+    _guardar_resultado(nome_chave, quadro_regiao, regiao[:2], (confianca_a_usar, modo_busca), centro_tela, pontuacao, template.shape)
+    estatisticas_pontuacao.registrar_pontuacao(nome_chave, pontuacao, True)
+    return pyautogui.Point(*centro_tela)
+
+#=========================================================================================================
+
+def salvar_memoria_localizacao() -> Dict[str, Any]:
+    """
+    Guarda as últimas posições das âncoras (e as pontuações registadas) em `temp/` (se a persistência estiver ativa)
+    e retorna as estatísticas da busca por região desta execução.
+
+    Returns:
+        Dict[str, Any]: {"acertos": int, "falhas": int, "taxa_acerto": float, "cache": int, "layout": int}
+        ("cache" = buscas respondidas pelo cache de localização, sem template matching;
+        "layout" = âncoras achadas na posição prevista a partir da âncora mestre).
+    """
+    if PERSISTIR_POSICOES_ANCORAS:
+        memoria_posicoes.salvar_posicoes()
+        layout_ancoras.salvar_layout()
+        estatisticas_pontuacao.salvar_estatisticas()
+    estatisticas = memoria_posicoes.obter_estatisticas_regiao()
+    estatisticas["cache"] = obter_estatisticas_cache()["acertos"]
+    estatisticas["layout"] = layout_ancoras.obter_estatisticas_layout()["acertos"]
+    return estatisticas
+
 
 # --- Camada de Teste Direto ---
 if __name__ == '__main__':
@@ -89,10 +559,11 @@ if __name__ == '__main__':
     Execute-o a partir da raiz do projeto com: python -m funcoes.localizar_elemento
     """
     import time
-    
+
     # --- AJUSTE AQUI ---
     # Coloque o nome exato de uma chave que existe no seu parametros.json
-    CHAVE_PARA_TESTAR = "tela_cadastro_parceirodeneg" 
+    CHAVE_PARA_TESTAR = "tela_cadastro_parceirodeneg"
+    CHAVES_PARA_TESTAR_EM_LOTE = ["tela_cadastro_parceirodeneg", "aba_geral", "aba_enderecos"]
     # ------------------
 
     print(">>> Iniciando teste da função localizar_elemento...")
@@ -103,20 +574,28 @@ if __name__ == '__main__':
 
     try:
         print(f"--- Tentando localizar o elemento '{CHAVE_PARA_TESTAR}' na tela...")
-        
+
         # A função é chamada com a CHAVE
         posicao, dados = localizar_elemento(CHAVE_PARA_TESTAR)
-        
+
         print("--- Teste concluído com SUCESSO! ---")
         print(f"Posição encontrada: {posicao}")
         print(f"Dados do elemento: {dados}")
 
+        print(f"\n--- Tentando localizar {len(CHAVES_PARA_TESTAR_EM_LOTE)} elementos numa única captura...")
+        for chave, resultado in localizar_elementos(CHAVES_PARA_TESTAR_EM_LOTE).items():
+            print(f"   - {chave}: posição={resultado['posicao']} | pontuação={resultado['pontuacao']:.3f}")
+
+        print("\n--- Localizando de novo (deve acertar na região memorizada)...")
+        localizar_elemento(CHAVE_PARA_TESTAR)
+        print(f"Estatísticas da busca por região: {memoria_posicoes.obter_estatisticas_regiao()}")
+
     except FileNotFoundError as e:
         print(f"--- Teste FALHOU! Arquivo não encontrado: {e}")
     except KeyError as e:
         print(f"--- Teste FALHOU! Erro na chave ou parâmetro do JSON: {e}")
     except pyautogui.ImageNotFoundException as e:
-        # A exceção da sua função (Passo 10) será capturada aqui
+        # A exceção da sua função (Passo 5) será capturada aqui
         print(f"--- Teste FALHOU! Imagem não encontrada na tela: {e}")
     except Exception as e:
-        print(f"--- Teste FALHOU! Erro inesperado: {type(e).__name__}: {e}")
\ No newline at end of file
+        print(f"--- Teste FALHOU! Erro inesperado: {type(e).__name__}: {e}")
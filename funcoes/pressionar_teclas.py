@@ -1,8 +1,8 @@
 # funcoes/pressionar_teclas.py
 
 """Módulo para ações de teclado (atalhos e teclas únicas)."""
-import pyautogui
 import time
+from .comandos_entrada import pressionar, atalho
 
 # 1. Define a função pressionar_atalho_combinado que aceita múltiplas teclas como argumentos variáveis.
 def pressionar_atalho_combinado(*teclas: str):
@@ -20,9 +20,9 @@ def pressionar_atalho_combinado(*teclas: str):
         RuntimeError: Se ocorrer falha ao executar o atalho via PyAutoGUI.
     """
 
-# 2. Usa pyautogui.hotkey() para pressionar todas as teclas simultaneamente (ex: Ctrl + F).
+# 2. Usa atalho() (comandos de entrada) para pressionar todas as teclas simultaneamente (ex: Ctrl + F).
     try:
-        pyautogui.hotkey(*teclas)
+        atalho(*teclas)
 
 # 3. Captura qualquer exceção do PyAutoGUI e relança como RuntimeError com mensagem clara incluindo as teclas.
     except Exception as e:
@@ -44,9 +44,9 @@ def pressionar_tecla_unica(tecla: str):
         RuntimeError: Se ocorrer falha ao pressionar a tecla via PyAutoGUI.
     """
 
-# 2. Usa pyautogui.press() para simular o pressionamento de uma tecla individual.
+# 2. Usa pressionar() (comandos de entrada) para simular o pressionamento de uma tecla individual.
     try:
-        pyautogui.press(tecla)
+        pressionar(tecla)
 
 # 3. Captura exceções do PyAutoGUI e relança como RuntimeError com a tecla envolvida na falha.
     except Exception as e:
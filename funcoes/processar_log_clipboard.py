@@ -2,12 +2,12 @@
 
 """Módulo para ler e processar a tabela de log da área de transferência."""
 
-import pyperclip
 import pandas as pd
 import io
 import time
+from uteis.area_transferencia_sistema import ler_texto, escrever_texto
 
-def obter_ultimo_usuario_do_log() -> str:
+def obter_ultimo_usuario_do_log(texto: str = None) -> str:
     """
     Lê a tabela de log copiada para a área de transferência e retorna o último usuário registrado.
 
@@ -15,6 +15,10 @@ def obter_ultimo_usuario_do_log() -> str:
     processa-os com pandas, identifica a última linha do log e extrai o valor da coluna
     'Atualizado por - Código do usuário', retornando-o como string.
 
+    Args:
+        texto (str, optional): O log já copiado (ex: devolvido por `copiar_por`). Se omitido,
+                               lê a área de transferência.
+
     Returns:
         str: Código do usuário responsável pela última atualização registrada no log.
 
@@ -24,9 +28,9 @@ def obter_ultimo_usuario_do_log() -> str:
         RuntimeError: Se ocorrer qualquer erro durante o processamento com pandas.
     """
 
-    # 1. Lê o conteúdo da área de transferência usando pyperclip.
+    # 1. Usa o texto recebido ou lê o conteúdo da área de transferência.
     try:
-        dados_clipboard = pyperclip.paste()
+        dados_clipboard = texto if texto is not None else ler_texto()
 
     # 2. Verifica se o clipboard está vazio e levanta erro se não houver dados.
         if not dados_clipboard:
@@ -73,7 +77,7 @@ if __name__ == '__main__':
         "1\tC056202\t20/10/2025\tJONATHAN.FREITAS\tJONATHAN EDUARDO FREITAS\n"
         "2\tC056202\t20/10/2025\tTESTE_USUARIO_FINAL\tTESTE USUARIO FINAL"
     )
-    pyperclip.copy(dados_falsos)
+    escrever_texto(dados_falsos)
     time.sleep(3)
 
     try:
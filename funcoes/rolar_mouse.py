@@ -1,9 +1,15 @@
 # funcoes/rolar_mouse.py
 
-"""Módulo para a ação de rolar (scroll) o mouse várias vezes."""
+"""Módulo para a ação de rolar (scroll) o mouse várias vezes (ou até um elemento ficar visível)."""
 
 import pyautogui
 import time
+from typing import Tuple
+from uteis.ritmo import pausar
+from uteis.registro_ancoras import obter_ancora
+from .localizar_elemento import localizar_elemento, localizar_na_regiao, escalar_ajuste
+from .capturar_tela import obter_tamanho_tela
+from .comandos_entrada import rolar
 
 def rolar_mouse_linhas(numero_de_linhas: int, direcao: str = 'baixo'):
     """
@@ -36,15 +42,89 @@ def rolar_mouse_linhas(numero_de_linhas: int, direcao: str = 'baixo'):
     # 3. Itera pelo número absoluto de linhas, garantindo funcionamento com valores negativos.
     try:
         for _ in range(abs(numero_de_linhas)):
-            pyautogui.scroll(clique_por_linha)
+            rolar(clique_por_linha)
 
-    # 4. Executa uma rolagem por vez com pyautogui.scroll() e pausa de 0.30s entre cada uma.
-            time.sleep(0.30)
+    # 4. Executa uma rolagem por vez com rolar() e a pausa "rolagem_linha" entre cada uma.
+            pausar("rolagem_linha")
 
     # 5. Captura exceções do PyAutoGUI e relança como RuntimeError com mensagem clara.
     except Exception as e:
         raise RuntimeError(f"Falha ao tentar rolar o mouse: {e}")
 
+#=========================================================================================================
+
+def _regiao_lista(nome_chave: str, chave_referencia: str, altura_lista: int) -> Tuple[int, int, int, int]:
+    """
+    Função interna: região da lista onde o elemento pode aparecer, a partir de um item visível dela.
+
+    A coluna tem a largura do template do elemento (mais uma folga) centrada no item de referência,
+    e `altura_lista` pixels (na escala dos templates) para cima e para baixo dele.
+    """
+    posicao_referencia, _ = localizar_elemento(chave_referencia)
+    altura_template, largura_template = obter_ancora(nome_chave)[1].shape[:2]
+    largura_tela, altura_tela = obter_tamanho_tela()
+
+    meia_largura = largura_template // 2 + escalar_ajuste(20)
+    meia_altura = escalar_ajuste(altura_lista)
+    esquerda = max(0, posicao_referencia.x - meia_largura)
+    topo = max(0, posicao_referencia.y - meia_altura)
+    direita = min(largura_tela, posicao_referencia.x + meia_largura)
+    base = min(altura_tela, posicao_referencia.y + meia_altura)
+    return esquerda, topo, direita - esquerda, base - topo
+
+
+def rolar_ate_elemento(nome_chave: str, direcao: str = 'baixo', linhas_por_passo: int = 4, maximo_passos: int = 6,
+                       chave_referencia: str = None, altura_lista: int = 300):
+    """
+    Rola uma lista até um elemento ficar visível, conferindo a tela depois de cada passo.
+
+    Cada passo é um único gesto de `linhas_por_passo` linhas (em vez de uma rolagem por linha
+    com uma pausa entre cada uma). Com `chave_referencia` (um item da mesma lista, já visível),
+    cada conferência é uma captura só da coluna da lista em volta dele; sem ela, a âncora é
+    procurada com `localizar_elemento`. A rolagem pára assim que o elemento aparece.
+
+    Args:
+        nome_chave (str): A chave do elemento no JSON que deve ficar visível.
+        direcao (str, optional): 'cima' ou 'baixo' (padrão).
+        linhas_por_passo (int, optional): Linhas roladas em cada gesto (menos que as linhas visíveis da lista).
+        maximo_passos (int, optional): Número máximo de gestos antes de desistir.
+        chave_referencia (str, optional): Chave de um item visível da lista, que define a região conferida.
+        altura_lista (int, optional): Pixels (na escala dos templates) conferidos acima e abaixo da referência.
+
+    Returns:
+        int: Quantos gestos de rolagem foram precisos (0 se o elemento já estava visível).
+
+    Raises:
+        ValueError: Se a direção informada não for 'cima' nem 'baixo'.
+        RuntimeError: Se o elemento não aparecer depois de `maximo_passos` gestos.
+    """
+    # 1. Define o sentido da rolagem (o mesmo valor por linha de `rolar_mouse_linhas`).
+    if direcao not in ('baixo', 'cima'):
+        raise ValueError("Direção da rolagem inválida. Use 'cima' ou 'baixo'.")
+    cliques_por_passo = (-100 if direcao == 'baixo' else 100) * linhas_por_passo
+
+    # 2. Região da lista (se houver referência), calculada uma só vez: a lista rola, a coluna fica.
+    regiao = _regiao_lista(nome_chave, chave_referencia, altura_lista) if chave_referencia else None
+
+    # 3. Confere a tela antes de cada gesto (o elemento pode já estar visível) e rola um passo de cada vez.
+    for passo in range(maximo_passos + 1):
+        if regiao is not None:
+            if localizar_na_regiao(nome_chave, regiao) is not None:
+                return passo
+        else:
+            try:
+                localizar_elemento(nome_chave)
+                return passo
+            except pyautogui.ImageNotFoundException:
+                pass
+        if passo == maximo_passos:
+            break
+        rolar(cliques_por_passo)
+        pausar("rolagem_passo")
+
+    # 4. Limite de gestos atingido sem o elemento aparecer.
+    raise RuntimeError(f"Elemento '{nome_chave}' não apareceu depois de {maximo_passos} rolagens de {linhas_por_passo} linhas.")
+
 
 # --- Camada de Teste Direto ---
 if __name__ == '__main__':
@@ -2,11 +2,13 @@
 
 """Módulo para a ação de selecionar um valor em um dropdown."""
 
-import pyautogui
 import time
 
 # Importa nossa função de base para encontrar a âncora e seus dados.
-from .localizar_elemento import localizar_elemento
+from .localizar_elemento import localizar_elemento, escalar_ajuste
+from .entrada_texto import resolver_estrategia, inserir_texto
+from uteis.ritmo import pausar
+from .comandos_entrada import clicar, pressionar
 
 
 def selecionar_dropdown(nome_chave: str, valor_a_selecionar: str, ajuste_x_override: int = None, ajuste_y_override: int = None):
@@ -15,7 +17,9 @@ def selecionar_dropdown(nome_chave: str, valor_a_selecionar: str, ajuste_x_overr
 
     A função localiza uma imagem que serve como âncora e, a partir dela, determina
     qual ajuste aplicar (os ajustes são coordenadas X e Y somadas às coordenadas
-    da imagem). A prioridade para definir o ajuste é a seguinte:
+    da imagem). O valor é escrito com a estratégia de entrada do campo (propriedade
+    `"entrada"` da âncora); o padrão é "digitar", porque a seleção depende da pesquisa por
+    digitação do dropdown. A prioridade para definir o ajuste é a seguinte:
 
     1. O ajuste de override passado diretamente para a função.
     2. O ajuste padrão definido no arquivo parametros.json.
@@ -48,16 +52,20 @@ def selecionar_dropdown(nome_chave: str, valor_a_selecionar: str, ajuste_x_overr
         ajuste_y_final = int(dados_elemento.get("ajuste_y") or 0)
 
     # 4. Calcula a posição final do alvo (o clique para abrir o dropdown).
-    x_alvo = posicao_ancora.x + ajuste_x_final
-    y_alvo = posicao_ancora.y + ajuste_y_final
+    #    (Os ajustes estão na escala dos templates e acompanham a escala da tela.)
+    x_alvo = posicao_ancora.x + escalar_ajuste(ajuste_x_final)
+    y_alvo = posicao_ancora.y + escalar_ajuste(ajuste_y_final)
 
-    # 5. Tenta executar a sequência de ações no alvo final.
+    # 5. Decide a estratégia de entrada (a pesquisa por digitação precisa de "digitar").
+    estrategia = resolver_estrategia(nome_chave, dados_elemento, "digitar")
+
+    # 6. Tenta executar a sequência de ações no alvo final.
     try:
-        pyautogui.click(x_alvo, y_alvo)
-        time.sleep(0.8) # Pausa um pouco maior para o dropdown abrir.
-        pyautogui.write(str(valor_a_selecionar), interval=0.05)
-        time.sleep(0.5)
-        pyautogui.press('enter') # Enter para confirmar a seleção.
+        clicar(x_alvo, y_alvo)
+        pausar("abrir_dropdown") # Pausa um pouco maior para o dropdown abrir.
+        inserir_texto(valor_a_selecionar, estrategia)
+        pausar("confirmar_entrada")
+        pressionar('enter') # Enter para confirmar a seleção.
     except Exception as e:
         raise RuntimeError(f"Falha ao interagir com o dropdown '{nome_chave}': {e}")
 
@@ -16,6 +16,8 @@ from acoes.preencher_aba_enderecos_idfiscais import preencher_aba_enderecos_idfi
 from acoes.processar_endereco_faturamento import processar_endereco_faturamento
 from acoes.preencher_socios import preencher_aba_socios
 from uteis.gestor_sessao import encerrar_sessao
+from funcoes.localizar_elemento import salvar_memoria_localizacao
+from funcoes.esperar_elemento import obter_estatisticas_espera
 from acoes.preencher_aba_geral2 import preencher_aba_geral2
 
 
@@ -74,6 +76,13 @@ def principal():
         # Limpa o 'dados_sessao.json' de volta ao template vazio.
         print(f"\n{AMARELO}--- Encerrando sessão... ---{RESET}")
         encerrar_sessao()
+        estatisticas_regiao = salvar_memoria_localizacao()
+        print(f"   - (Busca por região: {estatisticas_regiao['acertos']} acerto(s), "
+              f"{estatisticas_regiao['falhas']} falha(s), taxa {estatisticas_regiao['taxa_acerto']:.0%}; "
+              f"{estatisticas_regiao['cache']} resposta(s) do cache; "
+              f"{estatisticas_regiao['layout']} acerto(s) pelo layout.)")
+        for chave, espera in obter_estatisticas_espera().items():
+            print(f"   - (Espera por '{chave}': {espera['esperas']}x, média {espera['media']:.2f}s, máx. {espera['maximo']:.2f}s.)")
         print(f"{AMARELO}🚀 Execução finalizada.{RESET}")
 
 
@@ -6,6 +6,7 @@ import time
 
 # Importa a nossa ferramenta de baixo nível para clicar.
 from funcoes.clicar_elemento import clicar_elemento
+from uteis import layout_ancoras
 # Importa o Assistente executor executor.
 from assistente.executor import executar_acao_assistida
 
@@ -24,10 +25,10 @@ def ir_para_aba(nome_da_aba: str):
 
     # A docstring da ação será a própria chave, tornando o log do 'assistente.executor' claro.
     executar_acao_assistida(
-        lambda: clicar_elemento(chave_da_aba),
+        lambda: clicar_elemento(chave_da_aba, aguardar_tela=True), # Espera a aba mudar e terminar de renderizar.
         nome_acao=f"Navegar para a aba '{nome_da_aba.capitalize()}'"
     )
-    time.sleep(1) # Pausa de segurança para a aba renderizar.
+    layout_ancoras.invalidar_mestre() # Nova aba: a âncora mestre volta a ser localizada na próxima busca.
 
 
 # --- Camada de Teste Direto ---
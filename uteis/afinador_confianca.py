@@ -0,0 +1,103 @@
+# uteis/afinador_confianca.py
+
+"""
+Afinação da confiança por âncora a partir das pontuações registadas nas execuções.
+
+Lê `temp/estatisticas_ancoras.json` (gravado no fim de cada execução, ver
+`uteis.estatisticas_pontuacao`), propõe uma confiança para cada âncora com amostras
+suficientes e, com `--aplicar`, grava-a como propriedade `"confianca"` da âncora no
+`parametros.json`. Âncoras sem proposta continuam com a confiança padrão global.
+
+Não usa a tela real, o PyAutoGUI nem o `.env`.
+
+Uso (a partir da raiz do projeto):
+    python -m uteis.afinador_confianca [--aplicar] [--chaves chave1 chave2 ...] [--confianca-padrao 0.9]
+"""
+
+import argparse
+import json
+from typing import Dict, Any, List
+
+from uteis.estatisticas_pontuacao import carregar_estatisticas, obter_pontuacoes, propor_confianca
+from uteis.registro_ancoras import CAMINHO_JSON
+
+# Confiança padrão assumida para âncoras sem "confianca" no JSON (a mesma de DEFAULT_IMAGE_CONFIDENCE).
+CONFIANCA_PADRAO = 0.9
+
+
+def calcular_propostas(chaves: List[str] = None, diferenca_minima: float = 0.01,
+                       confianca_padrao: float = CONFIANCA_PADRAO) -> Dict[str, Dict[str, Any]]:
+    """
+    Calcula, por âncora, a confiança atual, a proposta e o resumo das pontuações registadas.
+
+    Args:
+        chaves (List[str], optional): Restringe a estas chaves (padrão: todas as do `parametros.json`).
+        diferenca_minima (float, optional): Propostas mais próximas do valor atual do que isto são ignoradas.
+        confianca_padrao (float, optional): Confiança das âncoras sem `"confianca"` no JSON.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: {chave: {"amostras", "encontradas", "pior_encontrada", "melhor_ausente",
+        "atual", "proposta"}} (só as chaves com uma proposta diferente da confiança atual).
+    """
+    with open(CAMINHO_JSON, 'r', encoding='utf-8') as f:
+        ancoras = json.load(f)
+    carregar_estatisticas()
+    pontuacoes = obter_pontuacoes()
+
+    propostas = {}
+    for chave in chaves or ancoras:
+        if chave not in ancoras or not pontuacoes.get(chave):
+            continue
+        atual = float(ancoras[chave].get("confianca") or confianca_padrao)
+        proposta = propor_confianca(pontuacoes[chave])
+        if proposta is None or abs(proposta - atual) < diferenca_minima:
+            continue
+        encontradas = [p for p, encontrada in pontuacoes[chave] if encontrada]
+        ausentes = [p for p, encontrada in pontuacoes[chave] if not encontrada]
+        propostas[chave] = {
+            "amostras": len(pontuacoes[chave]), "encontradas": len(encontradas),
+            "pior_encontrada": min(encontradas), "melhor_ausente": max(ausentes) if ausentes else None,
+            "atual": atual, "proposta": proposta,
+        }
+    return propostas
+
+
+def aplicar_propostas(propostas: Dict[str, Dict[str, Any]]):
+    """Grava as confianças propostas como `"confianca"` de cada âncora no `parametros.json`."""
+    with open(CAMINHO_JSON, 'r', encoding='utf-8') as f:
+        ancoras = json.load(f)
+    for chave, proposta in propostas.items():
+        ancoras[chave]["confianca"] = proposta["proposta"]
+    with open(CAMINHO_JSON, 'w', encoding='utf-8') as f:
+        json.dump(ancoras, f, indent=2, ensure_ascii=False)
+
+
+def principal(argumentos: List[str] = None):
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description="Propõe (ou aplica) a confiança de cada âncora a partir das pontuações registadas.")
+    parser.add_argument("--aplicar", action="store_true", help="Grava as propostas no parametros.json.")
+    parser.add_argument("--chaves", nargs="+", help="Só estas chaves (padrão: todas).")
+    parser.add_argument("--diferenca-minima", type=float, default=0.01, help="Ignora propostas tão próximas do valor atual.")
+    parser.add_argument("--confianca-padrao", type=float, default=CONFIANCA_PADRAO, help="O DEFAULT_IMAGE_CONFIDENCE em uso.")
+    args = parser.parse_args(argumentos)
+
+    propostas = calcular_propostas(args.chaves, args.diferenca_minima, args.confianca_padrao)
+    if not propostas:
+        print("Nenhuma proposta: sem pontuações suficientes ou confianças já adequadas.")
+        return
+
+    print(f"{'Âncora':<36} {'amostras':>8} {'achadas':>7} {'pior achada':>11} {'melhor ausente':>14} {'atual':>6} {'proposta':>9}")
+    for chave, proposta in propostas.items():
+        melhor_ausente = f"{proposta['melhor_ausente']:.3f}" if proposta['melhor_ausente'] is not None else "-"
+        print(f"{chave:<36} {proposta['amostras']:>8} {proposta['encontradas']:>7} {proposta['pior_encontrada']:>11.3f} "
+              f"{melhor_ausente:>14} {proposta['atual']:>6.3f} {proposta['proposta']:>9.3f}")
+
+    if args.aplicar:
+        aplicar_propostas(propostas)
+        print(f"\n✔ {len(propostas)} confiança(s) gravada(s) em {CAMINHO_JSON.name}.")
+    else:
+        print("\n(Use --aplicar para gravar as propostas no parametros.json.)")
+
+
+if __name__ == '__main__':
+    principal()
@@ -0,0 +1,460 @@
+# uteis/area_transferencia_sistema.py
+
+"""
+Módulo de acesso direto à área de transferência do sistema, sem um processo por operação.
+
+O pyperclip, em Linux/X11, chama o `xclip`/`xsel` a cada cópia e a cada leitura (dezenas de
+milissegundos cada). Aqui cada backend mantém a ligação com a área de transferência aberta
+no próprio processo:
+
+- "win32": a API do Windows via `ctypes` (funções carregadas uma única vez), com uma janela
+  oculta (só de mensagens) como dona da área de transferência. As leituras só abrem a área de
+  transferência quando o número de sequência dela muda; senão devolvem o último texto lido;
+- "x11": a seleção CLIPBOARD via `python-xlib`, com uma ligação persistente ao servidor X.
+  O robô é o dono da seleção depois de cada cópia e uma thread responde aos pedidos das
+  outras aplicações (o SAP ao colar);
+- "pyperclip": o recurso de último caso, quando nenhum dos anteriores está disponível.
+
+O backend é escolhido uma vez (`CLIPBOARD_BACKEND`, padrão "auto": o da plataforma, se houver)
+e, se a área de transferência tiver texto, só é aceito depois de uma escrita de teste ser
+lida de volta do sistema (não do texto guardado em memória).
+"""
+
+import sys
+import os
+import time
+import select
+import threading
+from typing import Callable, Dict, Tuple
+
+from configuracoes.carregar_config import BACKEND_AREA_TRANSFERENCIA
+
+BACKENDS_AREA_TRANSFERENCIA = ("auto", "win32", "x11", "pyperclip")
+TIMEOUT_DONO_SELECAO = 1.0  # Segundos de espera pela resposta da aplicação dona da seleção (X11).
+
+# Backend em uso: (nome, função de leitura, função de escrita). Escolhido na primeira operação.
+_BACKEND = None
+
+
+# ============================================================
+# Win32 (ctypes)
+# ============================================================
+
+_WIN32 = {}
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+HWND_MESSAGE = -3  # Pai das janelas "só de mensagens" (invisíveis, sem lugar na tela).
+
+
+def _win32_iniciar():
+    """
+    Função interna: carrega as funções da API do Windows, declara as suas assinaturas e cria a janela dona.
+
+    O `EmptyClipboard` entrega a posse da área de transferência à janela que a abriu; aberta sem
+    janela (`OpenClipboard(NULL)`), ela fica sem dono e o `SetClipboardData` falha.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    user32.CreateWindowExW.argtypes = [
+        wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+    ]
+    user32.CreateWindowExW.restype = wintypes.HWND
+    user32.GetClipboardSequenceNumber.argtypes = []
+    user32.GetClipboardSequenceNumber.restype = wintypes.DWORD
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.CloseClipboard.restype = wintypes.BOOL
+    user32.EmptyClipboard.restype = wintypes.BOOL
+    user32.GetClipboardData.argtypes = [wintypes.UINT]
+    user32.GetClipboardData.restype = wintypes.HANDLE
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalUnlock.restype = wintypes.BOOL
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.restype = wintypes.HGLOBAL
+
+    # Janela oculta, só de mensagens (classe "STATIC", já registada pelo sistema).
+    janela = user32.CreateWindowExW(0, "STATIC", "area_transferencia_robo", 0, 0, 0, 0, 0,
+                                    wintypes.HWND(HWND_MESSAGE), None, None, None)
+    if not janela:
+        raise RuntimeError(f"Falha ao criar a janela da área de transferência (erro {ctypes.get_last_error()}).")
+
+    _WIN32.update(ctypes=ctypes, user32=user32, kernel32=kernel32, janela=janela,
+                  sequencia=None, texto="")  # Último texto lido/escrito e o número de sequência dele.
+
+
+def _win32_abrir():
+    """Função interna: abre a área de transferência, esperando se outra aplicação a tiver aberta."""
+    limite = time.perf_counter() + 0.5
+    while not _WIN32["user32"].OpenClipboard(_WIN32["janela"]):
+        if time.perf_counter() >= limite:
+            raise RuntimeError("A área de transferência está ocupada por outra aplicação.")
+        time.sleep(0.001)
+
+
+def _win32_ler(direto: bool = False) -> str:
+    """
+    Função interna: lê o texto (CF_UNICODETEXT) da área de transferência do Windows.
+
+    Consultar o número de sequência não abre a área de transferência: enquanto ele não mudar,
+    devolve o último texto lido ou escrito (as esperas de `copiar_por` consultam-na a cada 5 ms).
+    Com `direto`, abre-a sempre.
+    """
+    user32, kernel32 = _WIN32["user32"], _WIN32["kernel32"]
+    if not direto and user32.GetClipboardSequenceNumber() == _WIN32["sequencia"]:
+        return _WIN32["texto"]
+
+    _win32_abrir()
+    try:
+        # (Lido com a área de transferência aberta: ninguém a pode mudar até fechá-la.)
+        sequencia = user32.GetClipboardSequenceNumber()
+        texto = ""
+        handle = user32.GetClipboardData(CF_UNICODETEXT)
+        if handle:
+            ponteiro = kernel32.GlobalLock(handle)
+            if ponteiro:
+                try:
+                    texto = _WIN32["ctypes"].wstring_at(ponteiro)
+                finally:
+                    kernel32.GlobalUnlock(handle)
+    finally:
+        user32.CloseClipboard()
+    _WIN32["sequencia"], _WIN32["texto"] = sequencia, texto
+    return texto
+
+
+def _win32_escrever(texto: str):
+    """Função interna: põe o texto (CF_UNICODETEXT) na área de transferência do Windows."""
+    user32, kernel32 = _WIN32["user32"], _WIN32["kernel32"]
+    dados = texto.encode("utf-16-le") + b"\x00\x00"
+
+    # 1. Copia o texto para um bloco de memória global (a área de transferência passa a ser dona dele).
+    handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(dados))
+    if not handle:
+        raise RuntimeError("Falha ao reservar memória para a área de transferência.")
+    ponteiro = kernel32.GlobalLock(handle)
+    if not ponteiro:
+        kernel32.GlobalFree(handle)
+        raise RuntimeError("Falha ao aceder à memória reservada para a área de transferência.")
+    _WIN32["ctypes"].memmove(ponteiro, dados, len(dados))
+    kernel32.GlobalUnlock(handle)
+
+    # 2. Substitui o conteúdo da área de transferência (a janela oculta passa a ser a dona).
+    try:
+        _win32_abrir()
+    except Exception:
+        kernel32.GlobalFree(handle)
+        raise
+    try:
+        if not user32.EmptyClipboard() or not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)
+            raise RuntimeError(f"Falha ao gravar o texto na área de transferência (erro {_WIN32['ctypes'].get_last_error()}).")
+        _WIN32["sequencia"], _WIN32["texto"] = user32.GetClipboardSequenceNumber(), texto
+    finally:
+        user32.CloseClipboard()
+
+
+# ============================================================
+# X11 (python-xlib)
+# ============================================================
+
+_X11 = {}
+
+
+def _x11_iniciar():
+    """
+    Função interna: abre as ligações ao servidor X e a thread que serve a seleção.
+
+    Duas ligações: a do dono (usada pela thread, responde aos pedidos de colagem) e a do
+    leitor (pede o conteúdo quando outra aplicação é a dona).
+    """
+    if not os.environ.get("DISPLAY"):
+        raise RuntimeError("DISPLAY não definido.")
+    from Xlib import X, Xatom, display as xdisplay
+    from Xlib.protocol import event as xevento
+
+    dono = xdisplay.Display()
+    leitor = xdisplay.Display()
+    atomos = {nome: leitor.intern_atom(nome) for nome in ("CLIPBOARD", "TARGETS", "UTF8_STRING", "TEXT", "INCR", "AREA_TRANSFERENCIA_ROBO")}
+
+    _X11.update(
+        X=X, Xatom=Xatom, evento=xevento, atomos=atomos,
+        dono=dono, leitor=leitor,
+        janela_dono=dono.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent),
+        janela_leitor=leitor.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent, event_mask=X.PropertyChangeMask),
+        texto=None,          # Texto que o robô oferece enquanto for o dono da seleção.
+        trava=threading.Lock(),
+    )
+    dono.flush()
+    threading.Thread(target=_x11_servir, name="area_transferencia_x11", daemon=True).start()
+
+
+def _x11_responder(pedido):
+    """Função interna: entrega o texto do robô a uma aplicação que pediu a seleção (ex: Ctrl+V no SAP)."""
+    X, Xatom, atomos = _X11["X"], _X11["Xatom"], _X11["atomos"]
+    texto = _X11["texto"]
+    propriedade = pedido.property or pedido.target  # Clientes antigos não indicam a propriedade.
+
+    if texto is None:
+        propriedade = X.NONE
+    elif pedido.target == atomos["TARGETS"]:
+        pedido.requestor.change_property(propriedade, Xatom.ATOM, 32, [atomos["TARGETS"], atomos["UTF8_STRING"], atomos["TEXT"], Xatom.STRING])
+    elif pedido.target in (atomos["UTF8_STRING"], atomos["TEXT"]):
+        pedido.requestor.change_property(propriedade, atomos["UTF8_STRING"], 8, texto.encode("utf-8"))
+    elif pedido.target == Xatom.STRING:
+        pedido.requestor.change_property(propriedade, Xatom.STRING, 8, texto.encode("latin-1", "replace"))
+    else:
+        propriedade = X.NONE
+
+    resposta = _X11["evento"].SelectionNotify(
+        time=pedido.time, requestor=pedido.requestor, selection=pedido.selection,
+        target=pedido.target, property=propriedade,
+    )
+    pedido.requestor.send_event(resposta)
+
+
+def _x11_servir():
+    """Função interna (thread): responde aos pedidos da seleção e nota quando outra aplicação copia."""
+    X, dono = _X11["X"], _X11["dono"]
+    while True:
+        with _X11["trava"]:
+            while dono.pending_events():
+                evento = dono.next_event()
+                if evento.type == X.SelectionRequest:
+                    _x11_responder(evento)
+                elif evento.type == X.SelectionClear:
+                    # Outra aplicação copiou (a menos que o robô já tenha voltado a ser o dono).
+                    if dono.get_selection_owner(_X11["atomos"]["CLIPBOARD"]) != _X11["janela_dono"]:
+                        _X11["texto"] = None
+            dono.flush()
+        # (Intervalo curto: eventos lidos durante uma escrita ficam na fila sem acordar o select.)
+        select.select([dono], [], [], 0.05)
+
+
+def _x11_escrever(texto: str):
+    """Função interna: torna o robô dono da seleção CLIPBOARD com o texto indicado."""
+    with _X11["trava"]:
+        _X11["texto"] = texto
+        _X11["janela_dono"].set_selection_owner(_X11["atomos"]["CLIPBOARD"], _X11["X"].CurrentTime)
+        _X11["dono"].flush()
+
+
+def _x11_aguardar_evento(condicao: Callable, limite: float):
+    """Função interna: devolve o próximo evento do leitor que satisfaz a condição (erro se o tempo esgotar)."""
+    leitor = _X11["leitor"]
+    while True:
+        while leitor.pending_events():
+            evento = leitor.next_event()
+            if condicao(evento):
+                return evento
+        restante = limite - time.perf_counter()
+        if restante <= 0:
+            raise RuntimeError("A aplicação dona da área de transferência não respondeu.")
+        select.select([leitor], [], [], restante)
+
+
+def _x11_ler(direto: bool = False) -> str:
+    """
+    Função interna: lê o texto da seleção CLIPBOARD (sem ida ao servidor se o robô for o dono).
+
+    Com `direto`, pede sempre o conteúdo ao dono pelo servidor X (mesmo que seja o próprio robô).
+    """
+    X, Xatom, atomos = _X11["X"], _X11["Xatom"], _X11["atomos"]
+    leitor, janela = _X11["leitor"], _X11["janela_leitor"]
+
+    # 1. Quem é o dono? Se for o próprio robô, o texto já está em memória.
+    dono_atual = leitor.get_selection_owner(atomos["CLIPBOARD"])
+    if dono_atual == X.NONE:
+        return ""
+    texto_proprio = _X11["texto"]
+    if not direto and dono_atual.id == _X11["janela_dono"].id and texto_proprio is not None:
+        return texto_proprio
+
+    # 2. Pede o conteúdo ao dono (UTF-8 primeiro, texto Latin-1 se ele não o oferecer).
+    limite = time.perf_counter() + TIMEOUT_DONO_SELECAO
+    for alvo, codificacao in ((atomos["UTF8_STRING"], "utf-8"), (Xatom.STRING, "latin-1")):
+        janela.convert_selection(atomos["CLIPBOARD"], alvo, atomos["AREA_TRANSFERENCIA_ROBO"], X.CurrentTime)
+        leitor.flush()
+        resposta = _x11_aguardar_evento(
+            lambda e: e.type == X.SelectionNotify and e.requestor.id == janela.id and e.target == alvo, limite
+        )
+        if resposta.property != X.NONE:
+            break
+    else:
+        return ""
+
+    # 3. Lê a propriedade. Conteúdos grandes chegam em partes (protocolo INCR).
+    propriedade = janela.get_full_property(atomos["AREA_TRANSFERENCIA_ROBO"], X.AnyPropertyType)
+    janela.delete_property(atomos["AREA_TRANSFERENCIA_ROBO"])
+    leitor.flush()
+    if propriedade is None:
+        return ""
+    if propriedade.property_type != atomos["INCR"]:
+        return bytes(propriedade.value).decode(codificacao, "replace")
+
+    partes = []
+    while True:
+        _x11_aguardar_evento(
+            lambda e: e.type == X.PropertyNotify and e.atom == atomos["AREA_TRANSFERENCIA_ROBO"] and e.state == X.PropertyNewValue,
+            time.perf_counter() + TIMEOUT_DONO_SELECAO,
+        )
+        parte = janela.get_full_property(atomos["AREA_TRANSFERENCIA_ROBO"], X.AnyPropertyType)
+        janela.delete_property(atomos["AREA_TRANSFERENCIA_ROBO"])
+        leitor.flush()
+        if parte is None or not parte.value:
+            return b"".join(partes).decode(codificacao, "replace")
+        partes.append(bytes(parte.value))
+
+
+# ============================================================
+# pyperclip (último caso)
+# ============================================================
+
+_PYPERCLIP = {}
+
+
+def _pyperclip_iniciar():
+    """Função interna: importa o pyperclip (só quando é o backend escolhido)."""
+    import pyperclip
+    _PYPERCLIP["modulo"] = pyperclip
+
+
+def _pyperclip_ler(direto: bool = False) -> str:
+    """Função interna: lê o texto pelo pyperclip (cada leitura já vai ao sistema)."""
+    return str(_PYPERCLIP["modulo"].paste() or "")
+
+
+def _pyperclip_escrever(texto: str):
+    """Função interna: põe o texto pelo pyperclip."""
+    _PYPERCLIP["modulo"].copy(texto)
+
+
+# Para cada backend: (iniciar, ler, escrever).
+_IMPLEMENTACOES: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    "win32": (_win32_iniciar, _win32_ler, _win32_escrever),
+    "x11": (_x11_iniciar, _x11_ler, _x11_escrever),
+    "pyperclip": (_pyperclip_iniciar, _pyperclip_ler, _pyperclip_escrever),
+}
+
+
+def _testar_escrita(ler: Callable, escrever: Callable):
+    """
+    Função interna: escreve um texto de teste, confere-o numa leitura direta e devolve o texto anterior.
+
+    Só é feito se a área de transferência tiver texto: sem texto (vazia, uma imagem, ficheiros),
+    nada é escrito, para não apagar o que lá está, e o backend é aceito só por ter inicializado.
+
+    Raises:
+        RuntimeError: Se o texto lido não for o escrito.
+    """
+    anterior = ler(direto=True)
+    if not anterior:
+        return
+    teste = f"<teste-area-transferencia-{os.getpid()}-{time.perf_counter_ns()}>"
+    escrever(teste)
+    try:
+        lido = ler(direto=True)
+    finally:
+        escrever(anterior)
+    if lido != teste:
+        raise RuntimeError("a escrita de teste não foi lida de volta.")
+
+
+def definir_backend_area_transferencia(nome: str) -> str:
+    """
+    Escolhe e inicializa o backend da área de transferência.
+
+    Args:
+        nome (str): "win32", "x11", "pyperclip" ou "auto" (o da plataforma; o pyperclip só se
+                    nenhum outro estiver disponível).
+
+    Returns:
+        str: O nome do backend em uso.
+
+    Raises:
+        ValueError: Se o nome for desconhecido.
+        RuntimeError: Se o backend pedido explicitamente não puder ser usado neste ambiente (não
+                      inicializa ou a escrita de teste não é lida de volta).
+    """
+    global _BACKEND
+    nome = (nome or "auto").strip().lower()
+    if nome not in BACKENDS_AREA_TRANSFERENCIA:
+        raise ValueError(f"Backend de área de transferência '{nome}' inválido. Backends válidos: {BACKENDS_AREA_TRANSFERENCIA}")
+
+    # 1. Candidatos: o pedido, ou no modo "auto" o nativo da plataforma seguido do pyperclip.
+    if nome != "auto":
+        candidatos = [nome]
+    elif sys.platform == "win32":
+        candidatos = ["win32", "pyperclip"]
+    else:
+        candidatos = ["x11", "pyperclip"]
+
+    # 2. Usa o primeiro que inicializar e passar na escrita de teste.
+    for candidato in candidatos:
+        iniciar, ler, escrever = _IMPLEMENTACOES[candidato]
+        try:
+            iniciar()
+            _testar_escrita(ler, escrever)
+        except Exception as e:
+            if nome != "auto":
+                raise RuntimeError(f"Backend de área de transferência '{candidato}' indisponível: {e}")
+            continue
+        _BACKEND = (candidato, ler, escrever)
+        return candidato
+    raise RuntimeError("Nenhum backend de área de transferência disponível.")
+
+
+def _backend():
+    """Função interna: devolve o backend em uso, aplicando `CLIPBOARD_BACKEND` na primeira chamada."""
+    if _BACKEND is None:
+        definir_backend_area_transferencia(BACKEND_AREA_TRANSFERENCIA)
+    return _BACKEND
+
+
+def nome_backend() -> str:
+    """Retorna o nome do backend da área de transferência em uso."""
+    return _backend()[0]
+
+
+def ler_texto() -> str:
+    """Retorna o texto atual da área de transferência (vazio se não houver texto)."""
+    return _backend()[1]()
+
+
+def escrever_texto(texto: str):
+    """Substitui o conteúdo da área de transferência pelo texto indicado."""
+    _backend()[2](str(texto))
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para medir o backend da área de transferência deste ambiente.
+    Execute a partir da raiz: python -m uteis.area_transferencia_sistema
+    """
+    print(">>> Iniciando teste da área de transferência do sistema...")
+    print(f"--- Backend: {nome_backend()}")
+
+    anterior = ler_texto()
+    repeticoes = 50
+    inicio = time.perf_counter()
+    for i in range(repeticoes):
+        escrever_texto(f"teste {i} ção")
+        assert ler_texto() == f"teste {i} ção", f"Teste {i} Falhou"
+    decorrido = (time.perf_counter() - inicio) * 1000 / (2 * repeticoes)
+    print(f"--- {2 * repeticoes} operações, {decorrido:.3f} ms por operação")
+
+    if anterior:
+        escrever_texto(anterior)
+    print("\n--- Teste concluído com SUCESSO! ---")
@@ -0,0 +1,261 @@
+# uteis/benchmark_ancoras.py
+
+"""
+Benchmark da localização de âncoras sobre um corpus de telas gravadas.
+
+Roda todas as âncoras do `parametros.json` contra cada quadro de uma gravação
+(pasta ou .zip com PNGs, ver `uteis.reproducao_tela`) e mede, por âncora e por
+estratégia de busca, a latência (p50/p95), a pontuação de correspondência e as
+contagens de acertos, falsos positivos e falhas (quando há um gabarito).
+
+Não usa a tela real, o PyAutoGUI nem o `.env`: pode rodar numa máquina de build.
+
+Uso (a partir da raiz do projeto):
+    python -m uteis.benchmark_ancoras CAMINHO_GRAVACAO [--gabarito gabarito.json] [--saida resultado.json]
+
+O gabarito (opcional) é um JSON {nome_do_quadro: {chave: [x, y] ou null}} com o centro
+esperado de cada âncora em cada quadro (null = a âncora NÃO está no quadro). Âncoras
+ausentes do gabarito de um quadro não entram nas contagens desse quadro.
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from uteis import reproducao_tela, memoria_posicoes
+from uteis.registro_ancoras import (
+    CAMINHO_PROJETO, listar_chaves, obter_ancora, obter_template_cinza, obter_piramide_template, obter_espectro_template
+)
+from uteis.correspondencia_imagem import (
+    buscar_template, buscar_template_piramide, buscar_template_fft, converter_para_cinza, construir_piramide, preparar_quadro_fft
+)
+
+# Estratégias medidas: tela inteira (colorido), região da última posição, tons de cinza, pirâmide
+# e tela inteira no motor FFT.
+ESTRATEGIAS = ("tela_inteira", "roi", "cinza", "piramide", "fft")
+
+# Distância máxima (px) entre o centro encontrado e o do gabarito para contar como acerto.
+TOLERANCIA_GABARITO = 5
+
+CAMINHO_SAIDA_PADRAO = CAMINHO_PROJETO / "temp" / "benchmark_ancoras.json"
+
+# Marca "âncora fora do gabarito deste quadro" (diferente de null = "âncora não está no quadro").
+_SEM_GABARITO = object()
+
+
+def _buscar(estrategia: str, quadro: np.ndarray, chave: str, confianca: float,
+            regiao: Optional[Tuple[int, int, int, int]], niveis: int) -> Tuple[Optional[Tuple[int, int]], float]:
+    """
+    Função interna: executa UMA localização da âncora no quadro com a estratégia pedida.
+
+    Cada chamada inclui as conversões que a localização real faria (cinza, pirâmide do quadro),
+    para que a latência medida seja a de uma chamada isolada de `localizar_elemento`.
+    A estratégia "roi" recebe a região calculada com as posições dos quadros anteriores e não
+    memoriza nada (quem chama memoriza depois das repetições, para todas verem o mesmo estado).
+    """
+    if estrategia == "tela_inteira":
+        _, template = obter_ancora(chave)
+        return buscar_template(quadro, template, confianca)
+
+    if estrategia == "fft":
+        quadro_fft = preparar_quadro_fft(quadro)
+        return buscar_template_fft(quadro_fft, obter_espectro_template(chave, "cor", quadro_fft["tamanho_fft"]), confianca)
+
+    if estrategia == "roi":
+        # Região ao redor da última posição conhecida (de quadros anteriores); sem acerto lá, tela inteira.
+        _, template = obter_ancora(chave)
+        if regiao is not None:
+            left, top, largura, altura = regiao
+            centro, pontuacao = buscar_template(quadro[top:top + altura, left:left + largura], template, confianca)
+            if centro is not None:
+                return (centro[0] + left, centro[1] + top), pontuacao
+        return buscar_template(quadro, template, confianca)
+
+    quadro_cinza = converter_para_cinza(quadro)
+    if estrategia == "cinza":
+        return buscar_template(quadro_cinza, obter_template_cinza(chave), confianca)
+
+    piramide_template = obter_piramide_template(chave, niveis)
+    piramide_tela = construir_piramide(quadro_cinza, len(piramide_template) - 1)
+    return buscar_template_piramide(quadro_cinza, piramide_template, confianca, piramide_tela=piramide_tela)
+
+
+def _classificar(centro: Optional[Tuple[int, int]], esperado: Any) -> Optional[str]:
+    """
+    Função interna: compara o resultado com o gabarito.
+
+    Returns:
+        Optional[str]: "acerto", "falso_positivo", "falha", "rejeicao_correta" ou None (sem gabarito).
+    """
+    if esperado is _SEM_GABARITO:
+        return None
+    if esperado is None:
+        return "falso_positivo" if centro is not None else "rejeicao_correta"
+    if centro is None:
+        return "falha"
+    distancia = max(abs(centro[0] - esperado[0]), abs(centro[1] - esperado[1]))
+    return "acerto" if distancia <= TOLERANCIA_GABARITO else "falso_positivo"
+
+
+def _resumir_amostras(valores: List[float], casas: int = 3) -> Dict[str, float]:
+    """Função interna: p50/p95/mín./máx. de uma lista de amostras (vazia -> dicionário vazio)."""
+    if not valores:
+        return {}
+    return {
+        "p50": round(float(np.percentile(valores, 50)), casas),
+        "p95": round(float(np.percentile(valores, 95)), casas),
+        "min": round(float(min(valores)), casas),
+        "max": round(float(max(valores)), casas),
+    }
+
+
+def executar_benchmark(caminho_gravacao: str, gabarito: Dict[str, Dict[str, Any]] = None,
+                       estrategias: List[str] = ESTRATEGIAS, confianca: float = 0.9,
+                       repeticoes: int = 3, margem: int = 150, niveis: int = 2,
+                       chaves: List[str] = None) -> Dict[str, Any]:
+    """
+    Executa o benchmark de todas as âncoras sobre todos os quadros da gravação.
+
+    Args:
+        caminho_gravacao (str): Pasta ou .zip com os quadros PNG.
+        gabarito (Dict, optional): {quadro: {chave: [x, y] ou None}} com as posições esperadas.
+        estrategias (List[str], optional): Estratégias a medir (subconjunto de `ESTRATEGIAS`).
+        confianca (float, optional): Confiança mínima usada em todas as buscas.
+        repeticoes (int, optional): Quantas vezes cada busca é cronometrada por quadro.
+        margem (int, optional): Margem (px) da estratégia "roi".
+        niveis (int, optional): Máximo de níveis da estratégia "piramide".
+        chaves (List[str], optional): Âncoras a medir (padrão: todas as do `parametros.json`).
+
+    Returns:
+        Dict[str, Any]: Resultado completo (por estratégia e por âncora), pronto para JSON.
+    """
+    gabarito = gabarito or {}
+    total_quadros = reproducao_tela.carregar_gravacao(caminho_gravacao)
+    chaves_a_medir = chaves or listar_chaves()
+
+    # Âncoras sem imagem em disco não podem ser medidas; ficam listadas à parte.
+    chaves_validas, chaves_ignoradas = [], {}
+    for chave in chaves_a_medir:
+        try:
+            obter_ancora(chave)
+            chaves_validas.append(chave)
+        except (KeyError, FileNotFoundError) as e:
+            chaves_ignoradas[chave] = str(e)
+
+    resultado_estrategias = {}
+    for estrategia in estrategias:
+        memoria_posicoes.esquecer_posicao()
+        amostras = {chave: {"latencias": [], "pontuacoes": [], "pontuacoes_encontrado": [], "contagens": {}} for chave in chaves_validas}
+
+        for nome_quadro in reproducao_tela.listar_quadros():
+            reproducao_tela.selecionar_quadro(nome_quadro)
+            quadro = reproducao_tela.capturar_quadro()
+            gabarito_quadro = gabarito.get(nome_quadro, {})
+
+            for chave in chaves_validas:
+                # Na "roi", a região vem só dos quadros anteriores: todas as repetições partem do mesmo
+                # estado (a primeira não transforma as seguintes em acertos na região por construção).
+                regiao = None
+                if estrategia == "roi":
+                    altura_tela, largura_tela = quadro.shape[:2]
+                    regiao = memoria_posicoes.calcular_regiao_busca(chave, margem, largura_tela, altura_tela)
+
+                resultados = []
+                for _ in range(repeticoes):
+                    inicio = time.perf_counter()
+                    resultados.append(_buscar(estrategia, quadro, chave, confianca, regiao, niveis))
+                    amostras[chave]["latencias"].append((time.perf_counter() - inicio) * 1000)
+
+                # As repetições são determinísticas; classifica-se a primeira.
+                centro, pontuacao = resultados[0]
+                if estrategia == "roi" and centro is not None:
+                    memoria_posicoes.memorizar_posicao(chave, centro, obter_ancora(chave)[1].shape)
+
+                amostras[chave]["pontuacoes"].append(pontuacao)
+                if centro is not None:
+                    amostras[chave]["pontuacoes_encontrado"].append(pontuacao)
+                classe = _classificar(centro, gabarito_quadro.get(chave, _SEM_GABARITO))
+                if classe is not None:
+                    amostras[chave]["contagens"][classe] = amostras[chave]["contagens"].get(classe, 0) + 1
+
+        # Consolida por âncora e no total da estratégia.
+        por_ancora, todas_latencias, totais = {}, [], {}
+        for chave, dados in amostras.items():
+            por_ancora[chave] = {
+                "latencia_ms": _resumir_amostras(dados["latencias"]),
+                "pontuacao": _resumir_amostras(dados["pontuacoes"]),
+                "encontrado": len(dados["pontuacoes_encontrado"]),
+                # Folga da pior correspondência aceite em relação à confiança (perto de 0 = âncora frágil).
+                "margem_confianca": round(min(dados["pontuacoes_encontrado"]) - confianca, 3) if dados["pontuacoes_encontrado"] else None,
+                **dados["contagens"],
+            }
+            todas_latencias.extend(dados["latencias"])
+            for classe, quantidade in dados["contagens"].items():
+                totais[classe] = totais.get(classe, 0) + quantidade
+
+        resultado_estrategias[estrategia] = {
+            "resumo": {"latencia_ms": _resumir_amostras(todas_latencias), **totais},
+            "ancoras": por_ancora,
+        }
+
+    reproducao_tela.descarregar_gravacao()
+    return {
+        "gravacao": str(Path(caminho_gravacao).resolve()),
+        "quadros": total_quadros,
+        "confianca": confianca,
+        "repeticoes": repeticoes,
+        "com_gabarito": bool(gabarito),
+        "ancoras_ignoradas": chaves_ignoradas,
+        "estrategias": resultado_estrategias,
+    }
+
+
+def _imprimir_resumo(resultado: Dict[str, Any]):
+    """Função interna: imprime uma tabela curta (por estratégia) no terminal."""
+    print(f"\n>>> {resultado['quadros']} quadro(s), confiança {resultado['confianca']}")
+    for estrategia, dados in resultado["estrategias"].items():
+        latencia = dados["resumo"]["latencia_ms"]
+        contagens = {k: v for k, v in dados["resumo"].items() if k != "latencia_ms"}
+        print(f"   - {estrategia:<13} p50 {latencia.get('p50', 0):8.2f} ms | p95 {latencia.get('p95', 0):8.2f} ms | {contagens or 'sem gabarito'}")
+
+
+def principal(argumentos: List[str] = None):
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description="Benchmark da localização de âncoras sobre telas gravadas.")
+    parser.add_argument("gravacao", help="Pasta ou .zip com os quadros PNG gravados.")
+    parser.add_argument("--gabarito", help="JSON {quadro: {chave: [x, y] ou null}} com as posições esperadas.")
+    parser.add_argument("--saida", default=str(CAMINHO_SAIDA_PADRAO), help="Arquivo JSON de resultado ('-' = stdout).")
+    parser.add_argument("--estrategias", nargs="+", choices=ESTRATEGIAS, default=list(ESTRATEGIAS))
+    parser.add_argument("--chaves", nargs="+", help="Âncoras a medir (padrão: todas).")
+    parser.add_argument("--confianca", type=float, default=0.9)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--margem", type=int, default=150, help="Margem (px) da estratégia 'roi'.")
+    parser.add_argument("--niveis", type=int, default=2, help="Níveis máximos da estratégia 'piramide'.")
+    args = parser.parse_args(argumentos)
+
+    gabarito = None
+    if args.gabarito:
+        with open(args.gabarito, 'r', encoding='utf-8') as f:
+            gabarito = json.load(f)
+
+    resultado = executar_benchmark(
+        args.gravacao, gabarito, args.estrategias, args.confianca,
+        args.repeticoes, args.margem, args.niveis, args.chaves,
+    )
+
+    if args.saida == "-":
+        print(json.dumps(resultado, indent=2, ensure_ascii=False))
+        return
+    caminho_saida = Path(args.saida)
+    caminho_saida.parent.mkdir(parents=True, exist_ok=True)
+    with open(caminho_saida, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, indent=2, ensure_ascii=False)
+    _imprimir_resumo(resultado)
+    print(f"\n✔ Resultado completo guardado em {caminho_saida}")
+
+
+if __name__ == '__main__':
+    principal()
@@ -0,0 +1,125 @@
+# uteis/cache_localizacao.py
+
+"""
+Módulo Cache de Localização (resultado da busca por âncora + impressão digital da tela).
+
+Guarda, por chave, o último resultado positivo da busca junto com uma "impressão digital"
+barata da região da tela onde a âncora estava (hash de uma versão reduzida da captura).
+Enquanto a impressão digital da região não mudar, a posição guardada é devolvida sem
+executar o template matching. Quando muda, a entrada é invalidada.
+"""
+
+import hashlib
+import threading
+import numpy as np
+from typing import Dict, Any, Optional, Tuple
+
+# Passo da amostragem usada na impressão digital (1 pixel a cada N em cada eixo).
+PASSO_AMOSTRAGEM = 2
+
+# --- Estado do Cache ---
+_CACHE: Dict[str, Tuple] = {}
+_ESTATISTICAS = {"acertos": 0, "invalidacoes": 0}
+_TRAVA_CACHE = threading.Lock()
+
+
+def calcular_impressao_digital(imagem: np.ndarray) -> bytes:
+    """
+    Calcula uma impressão digital barata de uma imagem: hash BLAKE2 de uma versão amostrada.
+
+    Args:
+        imagem (np.ndarray): A captura (ou recorte) da tela.
+
+    Returns:
+        bytes: O hash (16 bytes) que identifica o conteúdo da imagem.
+    """
+    amostra = np.ascontiguousarray(imagem[::PASSO_AMOSTRAGEM, ::PASSO_AMOSTRAGEM])
+    resumo = hashlib.blake2b(amostra.tobytes(), digest_size=16)
+    resumo.update(str(amostra.shape).encode())
+    return resumo.digest()
+
+
+def consultar_cache(nome_chave: str, regiao: Tuple[int, int, int, int], impressao: bytes,
+                    contexto: Tuple) -> Optional[Tuple[Tuple[int, int], float]]:
+    """
+    Consulta o resultado guardado de uma âncora para a região e impressão digital atuais.
+
+    Args:
+        nome_chave (str): A chave da âncora.
+        regiao (Tuple[int, int, int, int]): A região da tela que foi capturada.
+        impressao (bytes): A impressão digital da captura dessa região.
+        contexto (Tuple): Parâmetros que também precisam coincidir (ex: confiança, modo de busca).
+
+    Returns:
+        Optional[Tuple[Tuple[int, int], float]]: (centro, pontuação) guardados, ou None se não
+        houver entrada válida. Se a impressão digital mudou, a entrada é invalidada.
+    """
+    with _TRAVA_CACHE:
+        entrada = _CACHE.get(nome_chave)
+        if entrada is None:
+            return None
+
+        regiao_guardada, impressao_guardada, contexto_guardado, centro, pontuacao = entrada
+        if regiao_guardada != regiao or contexto_guardado != contexto:
+            return None
+
+        # A tela mudou nesta região: o resultado guardado deixa de valer.
+        if impressao_guardada != impressao:
+            del _CACHE[nome_chave]
+            _ESTATISTICAS["invalidacoes"] += 1
+            return None
+
+        _ESTATISTICAS["acertos"] += 1
+        return centro, pontuacao
+
+
+def guardar_cache(nome_chave: str, regiao: Tuple[int, int, int, int], impressao: bytes,
+                  contexto: Tuple, centro: Tuple[int, int], pontuacao: float):
+    """Guarda o resultado positivo de uma busca junto com a impressão digital da região."""
+    with _TRAVA_CACHE:
+        _CACHE[nome_chave] = (regiao, impressao, contexto, centro, pontuacao)
+
+
+def invalidar_cache(nome_chave: str = None):
+    """Invalida o cache de uma âncora (ou de todas, se nenhuma chave for informada)."""
+    with _TRAVA_CACHE:
+        if nome_chave is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(nome_chave, None)
+
+
+def obter_estatisticas_cache() -> Dict[str, Any]:
+    """Retorna quantas buscas foram evitadas pelo cache e quantas entradas foram invalidadas."""
+    with _TRAVA_CACHE:
+        return dict(_ESTATISTICAS)
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar o cache de localização sem depender da tela.
+    Execute a partir da raiz: python -m uteis.cache_localizacao
+    """
+    print(">>> Iniciando teste do cache de localização...")
+
+    regiao_teste = (10, 10, 200, 100)
+    recorte = np.zeros((100, 200, 3), dtype=np.uint8)
+    impressao_original = calcular_impressao_digital(recorte)
+    guardar_cache("teste", regiao_teste, impressao_original, (0.9, "cor"), (110, 60), 0.99)
+
+    resultado = consultar_cache("teste", regiao_teste, calcular_impressao_digital(recorte), (0.9, "cor"))
+    print(f"--- Mesma tela: {resultado} (Esperado: ((110, 60), 0.99))")
+    assert resultado == ((110, 60), 0.99), "Teste 1 Falhou"
+
+    recorte[50, 50] = 255
+    resultado = consultar_cache("teste", regiao_teste, calcular_impressao_digital(recorte), (0.9, "cor"))
+    print(f"--- Tela alterada: {resultado} (Esperado: None)")
+    assert resultado is None, "Teste 2 Falhou"
+
+    resultado = consultar_cache("teste", regiao_teste, impressao_original, (0.9, "cor"))
+    print(f"--- Após invalidação: {resultado} (Esperado: None)")
+    assert resultado is None, "Teste 3 Falhou"
+
+    print(f"--- Estatísticas: {obter_estatisticas_cache()}")
+    print("\n--- Teste concluído com SUCESSO! ---")
@@ -0,0 +1,247 @@
+# uteis/compilador_assets.py
+
+"""
+Módulo Compilador de Assets (pacote pré-processado das imagens de âncora).
+
+Compila as imagens referenciadas no `parametros.json` num único ficheiro binário em
+`temp/` (o "pacote"), com os arrays já decodificados: colorido (BGR), tons de cinza e
+os níveis da pirâmide. Um manifesto JSON guarda, por imagem, o hash do conteúdo
+(sha256), o tamanho, o mtime e a posição de cada array dentro do pacote. Só as imagens
+cujo conteúdo mudou são decodificadas de novo; as outras são copiadas do pacote anterior.
+No arranque, o registro de âncoras mapeia o pacote em memória (`np.memmap`) em vez de
+decodificar cada PNG.
+
+Cada compilação grava um pacote com nome próprio (`ancoras_compiladas_<id>.bin`), apontado pelo
+manifesto: o pacote anterior pode continuar mapeado por este processo (no Windows, um ficheiro
+mapeado não pode ser substituído) e só é apagado numa compilação seguinte, quando já não estiver.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+import numpy as np
+import cv2
+from pathlib import Path
+from typing import Dict, Any, Optional
+from uteis.correspondencia_imagem import converter_para_cinza, calcular_niveis_piramide, construir_piramide
+
+# 1. Define os caminhos: `parametros.json` e os ficheiros do pacote em `temp/`.
+CAMINHO_PROJETO = Path(__file__).resolve().parent.parent
+CAMINHO_JSON = CAMINHO_PROJETO / "parametros.json"
+CAMINHO_PASTA_PACOTES = CAMINHO_PROJETO / "temp"
+PADRAO_PACOTES = "ancoras_compiladas*.bin"  # Pacotes desta e das compilações anteriores.
+CAMINHO_MANIFESTO = CAMINHO_PROJETO / "temp" / "ancoras_compiladas.json"
+
+# O pacote começa com o identificador da compilação (o mesmo do manifesto), para detectar
+# um par pacote/manifesto de compilações diferentes. Cada array fica alinhado a 64 bytes.
+TAMANHO_CABECALHO = 16
+ALINHAMENTO = 64
+
+# --- Estado do Pacote Mapeado (process-wide) ---
+_PACOTE: Optional[Dict[str, Dict[str, Any]]] = None
+_MTIME_MANIFESTO = None
+_TRAVA_PACOTE = threading.Lock()
+
+
+def decodificar_imagem(caminho_imagem: Path) -> np.ndarray:
+    """
+    Decodifica um PNG para um array BGR (3 canais), igual ao que o PyScreeze usa.
+
+    Usa `np.fromfile` + `cv2.imdecode` para suportar caminhos com acentos no Windows.
+    """
+    buffer = np.fromfile(str(caminho_imagem), dtype=np.uint8)
+    imagem = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+    if imagem is None:
+        raise ValueError(f"Não foi possível decodificar a imagem: {caminho_imagem}")
+    return imagem
+
+
+def _calcular_hash(caminho_imagem: Path) -> str:
+    """Função interna: sha256 do conteúdo do ficheiro."""
+    return hashlib.sha256(caminho_imagem.read_bytes()).hexdigest()
+
+
+def _ler_manifesto() -> Dict[str, Any]:
+    """Função interna: lê o manifesto atual (vazio se não existir ou estiver corrompido)."""
+    try:
+        with open(CAMINHO_MANIFESTO, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _mapear_pacote(manifesto: Dict[str, Any]) -> Optional[np.memmap]:
+    """Função interna: mapeia o pacote do manifesto em memória (só leitura) se o cabeçalho bater com ele."""
+    if not manifesto.get("pacote"):
+        return None
+    try:
+        pacote = np.memmap(CAMINHO_PASTA_PACOTES / manifesto["pacote"], dtype=np.uint8, mode='r')
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+    if bytes(pacote[:TAMANHO_CABECALHO]).hex() != manifesto.get("id"):
+        return None
+    return pacote
+
+
+def _ler_array(pacote: np.memmap, descricao: Dict[str, Any]) -> np.ndarray:
+    """Função interna: vista (sem cópia) de um array do pacote a partir do deslocamento e formato."""
+    tamanho = int(np.prod(descricao["formato"]))
+    return pacote[descricao["deslocamento"]:descricao["deslocamento"] + tamanho].reshape(descricao["formato"])
+
+
+def _remover_pacotes_antigos(nome_atual: str):
+    """
+    Função interna: apaga os pacotes de compilações anteriores.
+
+    Um pacote ainda mapeado (no Windows) não pode ser apagado: fica para a próxima compilação.
+    """
+    for caminho in CAMINHO_PASTA_PACOTES.glob(PADRAO_PACOTES):
+        if caminho.name == nome_atual:
+            continue
+        try:
+            caminho.unlink()
+        except OSError:
+            pass
+
+
+def compilar_assets(niveis_piramide: int) -> Dict[str, int]:
+    """
+    Compila (incrementalmente) as imagens do `parametros.json` no pacote em `temp/`.
+
+    Imagens com o mesmo tamanho e mtime do manifesto nem chegam a ser lidas; se só o mtime
+    mudou, o hash decide. O pacote só é reescrito se alguma imagem mudou, entrou ou saiu.
+
+    Args:
+        niveis_piramide (int): Máximo de níveis reduzidos da pirâmide a guardar por imagem.
+
+    Returns:
+        Dict[str, int]: {"total": imagens no pacote, "recompiladas": imagens decodificadas de novo}.
+    """
+    # 1. Lê o JSON de âncoras e o manifesto (e o pacote) da compilação anterior.
+    with open(CAMINHO_JSON, 'r', encoding='utf-8') as f:
+        ancoras = json.load(f)
+    manifesto_antigo = _ler_manifesto()
+    imagens_antigas = manifesto_antigo.get("imagens", {})
+    if manifesto_antigo.get("niveis_piramide") != niveis_piramide:
+        imagens_antigas = {}
+    pacote_antigo = _mapear_pacote(manifesto_antigo) if imagens_antigas else None
+
+    # 2. Decide, imagem a imagem, se reaproveita os arrays antigos ou decodifica o PNG de novo.
+    caminhos = sorted({dados.get("path") for dados in ancoras.values() if dados.get("path")})
+    entradas, arrays, recompiladas, alterado = {}, {}, 0, False
+    for caminho_relativo in caminhos:
+        caminho_absoluto = CAMINHO_PROJETO / caminho_relativo
+        if not caminho_absoluto.exists():
+            continue
+        estado = caminho_absoluto.stat()
+        antiga = imagens_antigas.get(caminho_relativo)
+        mesma_data = antiga is not None and antiga["tamanho"] == estado.st_size and antiga["mtime_ns"] == estado.st_mtime_ns
+        sha256 = antiga["sha256"] if mesma_data else _calcular_hash(caminho_absoluto)
+
+        if pacote_antigo is not None and antiga is not None and antiga["sha256"] == sha256:
+            arrays[caminho_relativo] = {nome: _ler_array(pacote_antigo, descricao) for nome, descricao in antiga["arrays"].items()}
+            alterado = alterado or not mesma_data
+        else:
+            cor = decodificar_imagem(caminho_absoluto)
+            cinza = converter_para_cinza(cor)
+            piramide = construir_piramide(cinza, calcular_niveis_piramide(cinza.shape, niveis_piramide))
+            arrays[caminho_relativo] = {"cor": cor, "cinza": cinza, **{f"piramide_{nivel}": imagem for nivel, imagem in enumerate(piramide) if nivel > 0}}
+            recompiladas += 1
+            alterado = True
+        entradas[caminho_relativo] = {"sha256": sha256, "tamanho": estado.st_size, "mtime_ns": estado.st_mtime_ns}
+
+    # 3. Nada mudou (nem imagens removidas): mantém o pacote atual (que pode estar mapeado).
+    if not alterado and set(entradas) == set(imagens_antigas) and pacote_antigo is not None:
+        return {"total": len(entradas), "recompiladas": 0}
+
+    # 4. Escreve o novo pacote (cabeçalho + arrays alinhados) num ficheiro com o nome da compilação:
+    #    o pacote atual, talvez mapeado por este processo, não é tocado.
+    identificador = uuid.uuid4().bytes
+    nome_pacote = f"ancoras_compiladas_{identificador.hex()}.bin"
+    CAMINHO_PASTA_PACOTES.mkdir(parents=True, exist_ok=True)
+    with open(CAMINHO_PASTA_PACOTES / nome_pacote, 'wb') as f:
+        f.write(identificador)
+        for caminho_relativo, arrays_imagem in arrays.items():
+            descricoes = {}
+            for nome, array in arrays_imagem.items():
+                f.write(b"\0" * (-f.tell() % ALINHAMENTO))
+                descricoes[nome] = {"deslocamento": f.tell(), "formato": list(array.shape)}
+                f.write(np.ascontiguousarray(array, dtype=np.uint8).tobytes())
+            entradas[caminho_relativo]["arrays"] = descricoes
+    del pacote_antigo, arrays
+
+    # 5. Publica o manifesto (troca atómica) a apontar para o novo pacote e apaga os antigos que puder.
+    manifesto = {"id": identificador.hex(), "pacote": nome_pacote, "niveis_piramide": niveis_piramide, "imagens": entradas}
+    caminho_manifesto_temporario = CAMINHO_MANIFESTO.with_suffix(".json.tmp")
+    with open(caminho_manifesto_temporario, 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, indent=2, ensure_ascii=False)
+    os.replace(caminho_manifesto_temporario, CAMINHO_MANIFESTO)
+    _remover_pacotes_antigos(nome_pacote)
+    return {"total": len(entradas), "recompiladas": recompiladas}
+
+
+def carregar_pacote() -> Dict[str, Dict[str, Any]]:
+    """
+    Mapeia o pacote compilado em memória (uma vez por compilação) e devolve os arrays por imagem.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: {caminho_relativo: {"tamanho", "mtime_ns", "niveis_piramide",
+        "cor", "cinza", "piramide": [nível 0 (= cinza), nível 1, ...]}}. Vazio se não houver
+        pacote válido (o registro decodifica então os PNGs, como antes).
+    """
+    global _PACOTE, _MTIME_MANIFESTO
+    with _TRAVA_PACOTE:
+        # 1. Só remapeia se o manifesto mudou desde a última carga.
+        try:
+            mtime_atual = CAMINHO_MANIFESTO.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if mtime_atual == _MTIME_MANIFESTO:
+            return _PACOTE
+
+        # 2. Mapeia o pacote e monta as vistas dos arrays de cada imagem (nenhum dado é copiado).
+        manifesto = _ler_manifesto()
+        pacote = _mapear_pacote(manifesto)
+        imagens = {}
+        if pacote is not None:
+            for caminho_relativo, entrada in manifesto["imagens"].items():
+                vistas = {nome: _ler_array(pacote, descricao) for nome, descricao in entrada["arrays"].items()}
+                niveis = sorted(int(nome.split("_")[1]) for nome in vistas if nome.startswith("piramide_"))
+                imagens[caminho_relativo] = {
+                    "tamanho": entrada["tamanho"], "mtime_ns": entrada["mtime_ns"],
+                    "niveis_piramide": manifesto["niveis_piramide"],
+                    "cor": vistas["cor"], "cinza": vistas["cinza"],
+                    "piramide": [vistas["cinza"]] + [vistas[f"piramide_{nivel}"] for nivel in niveis],
+                }
+        _PACOTE, _MTIME_MANIFESTO = imagens, mtime_atual
+        return _PACOTE
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para compilar o pacote de âncoras manualmente e conferir o resultado.
+    Execute a partir da raiz: python -m uteis.compilador_assets
+    """
+    import time
+
+    print(">>> Iniciando compilação dos assets...")
+
+    inicio = time.perf_counter()
+    estatisticas = compilar_assets(2)
+    print(f"--- Compilação: {estatisticas} em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    inicio = time.perf_counter()
+    estatisticas = compilar_assets(2)
+    print(f"--- Recompilação sem mudanças: {estatisticas} em {(time.perf_counter() - inicio) * 1000:.1f} ms (Esperado: 0 recompiladas)")
+    assert estatisticas["recompiladas"] == 0, "Teste 1 Falhou"
+
+    pacote = carregar_pacote()
+    caminho, imagem = next(iter(pacote.items()))
+    original = decodificar_imagem(CAMINHO_PROJETO / caminho)
+    print(f"--- '{caminho}': {imagem['cor'].shape} | {len(imagem['piramide'])} nível(is) de pirâmide | igual ao PNG: {np.array_equal(imagem['cor'], original)}")
+    assert np.array_equal(imagem["cor"], original), "Teste 2 Falhou"
+
+    print("\n--- Teste concluído com SUCESSO! ---")
@@ -0,0 +1,467 @@
+# uteis/correspondencia_imagem.py
+
+"""
+Módulo com a lógica pura de correspondência de templates (template matching).
+
+Não captura a tela nem lê arquivos: recebe arrays já em memória (o quadro da tela
+e o template da âncora) e devolve onde o template foi encontrado e com que pontuação.
+"""
+
+import numpy as np
+import cv2
+from concurrent.futures import Executor
+from typing import Dict, Any, List, Optional, Tuple
+
+# Modos de busca suportados (globalmente ou por âncora no parametros.json).
+MODOS_BUSCA = ("cor", "cinza", "piramide")
+
+# Menor lado (em pixels) que um template pode ter num nível reduzido da pirâmide.
+TAMANHO_MINIMO_NIVEL = 8
+
+# Mínimo de linhas do mapa de resultado por faixa na busca paralela (abaixo disso não compensa dividir).
+LINHAS_MINIMAS_FAIXA = 64
+
+# Motores de correspondência: domínio espacial (cv2.matchTemplate) ou frequência (FFT com espectros em cache).
+MOTORES_CORRESPONDENCIA = ("auto", "espacial", "fft")
+
+# Constantes do modelo de custo usado pelo motor "auto" (nanossegundos por operação, medidos numa
+# estação de trabalho típica; só a razão entre elas importa para a escolha).
+CUSTO_NS_ESPACIAL = 0.27      # Por posição x pixel do template x canal (cv2.matchTemplate).
+CUSTO_NS_FFT = 0.32           # Por ponto x log2(pontos) de cada transformada.
+CUSTO_NORMALIZACAO_FFT = 72   # Normalização (filtros de caixa) por ponto, em "unidades" de transformada.
+
+# Variância mínima (por pixel e canal) para uma janela da tela não ser considerada "lisa" no motor FFT.
+VARIANCIA_MINIMA_JANELA = 1.0
+
+# Escalas tela/template testadas na detecção da escala (escala do Windows a 100-200% e templates
+# capturados a 125%/150% usados numa tela a 100%). A 1.0 vem primeiro: é o caso comum e o mais barato.
+ESCALAS_CANDIDATAS = (1.0, 1.25, 1.5, 1.75, 2.0, 0.8, 0.67)
+
+
+def buscar_template(imagem_tela: np.ndarray, template: np.ndarray, confianca: float) -> Tuple[Optional[Tuple[int, int]], float]:
+    """
+    Procura um template dentro de uma imagem e retorna o centro da melhor correspondência.
+
+    Usa `cv2.matchTemplate` com `TM_CCOEFF_NORMED` (o mesmo método do PyScreeze quando o
+    argumento `confidence` é usado), mas devolve também a pontuação da melhor posição,
+    mesmo quando ela fica abaixo da confiança pedida.
+
+    Args:
+        imagem_tela (np.ndarray): A imagem onde procurar (ex: o quadro capturado da tela).
+        template (np.ndarray): A imagem da âncora, no mesmo formato de cor da `imagem_tela`.
+        confianca (float): Pontuação mínima (0 a 1) para considerar o template encontrado.
+
+    Returns:
+        Tuple[Optional[Tuple[int, int]], float]:
+            - O centro (x, y) da correspondência, relativo à `imagem_tela`, ou None se a
+              melhor pontuação ficar abaixo da `confianca`.
+            - A melhor pontuação encontrada (0.0 se o template não couber na imagem).
+    """
+    # 1. Se o template for maior que a imagem, não há onde procurar.
+    altura_t, largura_t = template.shape[:2]
+    altura_i, largura_i = imagem_tela.shape[:2]
+    if altura_t > altura_i or largura_t > largura_i:
+        return None, 0.0
+
+    # 2. Calcula o mapa de correlação normalizada e obtém o ponto de máximo.
+    resultado = cv2.matchTemplate(imagem_tela, template, cv2.TM_CCOEFF_NORMED)
+    _, pontuacao_maxima, _, (left, top) = cv2.minMaxLoc(resultado)
+
+    # 3. Abaixo da confiança: devolve apenas a pontuação (útil para diagnóstico).
+    if pontuacao_maxima < confianca:
+        return None, float(pontuacao_maxima)
+
+    # 4. Converte o canto superior esquerdo no centro do template (mesma regra do PyScreeze).
+    return (left + largura_t // 2, top + altura_t // 2), float(pontuacao_maxima)
+
+
+def buscar_template_paralelo(imagem_tela: np.ndarray, template: np.ndarray, confianca: float,
+                             executor: Optional[Executor], num_faixas: int) -> Tuple[Optional[Tuple[int, int]], float]:
+    """
+    Igual a `buscar_template`, mas divide a imagem em faixas horizontais comparadas em paralelo.
+
+    Cada faixa inclui as `altura_template - 1` linhas seguintes, para que nenhuma posição fique
+    de fora; o resultado é o mesmo da busca numa só passagem. O `cv2.matchTemplate` liberta o GIL,
+    por isso as faixas correm realmente em paralelo num pool de threads.
+
+    Args:
+        imagem_tela (np.ndarray): A imagem onde procurar (ex: o quadro capturado da tela).
+        template (np.ndarray): A imagem da âncora, no mesmo formato de cor da `imagem_tela`.
+        confianca (float): Pontuação mínima (0 a 1) para considerar o template encontrado.
+        executor (Optional[Executor]): O pool de threads (None = busca numa só passagem).
+        num_faixas (int): Em quantas faixas dividir a imagem (normalmente o número de threads).
+
+    Returns:
+        Tuple[Optional[Tuple[int, int]], float]: Mesmo contrato de `buscar_template`.
+    """
+    # 1. Template maior que a imagem, sem pool ou imagem pequena: busca normal.
+    altura_t, largura_t = template.shape[:2]
+    altura_i, largura_i = imagem_tela.shape[:2]
+    if altura_t > altura_i or largura_t > largura_i:
+        return None, 0.0
+    linhas_resultado = altura_i - altura_t + 1
+    num_faixas = min(num_faixas, linhas_resultado // LINHAS_MINIMAS_FAIXA)
+    if executor is None or num_faixas <= 1:
+        return buscar_template(imagem_tela, template, confianca)
+
+    # 2. Compara cada faixa (com sobreposição da altura do template) numa thread do pool.
+    passo = -(-linhas_resultado // num_faixas)
+
+    def _comparar_faixa(inicio: int) -> Tuple[float, int, int]:
+        fim = min(linhas_resultado, inicio + passo)
+        faixa = imagem_tela[inicio:fim + altura_t - 1]
+        resultado = cv2.matchTemplate(faixa, template, cv2.TM_CCOEFF_NORMED)
+        _, pontuacao, _, (left, top) = cv2.minMaxLoc(resultado)
+        return pontuacao, left, top + inicio
+
+    resultados = list(executor.map(_comparar_faixa, range(0, linhas_resultado, passo)))
+
+    # 3. Fica com a melhor faixa (em empate, a de cima, como faria a busca numa só passagem).
+    pontuacao_maxima, left, top = max(resultados, key=lambda r: r[0])
+    if pontuacao_maxima < confianca:
+        return None, float(pontuacao_maxima)
+    return (left + largura_t // 2, top + altura_t // 2), float(pontuacao_maxima)
+
+
+#=========================================================================================================
+
+def calcular_tamanho_fft(tamanho_imagem: Tuple[int, int]) -> Tuple[int, int]:
+    """Tamanho (altura, largura) da transformada para uma imagem: o menor tamanho "rápido" do OpenCV que a contém."""
+    return cv2.getOptimalDFTSize(tamanho_imagem[0]), cv2.getOptimalDFTSize(tamanho_imagem[1])
+
+
+def _separar_canais_float(imagem: np.ndarray) -> List[np.ndarray]:
+    """Função interna: separa os canais de uma imagem em arrays float32."""
+    canais = cv2.split(imagem) if imagem.ndim == 3 else [imagem]
+    return [canal.astype(np.float32) for canal in canais]
+
+
+def _transformar(canal: np.ndarray, tamanho_fft: Tuple[int, int]) -> np.ndarray:
+    """Função interna: DFT real (formato CCS compacto) de um canal, preenchido com zeros até `tamanho_fft`."""
+    preenchido = np.zeros(tamanho_fft, dtype=np.float32)
+    preenchido[:canal.shape[0], :canal.shape[1]] = canal
+    return cv2.dft(preenchido, nonzeroRows=canal.shape[0])
+
+
+def calcular_espectro_template(template: np.ndarray, tamanho_fft: Tuple[int, int]) -> Dict[str, Any]:
+    """
+    Pré-calcula o que o motor FFT precisa do template (feito uma vez por âncora e tamanho de tela).
+
+    Returns:
+        Dict[str, Any]: {"espectros": DFT de cada canal do template sem a média, "norma": raiz da soma
+        dos quadrados do template sem a média, "tamanho": shape[:2] do template}.
+    """
+    canais = [canal - canal.mean() for canal in _separar_canais_float(template)]
+    return {
+        "espectros": [_transformar(canal, tamanho_fft) for canal in canais],
+        "norma": float(np.sqrt(sum(float(np.square(canal, dtype=np.float64).sum()) for canal in canais))),
+        "tamanho": template.shape[:2],
+    }
+
+
+def preparar_quadro_fft(imagem: np.ndarray) -> Dict[str, Any]:
+    """
+    Pré-calcula o que o motor FFT precisa da imagem da tela (uma vez por quadro, partilhado entre âncoras).
+
+    A média de cada canal é subtraída antes da transformada: não muda a correlação com um template
+    de média zero, mas reduz o erro numérico em float32.
+
+    Returns:
+        Dict[str, Any]: {"tamanho_fft", "espectros" (por canal), "centrado" (canais sem a média),
+        "quadrado" (soma dos quadrados dos canais centrados), "tamanho"}.
+    """
+    tamanho_fft = calcular_tamanho_fft(imagem.shape[:2])
+    canais = [canal - canal.mean() for canal in _separar_canais_float(imagem)]
+    return {
+        "tamanho_fft": tamanho_fft,
+        "espectros": [_transformar(canal, tamanho_fft) for canal in canais],
+        "centrado": canais,
+        "quadrado": sum(np.square(canal) for canal in canais),
+        "tamanho": imagem.shape[:2],
+    }
+
+
+def buscar_template_fft(quadro_fft: Dict[str, Any], espectro_template: Dict[str, Any],
+                        confianca: float) -> Tuple[Optional[Tuple[int, int]], float]:
+    """
+    Procura um template pela correlação cruzada normalizada calculada no domínio da frequência.
+
+    Equivale a `cv2.matchTemplate(..., TM_CCOEFF_NORMED)`: o numerador vem do produto dos espectros
+    (um só inverso para todos os canais) e o denominador de somas por janela (filtros de caixa).
+    Janelas "lisas" (sem variação) recebem pontuação 0.
+
+    Args:
+        quadro_fft (Dict[str, Any]): A tela preparada por `preparar_quadro_fft`.
+        espectro_template (Dict[str, Any]): O template preparado por `calcular_espectro_template`
+                                            (com o mesmo `tamanho_fft` do quadro).
+        confianca (float): Pontuação mínima (0 a 1) para considerar o template encontrado.
+
+    Returns:
+        Tuple[Optional[Tuple[int, int]], float]: Mesmo contrato de `buscar_template`.
+    """
+    # 1. Template maior que a imagem (ou sem variação nenhuma): não há o que procurar.
+    altura_t, largura_t = espectro_template["tamanho"]
+    altura_i, largura_i = quadro_fft["tamanho"]
+    if altura_t > altura_i or largura_t > largura_i or espectro_template["norma"] == 0:
+        return None, 0.0
+    linhas, colunas = altura_i - altura_t + 1, largura_i - largura_t + 1
+
+    # 2. Numerador: soma dos produtos de espectros de todos os canais e UMA transformada inversa.
+    produto = None
+    for espectro_tela, espectro_tpl in zip(quadro_fft["espectros"], espectro_template["espectros"]):
+        parcial = cv2.mulSpectrums(espectro_tela, espectro_tpl, 0, conjB=True)
+        produto = parcial if produto is None else produto + parcial
+    numerador = cv2.idft(produto, flags=cv2.DFT_REAL_OUTPUT | cv2.DFT_SCALE)[:linhas, :colunas]
+
+    # 3. Denominador: variância de cada janela (soma dos quadrados - quadrado da soma / N) x norma do template.
+    num_pixels = altura_t * largura_t
+    def _somar_janelas(imagem: np.ndarray) -> np.ndarray:
+        return cv2.boxFilter(imagem, -1, (largura_t, altura_t), anchor=(0, 0), normalize=False,
+                             borderType=cv2.BORDER_CONSTANT)[:linhas, :colunas]
+    variancia = _somar_janelas(quadro_fft["quadrado"])
+    for canal in quadro_fft["centrado"]:
+        variancia -= np.square(_somar_janelas(canal)) / num_pixels
+    lisa = variancia <= num_pixels * len(quadro_fft["centrado"]) * VARIANCIA_MINIMA_JANELA
+    denominador = np.sqrt(np.maximum(variancia, 0)) * espectro_template["norma"]
+
+    # 4. Mesma regra de arredondamento do OpenCV (|num| um pouco acima do denominador = ±1; muito acima = 0).
+    denominador[lisa] = np.inf
+    mapa = numerador / denominador
+    mapa[np.abs(mapa) >= 1.125] = 0.0
+    np.clip(mapa, -1.0, 1.0, out=mapa)
+
+    # 5. Melhor posição e centro (mesma regra de `buscar_template`).
+    _, pontuacao_maxima, _, (left, top) = cv2.minMaxLoc(mapa)
+    if pontuacao_maxima < confianca:
+        return None, float(pontuacao_maxima)
+    return (left + largura_t // 2, top + altura_t // 2), float(pontuacao_maxima)
+
+
+def escolher_motor(tamanho_imagem: Tuple[int, int], tamanho_template: Tuple[int, int], canais: int,
+                   threads_espacial: int = 1) -> str:
+    """
+    Estima qual motor é mais barato para um par (imagem, template): "espacial" ou "fft".
+
+    O custo espacial cresce com (posições x área do template) e divide-se pelas threads da busca
+    em faixas; o da FFT só depende do tamanho da transformada (os espectros dos templates ficam
+    em cache e o da tela é partilhado entre as âncoras do mesmo quadro).
+    """
+    altura_i, largura_i = tamanho_imagem[:2]
+    altura_t, largura_t = tamanho_template[:2]
+    if altura_t > altura_i or largura_t > largura_i:
+        return "espacial"
+    posicoes = (altura_i - altura_t + 1) * (largura_i - largura_t + 1)
+    custo_espacial = CUSTO_NS_ESPACIAL * posicoes * altura_t * largura_t * canais / max(1, threads_espacial)
+
+    altura_f, largura_f = calcular_tamanho_fft((altura_i, largura_i))
+    pontos = altura_f * largura_f
+    custo_fft = CUSTO_NS_FFT * pontos * (np.log2(pontos) * (canais + 1) + CUSTO_NORMALIZACAO_FFT)
+    return "fft" if custo_fft < custo_espacial else "espacial"
+
+
+#=========================================================================================================
+
+def redimensionar_template(template: np.ndarray, escala: float) -> np.ndarray:
+    """Redimensiona um template pela escala tela/template (INTER_AREA para reduzir, INTER_LINEAR para ampliar)."""
+    if escala == 1.0:
+        return template
+    altura, largura = template.shape[:2]
+    tamanho = (max(1, int(round(largura * escala))), max(1, int(round(altura * escala))))
+    return cv2.resize(template, tamanho, interpolation=cv2.INTER_AREA if escala < 1.0 else cv2.INTER_LINEAR)
+
+
+def detectar_escala(imagem_cinza: np.ndarray, template_cinza: np.ndarray, confianca: float,
+                    escalas: Tuple[float, ...] = ESCALAS_CANDIDATAS) -> Tuple[Optional[float], float]:
+    """
+    Descobre a escala entre a tela e o template procurando-o em várias escalas.
+
+    A primeira escala da lista que atingir a `confianca` encerra a busca só se for 1.0 (o caso
+    comum fica com o custo de uma única busca); nas outras, vence a melhor pontuação.
+
+    Args:
+        imagem_cinza (np.ndarray): A tela (ou quadro) em tons de cinza.
+        template_cinza (np.ndarray): O template original, em tons de cinza.
+        confianca (float): Pontuação mínima para aceitar uma escala.
+        escalas (Tuple[float, ...], optional): As escalas a testar, por ordem.
+
+    Returns:
+        Tuple[Optional[float], float]: A escala vencedora (None se nenhuma atingir a confiança)
+        e a melhor pontuação encontrada.
+    """
+    melhor_escala, melhor_pontuacao = None, 0.0
+    for escala in escalas:
+        centro, pontuacao = buscar_template(imagem_cinza, redimensionar_template(template_cinza, escala), confianca)
+        if centro is not None and escala == 1.0:
+            return escala, pontuacao
+        if pontuacao > melhor_pontuacao:
+            melhor_escala, melhor_pontuacao = escala, pontuacao
+    return (melhor_escala if melhor_pontuacao >= confianca else None), melhor_pontuacao
+
+
+def converter_para_cinza(imagem: np.ndarray) -> np.ndarray:
+    """Converte uma imagem BGR para tons de cinza (se já estiver em cinza, devolve como está)."""
+    if imagem.ndim == 2:
+        return imagem
+    return cv2.cvtColor(imagem, cv2.COLOR_BGR2GRAY)
+
+
+def calcular_niveis_piramide(tamanho_template: Tuple[int, int], niveis_maximos: int) -> int:
+    """
+    Calcula quantas reduções (por 2) um template aguenta sem ficar menor que `TAMANHO_MINIMO_NIVEL`.
+
+    Args:
+        tamanho_template (Tuple[int, int]): Altura e largura do template (formato `shape[:2]`).
+        niveis_maximos (int): Limite de níveis definido na configuração.
+
+    Returns:
+        int: Número de níveis reduzidos a usar (0 = sem pirâmide, apenas resolução total).
+    """
+    menor_lado = min(tamanho_template[:2])
+    niveis = 0
+    while niveis < niveis_maximos and (menor_lado >> (niveis + 1)) >= TAMANHO_MINIMO_NIVEL:
+        niveis += 1
+    return niveis
+
+
+def construir_piramide(imagem: np.ndarray, niveis: int) -> List[np.ndarray]:
+    """
+    Constrói a pirâmide de imagens: o nível 0 é a própria imagem e cada nível seguinte
+    tem metade da largura e da altura do anterior (`cv2.pyrDown`).
+    """
+    piramide = [imagem]
+    for _ in range(niveis):
+        piramide.append(cv2.pyrDown(piramide[-1]))
+    return piramide
+
+
+def _extrair_candidatos(mapa_resultado: np.ndarray, limiar: float, tamanho_template: Tuple[int, int], maximo: int) -> List[Tuple[int, int]]:
+    """
+    Função interna: extrai até `maximo` picos do mapa de correlação acima do `limiar`,
+    apagando a vizinhança de cada pico escolhido (supressão de não-máximos simples).
+    """
+    mapa = mapa_resultado.copy()
+    altura_t, largura_t = tamanho_template[:2]
+    candidatos = []
+    for _ in range(maximo):
+        _, pontuacao, _, (left, top) = cv2.minMaxLoc(mapa)
+        if pontuacao < limiar:
+            break
+        candidatos.append((left, top))
+        mapa[max(0, top - altura_t // 2): top + altura_t // 2 + 1,
+             max(0, left - largura_t // 2): left + largura_t // 2 + 1] = -1.0
+    return candidatos
+
+
+def buscar_template_piramide(imagem_cinza: np.ndarray, piramide_template: List[np.ndarray], confianca: float,
+                             folga: float = 0.3, maximo_candidatos: int = 5,
+                             piramide_tela: List[np.ndarray] = None) -> Tuple[Optional[Tuple[int, int]], float]:
+    """
+    Procura um template em tons de cinza usando uma pirâmide de imagens (busca grossa + refinamento).
+
+    1. Passo grosso: compara o nível mais reduzido do template com o nível equivalente da tela.
+    2. Seleciona até `maximo_candidatos` picos com pontuação >= `confianca - folga`.
+    3. Refinamento: para cada candidato, compara o template em resolução total apenas numa
+       janela pequena ao redor da posição prevista e fica com a melhor pontuação.
+
+    Args:
+        imagem_cinza (np.ndarray): O quadro da tela em tons de cinza.
+        piramide_template (List[np.ndarray]): A pirâmide do template (nível 0 = resolução total).
+        confianca (float): Pontuação mínima (0 a 1) para considerar o template encontrado.
+        folga (float, optional): Tolerância da pontuação no passo grosso (a redução borra detalhes
+                                 de texto e desalinha meio pixel, por isso a folga é larga).
+        maximo_candidatos (int, optional): Quantos picos do passo grosso são refinados.
+        piramide_tela (List[np.ndarray], optional): Pirâmide da tela já calculada (permite reaproveitá-la
+                                                    entre várias âncoras buscadas no mesmo quadro).
+
+    Returns:
+        Tuple[Optional[Tuple[int, int]], float]: Mesmo contrato de `buscar_template`.
+    """
+    # 1. Sem níveis reduzidos: é uma busca normal em tons de cinza.
+    niveis = len(piramide_template) - 1
+    template = piramide_template[0]
+    if niveis == 0:
+        return buscar_template(imagem_cinza, template, confianca)
+
+    # 2. Passo grosso no nível mais reduzido.
+    escala = 2 ** niveis
+    if piramide_tela is None or len(piramide_tela) <= niveis:
+        piramide_tela = construir_piramide(imagem_cinza, niveis)
+    tela_reduzida = piramide_tela[niveis]
+    template_reduzido = piramide_template[-1]
+    if template_reduzido.shape[0] > tela_reduzida.shape[0] or template_reduzido.shape[1] > tela_reduzida.shape[1]:
+        return buscar_template(imagem_cinza, template, confianca)
+    mapa_grosso = cv2.matchTemplate(tela_reduzida, template_reduzido, cv2.TM_CCOEFF_NORMED)
+    candidatos = _extrair_candidatos(mapa_grosso, confianca - folga, template_reduzido.shape, maximo_candidatos)
+
+    # 3. Refinamento em resolução total ao redor de cada candidato.
+    altura_t, largura_t = template.shape[:2]
+    altura_i, largura_i = imagem_cinza.shape[:2]
+    margem = escala * 2
+    melhor_centro, melhor_pontuacao = None, 0.0
+    for left_grosso, top_grosso in candidatos:
+        left = max(0, left_grosso * escala - margem)
+        top = max(0, top_grosso * escala - margem)
+        direita = min(largura_i, left_grosso * escala + largura_t + margem)
+        base = min(altura_i, top_grosso * escala + altura_t + margem)
+        centro, pontuacao = buscar_template(imagem_cinza[top:base, left:direita], template, confianca)
+        if pontuacao > melhor_pontuacao:
+            melhor_pontuacao = pontuacao
+            melhor_centro = (centro[0] + left, centro[1] + top) if centro is not None else None
+
+    return melhor_centro, melhor_pontuacao
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar a função 'buscar_template' sem depender da tela.
+    Execute a partir da raiz: python -m uteis.correspondencia_imagem
+    """
+    print(">>> Iniciando teste da função 'buscar_template'...")
+
+    # Gera uma "tela" aleatória e recorta um template de uma posição conhecida.
+    gerador = np.random.default_rng(42)
+    tela_teste = gerador.integers(0, 255, size=(300, 400, 3), dtype=np.uint8)
+    template_teste = tela_teste[120:140, 200:260].copy()
+
+    centro, pontuacao = buscar_template(tela_teste, template_teste, 0.9)
+    print(f"--- Centro encontrado: {centro} | pontuação: {pontuacao:.3f} (Esperado: (230, 130))")
+    assert centro == (230, 130), "Teste 1 Falhou"
+
+    centro, pontuacao = buscar_template(tela_teste[:100], template_teste, 0.9)
+    print(f"--- Recorte sem o template: {centro} | pontuação: {pontuacao:.3f} (Esperado: None)")
+    assert centro is None, "Teste 2 Falhou"
+
+    # Pirâmide: usa uma "tela" suave (formas geométricas) porque ruído puro some ao reduzir.
+    tela_suave = np.full((600, 800), 200, dtype=np.uint8)
+    cv2.rectangle(tela_suave, (410, 300), (470, 340), 40, -1)
+    cv2.circle(tela_suave, (450, 330), 12, 120, -1)
+    template_suave = tela_suave[290:350, 400:480].copy()
+    niveis = calcular_niveis_piramide(template_suave.shape, 2)
+    centro, pontuacao = buscar_template_piramide(tela_suave, construir_piramide(template_suave, niveis), 0.9)
+    print(f"--- Pirâmide ({niveis} níveis): {centro} | pontuação: {pontuacao:.3f} (Esperado: (440, 320))")
+    assert centro == (440, 320), "Teste 3 Falhou"
+
+    # Busca paralela em faixas: deve dar exatamente o mesmo resultado da busca numa só passagem.
+    from concurrent.futures import ThreadPoolExecutor
+    tela_grande = gerador.integers(0, 255, size=(1080, 1920, 3), dtype=np.uint8)
+    template_grande = tela_grande[700:740, 1500:1600].copy()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        centro, pontuacao = buscar_template_paralelo(tela_grande, template_grande, 0.9, pool, 4)
+    print(f"--- Busca paralela: {centro} | pontuação: {pontuacao:.3f} (Esperado: (1550, 720))")
+    assert centro == (1550, 720), "Teste 4 Falhou"
+
+    # Motor FFT: mesmo resultado (e pontuação muito próxima) da busca espacial.
+    centro, pontuacao = buscar_template_fft(preparar_quadro_fft(tela_grande),
+                                            calcular_espectro_template(template_grande, calcular_tamanho_fft(tela_grande.shape)), 0.9)
+    print(f"--- Motor FFT: {centro} | pontuação: {pontuacao:.3f} (Esperado: (1550, 720)) | motor auto: "
+          f"{escolher_motor(tela_grande.shape, template_grande.shape, 3)}")
+    assert centro == (1550, 720) and pontuacao > 0.99, "Teste 5 Falhou"
+
+    # Detecção da escala: a "tela" suave ampliada a 125% (como o Windows com escala de 125%).
+    tela_125 = cv2.resize(tela_suave, None, fx=1.25, fy=1.25, interpolation=cv2.INTER_LINEAR)
+    escala, pontuacao = detectar_escala(tela_125, template_suave, 0.9)
+    print(f"--- Escala detectada: {escala} | pontuação: {pontuacao:.3f} (Esperado: 1.25)")
+    assert escala == 1.25, "Teste 6 Falhou"
+
+    print("\n--- Teste concluído com SUCESSO! ---")
@@ -0,0 +1,164 @@
+# uteis/estatisticas_pontuacao.py
+
+"""
+Módulo Estatísticas de Pontuação (melhor pontuação de cada localização, por âncora).
+
+Cada localização regista a melhor pontuação de correspondência da chave e se a âncora foi
+encontrada. As últimas `MAXIMO_AMOSTRAS` amostras de cada chave podem ser guardadas em
+`temp/estatisticas_ancoras.json` (pares [pontuação, encontrada]) e servem para propor uma
+confiança por âncora (ver `uteis.afinador_confianca`).
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 1. Define o caminho do ficheiro de persistência e o limite de amostras por chave.
+CAMINHO_PROJETO = Path(__file__).resolve().parent.parent
+CAMINHO_ESTATISTICAS_JSON = CAMINHO_PROJETO / "temp" / "estatisticas_ancoras.json"
+MAXIMO_AMOSTRAS = 200
+
+# Limites da proposta: nenhuma âncora fica abaixo de CONFIANCA_MINIMA (risco de falsos positivos)
+# nem acima de CONFIANCA_MAXIMA (pequenas diferenças de renderização já a fariam falhar).
+CONFIANCA_MINIMA = 0.7
+CONFIANCA_MAXIMA = 0.98
+AMOSTRAS_MINIMAS = 5
+SEPARACAO_MINIMA = 0.1  # Distância mínima entre a pior pontuação "encontrada" e a melhor "não encontrada".
+FOLGA_PRESENCA = 0.03   # Folga abaixo da pior pontuação "encontrada" quando não há amostras de ausência.
+
+# --- Estado das Estatísticas ---
+# Por chave: lista de (pontuação, encontrada).
+_AMOSTRAS: Dict[str, List[Tuple[float, bool]]] = {}
+_TRAVA_ESTATISTICAS = threading.Lock()
+
+
+def registrar_pontuacao(nome_chave: str, pontuacao: float, encontrada: bool):
+    """Guarda a melhor pontuação de uma localização da chave e se ela foi encontrada (só as últimas `MAXIMO_AMOSTRAS` ficam)."""
+    with _TRAVA_ESTATISTICAS:
+        amostras = _AMOSTRAS.setdefault(nome_chave, [])
+        amostras.append((round(float(pontuacao), 4), bool(encontrada)))
+        del amostras[:-MAXIMO_AMOSTRAS]
+
+
+def obter_pontuacoes() -> Dict[str, List[Tuple[float, bool]]]:
+    """Retorna uma cópia das amostras (pontuação, encontrada) registadas, por chave."""
+    with _TRAVA_ESTATISTICAS:
+        return {chave: list(amostras) for chave, amostras in _AMOSTRAS.items()}
+
+
+def propor_confianca(amostras: List[Tuple[float, bool]]) -> Optional[float]:
+    """
+    Propõe a confiança de uma âncora a partir das suas amostras (pontuação, encontrada).
+
+    Só as localizações confirmadas (encontradas) podem baixar o limiar; as não encontradas
+    (âncora ausente, ex: a espera por uma janela fechar) marcam o piso. Com os dois grupos,
+    a proposta é o meio do intervalo entre a pior pontuação encontrada e a melhor não
+    encontrada, se esse intervalo tiver pelo menos `SEPARACAO_MINIMA`. Só com encontradas,
+    a proposta fica um pouco abaixo da pior delas. Nunca fica igual ou abaixo da melhor
+    pontuação não encontrada.
+
+    Args:
+        amostras (List[Tuple[float, bool]]): As amostras registadas da âncora.
+
+    Returns:
+        Optional[float]: A confiança proposta (limitada a [CONFIANCA_MINIMA, CONFIANCA_MAXIMA]),
+        ou None se houver poucas localizações encontradas ou os grupos não se separarem.
+    """
+    encontradas = [pontuacao for pontuacao, encontrada in amostras if encontrada]
+    ausentes = [pontuacao for pontuacao, encontrada in amostras if not encontrada]
+    if len(encontradas) < AMOSTRAS_MINIMAS:
+        return None
+
+    # 1. Pior pontuação confirmada e melhor pontuação sem a âncora.
+    pior_encontrada = min(encontradas)
+    melhor_ausente = max(ausentes) if ausentes else None
+
+    # 2. Dois grupos separados: limiar no meio do intervalo.
+    if melhor_ausente is not None:
+        if pior_encontrada - melhor_ausente < SEPARACAO_MINIMA:
+            return None
+        proposta = (pior_encontrada + melhor_ausente) / 2
+    # 3. Só presença: um pouco abaixo da pior pontuação encontrada.
+    else:
+        proposta = pior_encontrada - FOLGA_PRESENCA
+
+    # 4. Limita a proposta e garante que uma tela sem a âncora continua a não passar.
+    proposta = round(min(max(proposta, CONFIANCA_MINIMA), CONFIANCA_MAXIMA), 3)
+    if melhor_ausente is not None and proposta <= melhor_ausente:
+        return None
+    return proposta
+
+
+def carregar_estatisticas() -> int:
+    """
+    Carrega as amostras guardadas em `temp/estatisticas_ancoras.json` (se existir),
+    antes das registadas nesta execução. Pontuações soltas de versões anteriores (sem a
+    indicação de encontrada) são descartadas.
+
+    Returns:
+        int: Quantidade de chaves com pontuações.
+    """
+    try:
+        with open(CAMINHO_ESTATISTICAS_JSON, 'r', encoding='utf-8') as f:
+            estatisticas_json = json.load(f)
+    except FileNotFoundError:
+        return 0
+    except Exception as e:
+        print(f"⚠️ Aviso: Falha ao ler {CAMINHO_ESTATISTICAS_JSON.name}: {e}")
+        return 0
+
+    with _TRAVA_ESTATISTICAS:
+        for chave, amostras in estatisticas_json.items():
+            validas = [(float(v[0]), bool(v[1])) for v in amostras if isinstance(v, list) and len(v) == 2]
+            _AMOSTRAS[chave] = (validas + _AMOSTRAS.get(chave, []))[-MAXIMO_AMOSTRAS:]
+        return len(_AMOSTRAS)
+
+
+def salvar_estatisticas():
+    """Guarda as pontuações registadas em `temp/estatisticas_ancoras.json`."""
+    try:
+        CAMINHO_ESTATISTICAS_JSON.parent.mkdir(parents=True, exist_ok=True)
+        estatisticas_json = {chave: [[pontuacao, int(encontrada)] for pontuacao, encontrada in amostras]
+                             for chave, amostras in obter_pontuacoes().items()}
+        with open(CAMINHO_ESTATISTICAS_JSON, 'w', encoding='utf-8') as f:
+            json.dump(estatisticas_json, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"⚠️ Aviso: Falha ao guardar {CAMINHO_ESTATISTICAS_JSON.name}: {e}")
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar a proposta de confiança sem depender da tela.
+    Execute a partir da raiz: python -m uteis.estatisticas_pontuacao
+    """
+    print(">>> Iniciando teste das estatísticas de pontuação...")
+
+    def _amostras(encontradas, ausentes):
+        return [(p, True) for p in encontradas] + [(p, False) for p in ausentes]
+
+    proposta = propor_confianca(_amostras([0.87, 0.88, 0.86, 0.88, 0.87], [0.41, 0.45, 0.39]))
+    print(f"--- Dois grupos (encontrada ~0.87, ausente ~0.42): {proposta} (Esperado: 0.7)")
+    assert proposta == 0.7, "Teste 1 Falhou"
+
+    proposta = propor_confianca(_amostras([0.99, 0.98, 0.99, 1.0, 0.99], [0.62, 0.58]))
+    print(f"--- Dois grupos (encontrada ~0.99, ausente ~0.6): {proposta} (Esperado: 0.8)")
+    assert proposta == 0.8, "Teste 2 Falhou"
+
+    proposta = propor_confianca(_amostras([0.93, 0.95, 0.94, 0.96, 0.95], []))
+    print(f"--- Só encontradas: {proposta} (Esperado: 0.9)")
+    assert proposta == 0.9, "Teste 3 Falhou"
+
+    proposta = propor_confianca(_amostras([], [0.78, 0.8, 0.79, 0.77, 0.81, 0.8]))
+    print(f"--- Nunca encontrada (ausente ~0.8): {proposta} (Esperado: None)")
+    assert proposta is None, "Teste 4 Falhou"
+
+    proposta = propor_confianca(_amostras([0.95, 0.96, 0.94, 0.95, 0.96], [0.88, 0.6]))
+    print(f"--- Ausente perto da presença: {proposta} (Esperado: None)")
+    assert proposta is None, "Teste 5 Falhou"
+
+    print(f"--- Poucas amostras: {propor_confianca(_amostras([0.99, 0.98], []))} (Esperado: None)")
+    assert propor_confianca(_amostras([0.99, 0.98], [])) is None, "Teste 6 Falhou"
+
+    print("\n--- Teste concluído com SUCESSO! ---")
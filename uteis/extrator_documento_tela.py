@@ -3,50 +3,123 @@
 """
 Módulo com a função especializada para extrair (raspar)
 o documento CNPJ ou CPF da tela, com lógica de fallback e retentativas.
+
+O tipo de documento é decidido a partir de uma única captura: os rótulos CNPJ e CPF
+são localizados nessa captura e vence o campo (à direita do rótulo) que tem texto.
+Só esse campo é copiado.
 """
 
 import time
+import numpy as np
+from typing import Optional, Tuple
 
 # --- Imports de Ferramentas e Assistente ---
 from uteis.formatadores import limpar_documento, validar_tamanho_documento
+from uteis.registro_ancoras import obter_ancora
 from funcoes.copiar_texto_elemento import copiar_texto_elemento
+from funcoes.capturar_tela import capturar_tela
+from funcoes.localizar_elemento import localizar_elementos, escalar_ajuste
 from uteis.cores import VERDE, VERMELHO, RESET, AMARELO # (Adicionado AMARELO)
+from uteis.ritmo import pausar
+from configuracoes.carregar_config import TIMEOUT_CAMPO_VAZIO
+
+# Documentos possíveis: (chave da âncora do rótulo, quantidade de dígitos, nome para as mensagens).
+DOCUMENTOS = (
+    ("endereco_idfiscais_cnpj", 14, "CNPJ"),
+    ("enderecos_idfiscais_cpf", 11, "CPF"),
+)
+
+# Medição de "tinta" no campo: largura (px, na escala dos templates) da janela ao redor do ponto de
+# clique do campo, tom de cinza abaixo do qual o pixel conta como texto e fração mínima de texto.
+LARGURA_JANELA_CAMPO = 200
+NIVEL_TINTA = 110
+FRACAO_MINIMA_TINTA = 0.01
+
+
+def _medir_tinta(quadro: np.ndarray, centro: Tuple[int, int], largura: int, altura: int) -> float:
+    """Função interna: fração de pixels escuros (texto) numa janela do quadro centrada em `centro`."""
+    left, top = max(centro[0] - largura // 2, 0), max(centro[1] - altura // 2, 0)
+    janela = quadro[top:top + altura, left:left + largura]
+    if janela.size == 0:
+        return 0.0
+    cinza = janela.min(axis=2) if janela.ndim == 3 else janela
+    return float(np.count_nonzero(cinza < NIVEL_TINTA)) / cinza.size
+
+
+def detectar_documento_preenchido() -> Optional[Tuple[str, int, str]]:
+    """
+    Decide, a partir de uma única captura, qual dos campos (CNPJ ou CPF) está preenchido.
+
+    Os dois rótulos são localizados na mesma captura; no ponto de clique de cada campo (rótulo +
+    ajuste do JSON) mede-se a fração de pixels escuros. Vence o campo com texto, se só um tiver.
+
+    Returns:
+        Optional[Tuple[str, int, str]]: O item de `DOCUMENTOS` do campo preenchido (chave, dígitos,
+        nome), ou None se nenhum rótulo for encontrado ou não der para decidir.
+    """
+    # 1. Uma captura: localiza os dois rótulos nela.
+    quadro = capturar_tela()
+    resultados = localizar_elementos([chave for chave, _, _ in DOCUMENTOS], quadro=quadro)
+
+    # 2. Mede a "tinta" no campo de cada rótulo encontrado.
+    tintas = {}
+    for documento in DOCUMENTOS:
+        resultado = resultados[documento[0]]
+        if resultado["posicao"] is None:
+            continue
+        dados_elemento = resultado["dados"]
+        alvo = (resultado["posicao"].x + escalar_ajuste(int(dados_elemento.get("ajuste_x") or 0)),
+                resultado["posicao"].y + escalar_ajuste(int(dados_elemento.get("ajuste_y") or 0)))
+        altura = obter_ancora(documento[0])[1].shape[0]
+        tintas[documento] = _medir_tinta(quadro, alvo, escalar_ajuste(LARGURA_JANELA_CAMPO), altura)
+
+    # 3. Decide só se exatamente um campo tem texto.
+    preenchidos = [documento for documento, tinta in tintas.items() if tinta >= FRACAO_MINIMA_TINTA]
+    return preenchidos[0] if len(preenchidos) == 1 else None
+
+
+def _copiar_documento(chave: str, digitos: int, timeout: float = None) -> Optional[str]:
+    """Função interna: copia o campo e devolve o documento limpo, se tiver a quantidade de dígitos esperada."""
+    valor_copiado = copiar_texto_elemento(chave, timeout=timeout)
+    if valor_copiado and validar_tamanho_documento(valor_copiado, digitos):
+        return limpar_documento(valor_copiado)
+    return None
 
 
 def scraping_cnpj_cpf():
     """
-    Captura automaticamente o CNPJ ou CPF da tela, alternando entre as duas opções.
-    Realiza até 3 tentativas automáticas intercaladas (CNPJ/CPF).
+    Captura automaticamente o CNPJ ou CPF da tela.
+
+    Em cada uma das até 3 tentativas, decide pela captura qual campo está preenchido e copia só
+    esse. Se a captura não permitir decidir, tenta copiar os dois campos (CNPJ e depois CPF).
     Caso não consiga identificar nenhum documento válido, solicita ao usuário inserir manualmente.
 
     Retorna:
         str: Documento limpo (CNPJ com 14 dígitos ou CPF com 11 dígitos).
     """
-    
+
     for tentativa in range(1, 4):
-        # --- Tenta capturar CNPJ ---
-        try:
-            valor_copiado = copiar_texto_elemento("endereco_idfiscais_cnpj")
-            if valor_copiado and validar_tamanho_documento(valor_copiado, 14):
-                doc_limpo = limpar_documento(valor_copiado)
-                print(f"   ✅ CNPJ detectado ({valor_copiado}).")
-                return doc_limpo
-            
-        except Exception as e_cnpj:
-            print(f"   {AMARELO}⚠️  Âncora CNPJ não encontrada. Tentando CPF...{RESET}")
-        
-        # --- Tenta capturar CPF ---
+        # --- Decide o tipo de documento por uma única captura ---
         try:
-            time.sleep(1)
-            valor_copiado_cpf = copiar_texto_elemento("endereco_idfiscais_cpf")
-            if valor_copiado_cpf and validar_tamanho_documento(valor_copiado_cpf, 11):
-                doc_limpo = limpar_documento(valor_copiado_cpf)
-                print(f"   ✅ CPF detectado ({valor_copiado_cpf}).")
-                return doc_limpo
-        except Exception as e_cpf:
-            print(f"   {AMARELO}⚠️  Âncora CPF não encontrada.{RESET}")
-
-        time.sleep(1)
+            documento = detectar_documento_preenchido()
+        except Exception as e:
+            print(f"   {AMARELO}⚠️  Não foi possível analisar os campos CNPJ/CPF na tela: {e}{RESET}")
+            documento = None
+
+        # --- Caminho comum: copia só o campo preenchido ---
+        #     (Sem decisão, um dos dois campos está vazio: a cópia dele espera só TIMEOUT_CAMPO_VAZIO.)
+        candidatos = [documento] if documento else list(DOCUMENTOS)
+        timeout_copia = None if documento else TIMEOUT_CAMPO_VAZIO
+        for chave, digitos, nome in candidatos:
+            try:
+                doc_limpo = _copiar_documento(chave, digitos, timeout_copia)
+                if doc_limpo:
+                    print(f"   ✅ {nome} detectado ({doc_limpo}).")
+                    return doc_limpo
+            except Exception:
+                print(f"   {AMARELO}⚠️  Âncora {nome} não encontrada.{RESET}")
+
+        pausar("tentar_documento")
     # --- Se nenhuma tentativa automática funcionou, aciona input manual ---
     print(f"{VERMELHO}⚠️  Não foi possível capturar automaticamente o CNPJ/CPF após 3 tentativas.{RESET}")
     print(f"{VERMELHO}⚠️  Preencha o valor em sistema e...{RESET}")
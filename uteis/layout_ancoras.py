@@ -0,0 +1,167 @@
+# uteis/layout_ancoras.py
+
+"""
+Módulo Layout de Âncoras (posições relativas à âncora mestre do formulário de PN).
+
+Com o formulário aberto, quase todos os campos ficam a uma distância fixa do cabeçalho
+`tela_cadastro_parceirodeneg`. Este módulo guarda esse deslocamento (dx, dy) por chave,
+aprendido a partir das localizações bem-sucedidas, e a posição da âncora mestre na aba
+atual. A localização usa a posição prevista para uma verificação barata (uma janela
+minúscula) antes de qualquer busca real. Os deslocamentos podem ser guardados em
+`temp/layout_ancoras.json`.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# 1. Define a âncora mestre e o caminho do ficheiro de persistência dos deslocamentos.
+CHAVE_MESTRE = "tela_cadastro_parceirodeneg"
+CAMINHO_PROJETO = Path(__file__).resolve().parent.parent
+CAMINHO_LAYOUT_JSON = CAMINHO_PROJETO / "temp" / "layout_ancoras.json"
+
+# Folga (em pixels) ao redor da posição prevista na verificação barata.
+FOLGA_VERIFICACAO = 6
+
+# --- Estado do Layout ---
+_DESLOCAMENTOS: Dict[str, Tuple[int, int]] = {}
+_MESTRE: Optional[Tuple[int, int]] = None  # Centro da âncora mestre na aba atual.
+_MESTRE_PROCURADO = False                  # Já se tentou achar a mestre nesta aba (mesmo sem sucesso)?
+_ESTATISTICAS = {"acertos": 0, "falhas": 0}
+_TRAVA_LAYOUT = threading.Lock()
+
+
+def registrar_mestre(centro: Optional[Tuple[int, int]]):
+    """Guarda o centro da âncora mestre na aba atual (None = a mestre não está visível nesta aba)."""
+    global _MESTRE, _MESTRE_PROCURADO
+    with _TRAVA_LAYOUT:
+        _MESTRE, _MESTRE_PROCURADO = (tuple(centro) if centro is not None else None), True
+
+
+def invalidar_mestre():
+    """Esquece a posição da mestre (chamado ao trocar de aba: a próxima busca volta a localizá-la)."""
+    global _MESTRE, _MESTRE_PROCURADO
+    with _TRAVA_LAYOUT:
+        _MESTRE, _MESTRE_PROCURADO = None, False
+
+
+def mestre_procurado() -> bool:
+    """Indica se a mestre já foi procurada desde a última troca de aba."""
+    return _MESTRE_PROCURADO
+
+
+def aprender_deslocamento(nome_chave: str, centro: Tuple[int, int]):
+    """
+    Aprende (ou corrige) o deslocamento de uma âncora em relação à mestre, se a mestre for conhecida.
+
+    Args:
+        nome_chave (str): A chave da âncora encontrada.
+        centro (Tuple[int, int]): O centro (x, y) encontrado, em coordenadas da tela.
+    """
+    with _TRAVA_LAYOUT:
+        if _MESTRE is None or nome_chave == CHAVE_MESTRE:
+            return
+        _DESLOCAMENTOS[nome_chave] = (centro[0] - _MESTRE[0], centro[1] - _MESTRE[1])
+
+
+def prever_regiao(nome_chave: str, tamanho_template: Tuple[int, int], largura_tela: int,
+                  altura_tela: int) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Calcula a janela minúscula (posição prevista + folga) onde a âncora deve estar.
+
+    Args:
+        nome_chave (str): A chave da âncora.
+        tamanho_template (Tuple[int, int]): Altura e largura do template (formato `shape[:2]`).
+        largura_tela (int): Largura da tela, para limitar a janela.
+        altura_tela (int): Altura da tela, para limitar a janela.
+
+    Returns:
+        Optional[Tuple[int, int, int, int]]: A região (left, top, largura, altura), ou None se a
+        mestre não for conhecida nesta aba, a chave não tiver deslocamento ou a janela sair da tela.
+    """
+    with _TRAVA_LAYOUT:
+        if _MESTRE is None or nome_chave not in _DESLOCAMENTOS:
+            return None
+        dx, dy = _DESLOCAMENTOS[nome_chave]
+        centro_previsto = (_MESTRE[0] + dx, _MESTRE[1] + dy)
+
+    altura, largura = tamanho_template[:2]
+    left = centro_previsto[0] - largura // 2 - FOLGA_VERIFICACAO
+    top = centro_previsto[1] - altura // 2 - FOLGA_VERIFICACAO
+    largura_regiao, altura_regiao = largura + 2 * FOLGA_VERIFICACAO, altura + 2 * FOLGA_VERIFICACAO
+    if left < 0 or top < 0 or left + largura_regiao > largura_tela or top + altura_regiao > altura_tela:
+        return None
+    return left, top, largura_regiao, altura_regiao
+
+
+def registrar_resultado_layout(acertou: bool):
+    """Conta um acerto (âncora achada na posição prevista) ou uma falha (precisou da busca normal)."""
+    with _TRAVA_LAYOUT:
+        _ESTATISTICAS["acertos" if acertou else "falhas"] += 1
+
+
+def obter_estatisticas_layout() -> Dict[str, int]:
+    """Retorna os contadores da verificação pela posição prevista: {"acertos": int, "falhas": int}."""
+    with _TRAVA_LAYOUT:
+        return dict(_ESTATISTICAS)
+
+
+def carregar_layout() -> int:
+    """
+    Carrega os deslocamentos guardados em `temp/layout_ancoras.json` (se existir).
+
+    Returns:
+        int: Quantidade de deslocamentos carregados.
+    """
+    try:
+        with open(CAMINHO_LAYOUT_JSON, 'r', encoding='utf-8') as f:
+            layout_json = json.load(f)
+    except FileNotFoundError:
+        return 0
+    except Exception as e:
+        print(f"⚠️ Aviso: Falha ao ler {CAMINHO_LAYOUT_JSON.name}: {e}")
+        return 0
+
+    with _TRAVA_LAYOUT:
+        for chave, deslocamento in layout_json.items():
+            _DESLOCAMENTOS.setdefault(chave, tuple(int(v) for v in deslocamento))
+        return len(_DESLOCAMENTOS)
+
+
+def salvar_layout():
+    """Guarda os deslocamentos aprendidos em `temp/layout_ancoras.json`."""
+    try:
+        CAMINHO_LAYOUT_JSON.parent.mkdir(parents=True, exist_ok=True)
+        with _TRAVA_LAYOUT:
+            layout_json = {chave: list(deslocamento) for chave, deslocamento in _DESLOCAMENTOS.items()}
+        with open(CAMINHO_LAYOUT_JSON, 'w', encoding='utf-8') as f:
+            json.dump(layout_json, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"⚠️ Aviso: Falha ao guardar {CAMINHO_LAYOUT_JSON.name}: {e}")
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar o layout de âncoras sem depender da tela.
+    Execute a partir da raiz: python -m uteis.layout_ancoras
+    """
+    print(">>> Iniciando teste do layout de âncoras...")
+
+    registrar_mestre((500, 100))
+    aprender_deslocamento("geral1_tipopn", (420, 300))
+    regiao = prever_regiao("geral1_tipopn", (20, 60), 1920, 1080)
+    print(f"--- Região prevista: {regiao} (Esperado: (384, 284, 72, 32))")
+    assert regiao == (384, 284, 72, 32), "Teste 1 Falhou"
+
+    registrar_mestre((510, 120))
+    regiao = prever_regiao("geral1_tipopn", (20, 60), 1920, 1080)
+    print(f"--- Janela movida: {regiao} (Esperado: (394, 304, 72, 32))")
+    assert regiao == (394, 304, 72, 32), "Teste 2 Falhou"
+
+    invalidar_mestre()
+    print(f"--- Após trocar de aba: {prever_regiao('geral1_tipopn', (20, 60), 1920, 1080)} (Esperado: None)")
+    assert prever_regiao("geral1_tipopn", (20, 60), 1920, 1080) is None, "Teste 3 Falhou"
+
+    print("\n--- Teste concluído com SUCESSO! ---")
@@ -0,0 +1,155 @@
+# uteis/memoria_posicoes.py
+
+"""
+Módulo Memória de Posições (última posição conhecida de cada âncora).
+
+Guarda, por chave, a caixa (left, top, largura, altura) onde a âncora foi encontrada
+pela última vez. A localização usa essa caixa (com uma margem) como região de busca
+antes de varrer a tela inteira. As posições podem ser guardadas em
+`temp/posicoes_ancoras.json` para que a execução seguinte já comece "aquecida".
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+# 1. Define o caminho do ficheiro de persistência das posições.
+CAMINHO_PROJETO = Path(__file__).resolve().parent.parent
+CAMINHO_POSICOES_JSON = CAMINHO_PROJETO / "temp" / "posicoes_ancoras.json"
+
+# --- Estado da Memória ---
+_POSICOES: Dict[str, Tuple[int, int, int, int]] = {}
+_ESTATISTICAS = {"acertos": 0, "falhas": 0}
+_TRAVA_MEMORIA = threading.Lock()
+
+
+def memorizar_posicao(nome_chave: str, centro: Tuple[int, int], tamanho_template: Tuple[int, int]):
+    """
+    Guarda a caixa onde a âncora foi encontrada.
+
+    Args:
+        nome_chave (str): A chave da âncora.
+        centro (Tuple[int, int]): O centro (x, y) encontrado, em coordenadas da tela.
+        tamanho_template (Tuple[int, int]): Altura e largura do template (formato `shape[:2]`).
+    """
+    altura, largura = tamanho_template[:2]
+    with _TRAVA_MEMORIA:
+        _POSICOES[nome_chave] = (centro[0] - largura // 2, centro[1] - altura // 2, largura, altura)
+
+
+def esquecer_posicao(nome_chave: str = None):
+    """Remove a posição memorizada de uma âncora (ou de todas, se nenhuma chave for informada)."""
+    with _TRAVA_MEMORIA:
+        if nome_chave is None:
+            _POSICOES.clear()
+        else:
+            _POSICOES.pop(nome_chave, None)
+
+
+def calcular_regiao_busca(nome_chave: str, margem: int, largura_tela: int, altura_tela: int) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Calcula a região de busca (caixa memorizada + margem), limitada às bordas da tela.
+
+    Args:
+        nome_chave (str): A chave da âncora.
+        margem (int): Pixels acrescentados em cada lado da caixa memorizada.
+        largura_tela (int): Largura da tela, para limitar a região.
+        altura_tela (int): Altura da tela, para limitar a região.
+
+    Returns:
+        Optional[Tuple[int, int, int, int]]: A região (left, top, largura, altura) ou None
+        se a âncora ainda não tiver posição memorizada.
+    """
+    with _TRAVA_MEMORIA:
+        caixa = _POSICOES.get(nome_chave)
+    if caixa is None:
+        return None
+
+    left, top, largura, altura = caixa
+    esquerda = max(0, left - margem)
+    topo = max(0, top - margem)
+    direita = min(largura_tela, left + largura + margem)
+    base = min(altura_tela, top + altura + margem)
+
+    # Caixa fora da tela atual (ex: resolução mudou): ignora a memória.
+    if direita - esquerda < largura or base - topo < altura:
+        return None
+    return esquerda, topo, direita - esquerda, base - topo
+
+
+def registrar_resultado_regiao(acertou: bool):
+    """Conta um acerto (âncora achada na região) ou uma falha (precisou da tela inteira)."""
+    with _TRAVA_MEMORIA:
+        _ESTATISTICAS["acertos" if acertou else "falhas"] += 1
+
+
+def obter_estatisticas_regiao() -> Dict[str, Any]:
+    """
+    Retorna os contadores da busca por região e a taxa de acerto.
+
+    Returns:
+        Dict[str, Any]: {"acertos": int, "falhas": int, "taxa_acerto": float (0 a 1)}.
+    """
+    with _TRAVA_MEMORIA:
+        acertos, falhas = _ESTATISTICAS["acertos"], _ESTATISTICAS["falhas"]
+    total = acertos + falhas
+    return {"acertos": acertos, "falhas": falhas, "taxa_acerto": acertos / total if total else 0.0}
+
+
+def carregar_posicoes() -> int:
+    """
+    Carrega as posições guardadas em `temp/posicoes_ancoras.json` (se existir).
+
+    Returns:
+        int: Quantidade de posições carregadas.
+    """
+    try:
+        with open(CAMINHO_POSICOES_JSON, 'r', encoding='utf-8') as f:
+            posicoes_json = json.load(f)
+    except FileNotFoundError:
+        return 0
+    except Exception as e:
+        print(f"⚠️ Aviso: Falha ao ler {CAMINHO_POSICOES_JSON.name}: {e}")
+        return 0
+
+    with _TRAVA_MEMORIA:
+        for chave, caixa in posicoes_json.items():
+            _POSICOES.setdefault(chave, tuple(int(v) for v in caixa))
+        return len(_POSICOES)
+
+
+def salvar_posicoes():
+    """Guarda as posições memorizadas em `temp/posicoes_ancoras.json`."""
+    try:
+        CAMINHO_POSICOES_JSON.parent.mkdir(parents=True, exist_ok=True)
+        with _TRAVA_MEMORIA:
+            posicoes_json = {chave: list(caixa) for chave, caixa in _POSICOES.items()}
+        with open(CAMINHO_POSICOES_JSON, 'w', encoding='utf-8') as f:
+            json.dump(posicoes_json, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"⚠️ Aviso: Falha ao guardar {CAMINHO_POSICOES_JSON.name}: {e}")
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar a memória de posições sem depender da tela.
+    Execute a partir da raiz: python -m uteis.memoria_posicoes
+    """
+    print(">>> Iniciando teste da memória de posições...")
+
+    memorizar_posicao("teste", (100, 50), (20, 60))
+    regiao = calcular_regiao_busca("teste", 10, 1920, 1080)
+    print(f"--- Região calculada: {regiao} (Esperado: (60, 30, 80, 40))")
+    assert regiao == (60, 30, 80, 40), "Teste 1 Falhou"
+
+    regiao_borda = calcular_regiao_busca("teste", 500, 1920, 1080)
+    print(f"--- Região limitada à tela: {regiao_borda} (Esperado: (0, 0, 630, 560))")
+    assert regiao_borda == (0, 0, 630, 560), "Teste 2 Falhou"
+
+    registrar_resultado_regiao(True)
+    registrar_resultado_regiao(False)
+    print(f"--- Estatísticas: {obter_estatisticas_regiao()}")
+
+    print("\n--- Teste concluído com SUCESSO! ---")
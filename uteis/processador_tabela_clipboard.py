@@ -5,16 +5,20 @@ Módulo para ler e processar dados tabulados da área de transferência
 usando a biblioteca pandas.
 """
 
-import pyperclip
 import pandas as pd
 import io # Para ler string como arquivo
 import time
+from uteis.area_transferencia_sistema import ler_texto
 
-def ler_tabela_clipboard_para_dataframe() -> pd.DataFrame:
+def ler_tabela_clipboard_para_dataframe(texto: str = None) -> pd.DataFrame:
     """
     Lê o conteúdo da área de transferência, assumindo que é uma tabela
     separada por tabulações (TABs), e a retorna como um DataFrame pandas.
 
+    Args:
+        texto (str, optional): O texto já copiado (ex: devolvido por `copiar_por`). Se omitido,
+                               lê a área de transferência.
+
     Returns:
         pd.DataFrame: Um DataFrame contendo os dados da tabela. As colunas serão nomeadas com base na primeira linha do clipboard.
     Raises:
@@ -22,9 +26,9 @@ def ler_tabela_clipboard_para_dataframe() -> pd.DataFrame:
         Exception: Para outros erros inesperados durante o processamento.
     """
 
-    # 1. Lê conteúdo do clipboard com `pyperclip.paste()`.  
+    # 1. Usa o texto recebido ou lê o conteúdo do clipboard com `ler_texto()`.  
     try:
-        dados_clipboard = pyperclip.paste()
+        dados_clipboard = texto if texto is not None else ler_texto()
     
     # 2. Levanta `ValueError` se clipboard estiver vazio. 
         if not dados_clipboard:
@@ -0,0 +1,123 @@
+# uteis/rastro_entrada.py
+
+"""
+Módulo Rastro de Entrada (ações de mouse/teclado gravadas em vez de executadas).
+
+Com um rastro ativo, cada ação de entrada pretendida (clique, tecla, atalho, texto,
+rolagem) é acrescentada como uma linha JSON a um ficheiro `.jsonl`, com a hora, o tempo
+desde o início do rastro, as coordenadas do alvo e (se houver uma gravação de telas
+carregada) o quadro que estava a ser "exibido". Nada chega ao sistema operativo.
+Junto com a reprodução de telas (`uteis.reproducao_tela`), permite rodar os orquestradores
+de `acoes/` sem monitor e medir o custo da própria automação, sem a latência do SAP.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+from uteis import reproducao_tela
+
+# --- Estado do Rastro ---
+_CAMINHO_RASTRO: Optional[Path] = None
+_INICIO_RASTRO = 0.0
+_TOTAL_ACOES = 0
+_TRAVA_RASTRO = threading.Lock()
+
+
+def iniciar_rastro(caminho: Union[str, Path]) -> Path:
+    """
+    Ativa o rastro: as ações seguintes são gravadas no ficheiro (recriado) em vez de executadas.
+
+    Args:
+        caminho (Union[str, Path]): O ficheiro `.jsonl` do rastro (a pasta é criada se não existir).
+
+    Returns:
+        Path: O caminho absoluto do rastro.
+    """
+    global _CAMINHO_RASTRO, _INICIO_RASTRO, _TOTAL_ACOES
+    destino = Path(caminho).resolve()
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    with _TRAVA_RASTRO:
+        destino.write_text("", encoding="utf-8")
+        _CAMINHO_RASTRO, _INICIO_RASTRO, _TOTAL_ACOES = destino, time.perf_counter(), 0
+    return destino
+
+
+def encerrar_rastro() -> int:
+    """
+    Desativa o rastro (as ações voltam a ser executadas).
+
+    Returns:
+        int: Quantidade de ações gravadas.
+    """
+    global _CAMINHO_RASTRO
+    with _TRAVA_RASTRO:
+        _CAMINHO_RASTRO = None
+        return _TOTAL_ACOES
+
+
+def rastro_ativo() -> bool:
+    """Indica se as ações de entrada estão a ser gravadas em vez de executadas."""
+    return _CAMINHO_RASTRO is not None
+
+
+def registrar_acao(acao: str, **dados: Any):
+    """
+    Acrescenta uma ação ao rastro.
+
+    Args:
+        acao (str): O tipo da ação ("clique", "clique_direito", "tecla", "atalho", "escrever", "rolar").
+        **dados: Os detalhes da ação (ex: x, y, tecla, teclas, texto, cliques).
+
+    Raises:
+        RuntimeError: Se não houver rastro ativo.
+    """
+    global _TOTAL_ACOES
+    with _TRAVA_RASTRO:
+        if _CAMINHO_RASTRO is None:
+            raise RuntimeError("Nenhum rastro de entrada ativo.")
+        linha = {
+            "hora": datetime.now().isoformat(timespec="milliseconds"),
+            "segundos": round(time.perf_counter() - _INICIO_RASTRO, 4),
+            "acao": acao,
+            **dados,
+        }
+        quadro = reproducao_tela.obter_nome_quadro_atual()
+        if quadro is not None:
+            linha["quadro"] = quadro
+        with open(_CAMINHO_RASTRO, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(linha, ensure_ascii=False) + "\n")
+        _TOTAL_ACOES += 1
+
+
+def ler_rastro(caminho: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Lê as ações gravadas num rastro `.jsonl`, por ordem."""
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return [json.loads(linha) for linha in f if linha.strip()]
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar o rastro de entrada sem tocar no mouse nem no teclado.
+    Execute a partir da raiz: python -m uteis.rastro_entrada
+    """
+    import tempfile
+
+    print(">>> Iniciando teste do rastro de entrada...")
+
+    with tempfile.TemporaryDirectory() as pasta_temporaria:
+        caminho = iniciar_rastro(Path(pasta_temporaria) / "rastro.jsonl")
+        registrar_acao("clique", x=120, y=340)
+        registrar_acao("escrever", texto="Cliente", intervalo=0.05)
+        total = encerrar_rastro()
+
+        acoes = ler_rastro(caminho)
+        print(f"--- {total} ação(ões) gravada(s): {[acao['acao'] for acao in acoes]} (Esperado: ['clique', 'escrever'])")
+        assert total == 2 and [acao["acao"] for acao in acoes] == ["clique", "escrever"], "Teste 1 Falhou"
+        assert acoes[0]["x"] == 120 and not rastro_ativo(), "Teste 2 Falhou"
+
+    print("\n--- Teste concluído com SUCESSO! ---")
@@ -0,0 +1,332 @@
+# uteis/registro_ancoras.py
+
+"""
+Módulo Registro de Âncoras (cache em memória do parametros.json e das imagens).
+
+Carrega o `parametros.json` uma única vez por processo e decodifica todas as
+imagens de âncora para arrays em memória (formato BGR do OpenCV). O registro só
+é recarregado quando a data de modificação (mtime) do `parametros.json` muda,
+por exemplo depois de o `sincronizador_assets` reescrever o ficheiro. Se existir o pacote
+compilado por `uteis.compilador_assets`, os templates (e as suas versões em cinza e em
+pirâmide) vêm mapeados desse pacote em vez de decodificados PNG a PNG.
+
+Quando a tela usa outra escala (ex: Windows a 125%), os templates são redimensionados
+uma única vez em memória pela escala definida com `definir_escala`.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+import numpy as np
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+from uteis.correspondencia_imagem import (
+    converter_para_cinza, calcular_niveis_piramide, construir_piramide, calcular_espectro_template, redimensionar_template
+)
+from uteis.compilador_assets import decodificar_imagem, carregar_pacote
+
+# 1. Define constantes de caminho: projeto raiz e localização do `parametros.json`.
+CAMINHO_PROJETO = Path(__file__).resolve().parent.parent
+CAMINHO_JSON = CAMINHO_PROJETO / "parametros.json"
+
+# --- Estado do Registro (process-wide) ---
+# Os dados do JSON e os templates decodificados ficam em memória até o mtime mudar.
+_ANCORAS: Dict[str, Dict[str, Any]] = {}
+_GRUPOS: Dict[str, List[str]] = {}  # Chaves de cada "grupo_variantes", na ordem do JSON (refeito a cada carga).
+_ORIGINAIS: Dict[str, np.ndarray] = {}  # Templates como estão em disco.
+_TEMPLATES: Dict[str, np.ndarray] = {}  # Templates na escala da tela (os próprios originais se a escala for 1.0).
+_DERIVADOS: Dict[Tuple, Any] = {}  # Versões derivadas (cinza, pirâmides), calculadas sob demanda.
+_COMPILADOS: Dict[str, Dict[str, Any]] = {}  # Entradas do pacote compilado das âncoras que vieram dele.
+_ESPECTROS: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()  # Espectros FFT (LRU limitado por memória).
+_BYTES_ESPECTROS = 0
+_ESCALA = 1.0
+_MTIME_JSON = None
+_TRAVA_REGISTRO = threading.Lock()
+
+
+def _recarregar_se_necessario():
+    """
+    Função interna que (re)carrega o JSON e os templates se o mtime do arquivo mudou.
+
+    Raises:
+        FileNotFoundError: Se o arquivo `parametros.json` não existir.
+    """
+    global _ANCORAS, _GRUPOS, _ORIGINAIS, _TEMPLATES, _DERIVADOS, _BYTES_ESPECTROS, _MTIME_JSON
+
+    # 1. Obtém o mtime atual do JSON; levanta erro claro se o arquivo não existir.
+    try:
+        mtime_atual = CAMINHO_JSON.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo de elementos não encontrado: {CAMINHO_JSON}")
+
+    # 2. Se nada mudou desde a última carga, mantém o cache atual.
+    if mtime_atual == _MTIME_JSON:
+        return
+
+    # 3. Carrega o JSON completo.
+    with open(CAMINHO_JSON, 'r', encoding='utf-8') as f:
+        ancoras = json.load(f)
+
+    # 4. Obtém cada imagem referenciada uma única vez: do pacote compilado, se a imagem não mudou
+    #    desde a compilação (mesmo tamanho e mtime), senão decodificando o PNG. Imagens ausentes
+    #    ficam de fora e só geram erro quando a chave correspondente for pedida.
+    pacote = carregar_pacote()
+    originais, compilados = {}, {}
+    for chave, dados in ancoras.items():
+        caminho_relativo = dados.get("path")
+        if not caminho_relativo:
+            continue
+        caminho_absoluto = CAMINHO_PROJETO / caminho_relativo
+        if not caminho_absoluto.exists():
+            continue
+        entrada = pacote.get(caminho_relativo)
+        estado = caminho_absoluto.stat()
+        if entrada is not None and entrada["tamanho"] == estado.st_size and entrada["mtime_ns"] == estado.st_mtime_ns:
+            originais[chave], compilados[chave] = entrada["cor"], entrada
+        else:
+            originais[chave] = decodificar_imagem(caminho_absoluto)
+
+    # 5. Indexa os grupos de variantes (consultados a cada localização).
+    grupos = {}
+    for chave, dados in ancoras.items():
+        if dados.get("grupo_variantes"):
+            grupos.setdefault(dados["grupo_variantes"], []).append(chave)
+
+    # 6. Publica o novo estado de uma só vez (já na escala atual; as versões derivadas antigas são descartadas).
+    templates = {chave: redimensionar_template(template, _ESCALA) for chave, template in originais.items()}
+    _GRUPOS = grupos
+    _ANCORAS, _ORIGINAIS, _TEMPLATES, _DERIVADOS, _MTIME_JSON = ancoras, originais, templates, {}, mtime_atual
+    _COMPILADOS.clear()
+    _COMPILADOS.update(compilados)
+    _ESPECTROS.clear()
+    _BYTES_ESPECTROS = 0
+    _semear_derivados()
+
+
+def _semear_derivados():
+    """
+    Função interna: na escala 1.0, preenche as versões em cinza e em pirâmide com os arrays
+    já prontos do pacote compilado (noutras escalas são recalculadas a partir dos templates).
+    """
+    if _ESCALA != 1.0:
+        return
+    for chave, entrada in _COMPILADOS.items():
+        _DERIVADOS[("cinza", chave)] = entrada["cinza"]
+        _DERIVADOS[("piramide", chave, entrada["niveis_piramide"])] = entrada["piramide"]
+
+
+def carregar_ancoras() -> int:
+    """
+    Força a carga do registro (útil nas verificações iniciais para "aquecer" o cache).
+
+    Returns:
+        int: Quantidade de templates decodificados em memória.
+    """
+    with _TRAVA_REGISTRO:
+        _recarregar_se_necessario()
+        return len(_TEMPLATES)
+
+
+def definir_escala(escala: float) -> bool:
+    """
+    Define a escala tela/template e redimensiona todos os templates uma única vez em memória.
+
+    As versões derivadas (cinza, pirâmides, espectros FFT) são descartadas e recalculadas sob
+    demanda a partir dos templates redimensionados.
+
+    Args:
+        escala (float): A escala a aplicar (1.0 = templates como estão em disco).
+
+    Returns:
+        bool: True se a escala mudou.
+    """
+    global _ESCALA, _TEMPLATES, _DERIVADOS, _BYTES_ESPECTROS
+    with _TRAVA_REGISTRO:
+        if escala == _ESCALA:
+            return False
+        _ESCALA = escala
+        _TEMPLATES = {chave: redimensionar_template(template, escala) for chave, template in _ORIGINAIS.items()}
+        _DERIVADOS = {}
+        _ESPECTROS.clear()
+        _BYTES_ESPECTROS = 0
+        _semear_derivados()
+        return True
+
+
+def obter_escala() -> float:
+    """Retorna a escala tela/template aplicada aos templates (1.0 = sem redimensionamento)."""
+    return _ESCALA
+
+
+def obter_template_original(nome_chave: str) -> np.ndarray:
+    """
+    Retorna o template da âncora como está em disco (sem a escala), usado na detecção da escala.
+
+    Raises:
+        FileNotFoundError / KeyError: Os mesmos erros de `obter_ancora`.
+    """
+    obter_ancora(nome_chave)
+    with _TRAVA_REGISTRO:
+        return _ORIGINAIS[nome_chave]
+
+
+def listar_chaves() -> List[str]:
+    """Retorna todas as chaves de âncora definidas no `parametros.json`."""
+    with _TRAVA_REGISTRO:
+        _recarregar_se_necessario()
+        return list(_ANCORAS.keys())
+
+
+def listar_variantes(nome_grupo: str) -> List[str]:
+    """
+    Retorna as chaves que pertencem a um grupo de variantes (propriedade `"grupo_variantes"` no JSON),
+    na ordem do `parametros.json`. Lista vazia se o nome não for um grupo.
+    """
+    with _TRAVA_REGISTRO:
+        _recarregar_se_necessario()
+        return list(_GRUPOS.get(nome_grupo, []))
+
+
+def obter_dados_ancora(nome_chave: str) -> Dict[str, Any]:
+    """Retorna só os dados do JSON de uma âncora (sem decodificar nada). Vazio se a chave não existir."""
+    with _TRAVA_REGISTRO:
+        _recarregar_se_necessario()
+        return dict(_ANCORAS.get(nome_chave) or {})
+
+
+def obter_ancora(nome_chave: str) -> Tuple[Dict[str, Any], np.ndarray]:
+    """
+    Retorna os dados do JSON e o template decodificado (BGR) de uma âncora.
+
+    Args:
+        nome_chave (str): Nome da chave do elemento no arquivo `parametros.json`.
+
+    Returns:
+        Tuple[Dict[str, Any], np.ndarray]:
+            - O dicionário de dados correspondentes à chave no JSON.
+            - A imagem da âncora já decodificada em memória.
+
+    Raises:
+        FileNotFoundError: Se o arquivo `parametros.json` ou a imagem do elemento não existirem.
+        KeyError: Se a chave ou a propriedade 'path' não forem encontradas no JSON.
+    """
+    with _TRAVA_REGISTRO:
+        # 1. Garante que o registro está atualizado com o JSON em disco.
+        _recarregar_se_necessario()
+
+        # 2. Busca os dados do elemento pela chave informada; levanta KeyError se não existir.
+        dados_elemento = _ANCORAS.get(nome_chave)
+        if not dados_elemento:
+            raise KeyError(f"Chave '{nome_chave}' não encontrada no parametros.json.")
+
+        # 3. Valida a propriedade 'path' do elemento.
+        caminho_imagem_relativo = dados_elemento.get("path")
+        if not caminho_imagem_relativo:
+            raise KeyError(f"Propriedade 'path' não encontrada para a chave '{nome_chave}'.")
+
+        # 4. Busca o template em memória; se não foi decodificado, a imagem não existe em disco.
+        template = _TEMPLATES.get(nome_chave)
+        if template is None:
+            raise FileNotFoundError(f"Arquivo de imagem não encontrado: {CAMINHO_PROJETO / caminho_imagem_relativo}")
+
+        return dados_elemento, template
+
+
+def obter_template_cinza(nome_chave: str) -> np.ndarray:
+    """
+    Retorna o template da âncora em tons de cinza (convertido uma única vez e guardado em cache).
+
+    Raises:
+        FileNotFoundError / KeyError: Os mesmos erros de `obter_ancora`.
+    """
+    _, template = obter_ancora(nome_chave)
+    with _TRAVA_REGISTRO:
+        chave_cache = ("cinza", nome_chave)
+        if chave_cache not in _DERIVADOS:
+            _DERIVADOS[chave_cache] = converter_para_cinza(template)
+        return _DERIVADOS[chave_cache]
+
+
+def obter_piramide_template(nome_chave: str, niveis_maximos: int) -> List[np.ndarray]:
+    """
+    Retorna a pirâmide (em tons de cinza) do template da âncora, calculada uma única vez.
+
+    O número real de níveis depende do tamanho do template (templates pequenos não
+    aguentam reduções sem perder a forma).
+
+    Args:
+        nome_chave (str): Nome da chave do elemento no arquivo `parametros.json`.
+        niveis_maximos (int): Limite de níveis reduzidos definido na configuração.
+
+    Returns:
+        List[np.ndarray]: Os níveis da pirâmide (nível 0 = resolução total).
+    """
+    template_cinza = obter_template_cinza(nome_chave)
+    with _TRAVA_REGISTRO:
+        chave_cache = ("piramide", nome_chave, niveis_maximos)
+        if chave_cache not in _DERIVADOS:
+            niveis = calcular_niveis_piramide(template_cinza.shape, niveis_maximos)
+            _DERIVADOS[chave_cache] = construir_piramide(template_cinza, niveis)
+        return _DERIVADOS[chave_cache]
+
+
+def obter_espectro_template(nome_chave: str, modo: str, tamanho_fft: Tuple[int, int],
+                            limite_mb: float = 256) -> Dict[str, Any]:
+    """
+    Retorna os espectros FFT do template da âncora para um tamanho de transformada (motor "fft").
+
+    Os espectros têm o tamanho da tela (não do template), por isso o cache é um LRU limitado
+    a `limite_mb` megabytes: os menos usados recentemente são descartados primeiro.
+
+    Args:
+        nome_chave (str): Nome da chave do elemento no arquivo `parametros.json`.
+        modo (str): "cor" (template BGR) ou "cinza".
+        tamanho_fft (Tuple[int, int]): Tamanho da transformada da imagem onde se vai procurar.
+        limite_mb (float, optional): Memória máxima ocupada pelos espectros em cache.
+
+    Returns:
+        Dict[str, Any]: O resultado de `calcular_espectro_template`.
+    """
+    global _BYTES_ESPECTROS
+
+    template = obter_template_cinza(nome_chave) if modo == "cinza" else obter_ancora(nome_chave)[1]
+    with _TRAVA_REGISTRO:
+        chave_cache = (nome_chave, modo, tuple(tamanho_fft))
+        espectro = _ESPECTROS.get(chave_cache)
+        if espectro is not None:
+            _ESPECTROS.move_to_end(chave_cache)
+            return espectro
+
+        espectro = calcular_espectro_template(template, tamanho_fft)
+        _ESPECTROS[chave_cache] = espectro
+        _BYTES_ESPECTROS += sum(parte.nbytes for parte in espectro["espectros"])
+
+        # Descarta os espectros menos usados até caber no limite (o recém-calculado fica sempre).
+        while _BYTES_ESPECTROS > limite_mb * 1024 * 1024 and len(_ESPECTROS) > 1:
+            _, descartado = _ESPECTROS.popitem(last=False)
+            _BYTES_ESPECTROS -= sum(parte.nbytes for parte in descartado["espectros"])
+        return espectro
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar o registro de âncoras de forma isolada.
+    Execute-o a partir da raiz do projeto com: python -m uteis.registro_ancoras
+    """
+    import time
+
+    print(">>> Iniciando teste do registro de âncoras...")
+
+    inicio = time.perf_counter()
+    total = carregar_ancoras()
+    print(f"--- Primeira carga: {total} templates em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    inicio = time.perf_counter()
+    for chave in listar_chaves():
+        obter_ancora(chave)
+    print(f"--- Consulta de todas as chaves (cache quente): {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    dados, template = obter_ancora("tela_cadastro_parceirodeneg")
+    print(f"--- 'tela_cadastro_parceirodeneg': {dados} | template {template.shape}")
+    print("\n--- Teste concluído com SUCESSO! ---")
@@ -0,0 +1,201 @@
+# uteis/reproducao_tela.py
+
+"""
+Módulo Reprodução de Tela (quadros gravados no lugar da tela real).
+
+Carrega capturas PNG de telas do SAP gravadas antes (de uma pasta ou de um
+arquivo .zip) e devolve o "quadro atual" como se fosse a tela. Serve para rodar a
+localização de âncoras sem monitor, de forma determinística e repetível (perfis de
+desempenho, testes de regressão). Os quadros seguem a ordem alfabética dos nomes.
+"""
+
+import threading
+import zipfile
+import numpy as np
+import cv2
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+# --- Estado da Reprodução ---
+_ORIGEM: Optional[Path] = None       # Pasta ou .zip da gravação carregada (None = sem gravação).
+_NOMES_QUADROS: List[str] = []       # Nomes dos PNGs, em ordem.
+_QUADROS: Dict[str, np.ndarray] = {} # Quadros já decodificados (BGR), por nome.
+_INDICE_ATUAL = 0
+_TRAVA_REPRODUCAO = threading.Lock()
+
+
+def _ler_bytes_quadro(nome_quadro: str) -> bytes:
+    """Função interna: lê os bytes de um PNG da gravação (pasta ou .zip)."""
+    if _ORIGEM.is_dir():
+        return (_ORIGEM / nome_quadro).read_bytes()
+    with zipfile.ZipFile(_ORIGEM) as arquivo_zip:
+        return arquivo_zip.read(nome_quadro)
+
+
+def _decodificar_quadro(nome_quadro: str) -> np.ndarray:
+    """Função interna: decodifica (uma única vez) um quadro da gravação para BGR."""
+    quadro = _QUADROS.get(nome_quadro)
+    if quadro is None:
+        buffer = np.frombuffer(_ler_bytes_quadro(nome_quadro), dtype=np.uint8)
+        quadro = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+        if quadro is None:
+            raise ValueError(f"Não foi possível decodificar o quadro gravado: {nome_quadro}")
+        _QUADROS[nome_quadro] = quadro
+    return quadro
+
+
+def carregar_gravacao(caminho: Union[str, Path]) -> int:
+    """
+    Carrega uma gravação de telas (pasta com PNGs ou arquivo .zip com PNGs).
+
+    Args:
+        caminho (Union[str, Path]): A pasta ou o arquivo .zip com os quadros.
+
+    Returns:
+        int: Quantidade de quadros encontrados.
+
+    Raises:
+        FileNotFoundError: Se o caminho não existir ou não contiver nenhum PNG.
+    """
+    global _ORIGEM, _NOMES_QUADROS, _QUADROS, _INDICE_ATUAL
+
+    origem = Path(caminho).resolve()
+    if origem.is_dir():
+        nomes = sorted(p.name for p in origem.iterdir() if p.suffix.lower() == ".png")
+    elif origem.is_file() and zipfile.is_zipfile(origem):
+        with zipfile.ZipFile(origem) as arquivo_zip:
+            nomes = sorted(n for n in arquivo_zip.namelist() if n.lower().endswith(".png"))
+    else:
+        raise FileNotFoundError(f"Gravação de telas não encontrada (pasta ou .zip): {origem}")
+
+    if not nomes:
+        raise FileNotFoundError(f"Nenhum quadro PNG encontrado na gravação: {origem}")
+
+    with _TRAVA_REPRODUCAO:
+        _ORIGEM, _NOMES_QUADROS, _QUADROS, _INDICE_ATUAL = origem, nomes, {}, 0
+    return len(nomes)
+
+
+def descarregar_gravacao():
+    """Descarta a gravação carregada (a captura volta a ser da tela real)."""
+    global _ORIGEM, _NOMES_QUADROS, _QUADROS, _INDICE_ATUAL
+    with _TRAVA_REPRODUCAO:
+        _ORIGEM, _NOMES_QUADROS, _QUADROS, _INDICE_ATUAL = None, [], {}, 0
+
+
+def gravacao_ativa() -> bool:
+    """Indica se há uma gravação carregada (e, portanto, se a tela real deve ser ignorada)."""
+    return _ORIGEM is not None
+
+
+def listar_quadros() -> List[str]:
+    """Retorna os nomes dos quadros da gravação carregada, em ordem."""
+    return list(_NOMES_QUADROS)
+
+
+def obter_nome_quadro_atual() -> Optional[str]:
+    """Retorna o nome do quadro que está a ser "exibido" (None se não houver gravação)."""
+    with _TRAVA_REPRODUCAO:
+        return _NOMES_QUADROS[_INDICE_ATUAL] if _NOMES_QUADROS else None
+
+
+def selecionar_quadro(quadro: Union[int, str]):
+    """
+    Define o quadro atual pela posição (int) ou pelo nome do arquivo (str).
+
+    Raises:
+        IndexError / KeyError: Se a posição ou o nome não existirem na gravação.
+    """
+    global _INDICE_ATUAL
+    with _TRAVA_REPRODUCAO:
+        if isinstance(quadro, str):
+            if quadro not in _NOMES_QUADROS:
+                raise KeyError(f"Quadro '{quadro}' não encontrado na gravação.")
+            _INDICE_ATUAL = _NOMES_QUADROS.index(quadro)
+        else:
+            if not 0 <= quadro < len(_NOMES_QUADROS):
+                raise IndexError(f"Quadro {quadro} fora da gravação (0 a {len(_NOMES_QUADROS) - 1}).")
+            _INDICE_ATUAL = quadro
+
+
+def avancar_quadro() -> bool:
+    """
+    Passa para o quadro seguinte da gravação.
+
+    Returns:
+        bool: False se já estava no último quadro (o quadro atual não muda).
+    """
+    global _INDICE_ATUAL
+    with _TRAVA_REPRODUCAO:
+        if _INDICE_ATUAL + 1 >= len(_NOMES_QUADROS):
+            return False
+        _INDICE_ATUAL += 1
+        return True
+
+
+def capturar_quadro(regiao: Tuple[int, int, int, int] = None) -> np.ndarray:
+    """
+    Devolve o quadro atual (ou uma região dele) no formato BGR, como a captura da tela real.
+
+    Args:
+        regiao (Tuple[int, int, int, int], optional): Região (left, top, largura, altura).
+
+    Raises:
+        RuntimeError: Se não houver gravação carregada ou a região sair do quadro.
+    """
+    with _TRAVA_REPRODUCAO:
+        if _ORIGEM is None:
+            raise RuntimeError("Nenhuma gravação de telas carregada.")
+        quadro = _decodificar_quadro(_NOMES_QUADROS[_INDICE_ATUAL])
+
+    if regiao is None:
+        return quadro
+
+    left, top, largura, altura = regiao
+    if left < 0 or top < 0 or left + largura > quadro.shape[1] or top + altura > quadro.shape[0]:
+        raise RuntimeError(f"Região {regiao} fora do quadro gravado ({quadro.shape[1]}x{quadro.shape[0]}).")
+    return quadro[top:top + altura, left:left + largura]
+
+
+def obter_tamanho_quadro() -> Tuple[int, int]:
+    """Retorna (largura, altura) do quadro atual, o equivalente ao tamanho da tela."""
+    altura, largura = capturar_quadro().shape[:2]
+    return largura, altura
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para testar a reprodução de telas sem depender do SAP.
+    Execute a partir da raiz: python -m uteis.reproducao_tela
+    """
+    import tempfile
+
+    print(">>> Iniciando teste da reprodução de telas...")
+
+    with tempfile.TemporaryDirectory() as pasta_temporaria:
+        pasta = Path(pasta_temporaria)
+        for indice, cor in enumerate((0, 128, 255)):
+            cv2.imwrite(str(pasta / f"quadro_{indice:03d}.png"), np.full((60, 80, 3), cor, dtype=np.uint8))
+        with zipfile.ZipFile(pasta / "gravacao.zip", "w") as arquivo_zip:
+            for nome in ("quadro_000.png", "quadro_001.png"):
+                arquivo_zip.write(pasta / nome, nome)
+
+        total = carregar_gravacao(pasta)
+        print(f"--- Pasta: {total} quadros (Esperado: 3)")
+        assert total == 3, "Teste 1 Falhou"
+
+        avancar_quadro()
+        recorte = capturar_quadro((10, 10, 20, 5))
+        print(f"--- Quadro atual: {obter_nome_quadro_atual()} | recorte {recorte.shape} valor {recorte[0, 0, 0]} (Esperado: 128)")
+        assert recorte.shape == (5, 20, 3) and recorte[0, 0, 0] == 128, "Teste 2 Falhou"
+
+        total_zip = carregar_gravacao(pasta / "gravacao.zip")
+        selecionar_quadro("quadro_001.png")
+        print(f"--- Zip: {total_zip} quadros | tamanho {obter_tamanho_quadro()} (Esperado: 2 | (80, 60))")
+        assert total_zip == 2 and obter_tamanho_quadro() == (80, 60), "Teste 3 Falhou"
+        assert not avancar_quadro(), "Teste 4 Falhou"
+
+        descarregar_gravacao()
+
+    print("\n--- Teste concluído com SUCESSO! ---")
@@ -0,0 +1,155 @@
+# uteis/ritmo.py
+
+"""
+Módulo Ritmo (pausas da automação).
+
+Dono da pausa automática do PyAutoGUI (`pyautogui.PAUSE`, aplicada depois de cada chamada)
+e de todas as esperas fixas entre ações de `funcoes/` e `acoes/`. Cada espera tem um nome
+(`ATRASOS_BASE`, valores do perfil "normal") e o perfil ativo (`PACING_PROFILE`) decide a
+pausa do PyAutoGUI e o fator aplicado a todas elas:
+
+- "seguro": máquinas lentas ou SAP remoto (esperas 50% maiores);
+- "normal": os tempos de sempre;
+- "turbo": estações rápidas (esperas pela metade, pausa do PyAutoGUI quase nula).
+
+Esperas individuais podem ser fixadas por ambiente com `PACING_OVERRIDES`
+(ex: `carregar_aba=2,apos_campo=0.6`), em segundos, sem o fator do perfil.
+"""
+
+import time
+import pyautogui
+from typing import Dict
+
+from configuracoes.carregar_config import PERFIL_RITMO, AJUSTES_RITMO
+
+# Esperas nomeadas (segundos) no perfil "normal".
+ATRASOS_BASE = {
+    # --- funcoes/ ---
+    "foco_campo": 0.5,                  # Depois de clicar num campo, antes de escrever nele.
+    "abrir_dropdown": 0.8,              # Depois de clicar num dropdown, até a lista abrir.
+    "confirmar_entrada": 0.5,           # Depois de escrever, antes do Tab/Enter de confirmação.
+    "leitura_campo": 0.2,               # Entre o clique e o Ctrl+C da leitura de volta de um campo.
+    "copiar_campo": 0.3,                # Entre o clique e o Ctrl+C de `copiar_texto_elemento`.
+    "rolagem_linha": 0.3,               # Entre cada linha rolada com a roda do mouse.
+    "rolagem_passo": 0.2,               # Depois de cada gesto de `rolar_ate_elemento`, antes de conferir a tela.
+    "retentativa": 0.5,                 # Entre as tentativas do Assistente executor.
+    # --- acoes/ ---
+    "apos_clique": 0.5,                 # Depois de marcar/clicar uma opção.
+    "apos_campo": 1.0,                  # Depois de preencher um campo do formulário.
+    "mudar_tipo_pn": 2.0,               # Depois de mudar o Tipo do PN (o SAP recalcula o formulário).
+    "antes_aba": 1.0,                   # Antes de trocar de aba.
+    "carregar_aba": 3.0,                # Depois de trocar para uma aba pesada.
+    "abrir_menu": 1.0,                  # Depois de um atalho/clique direito que abre um menu.
+    "abrir_menu_log": 2.0,              # Menu de contexto do log de modificações.
+    "colar_tabela": 1.0,                # Depois de colar/confirmar uma tabela no SAP.
+    "gravar_tabela": 3.0,               # Depois de colar a tabela de endereços, até o SAP a processar.
+    "fechar_janela": 1.0,               # Depois de fechar uma janela ou confirmar um diálogo.
+    "abrir_linha": 1.0,                 # Depois de abrir uma linha nova numa grade.
+    "apos_falha": 1.0,                  # Depois de uma falha tratada, antes de seguir.
+    "tentar_documento": 1.0,            # Entre as tentativas de copiar o CNPJ/CPF.
+    "antes_ie": 1.5,                    # Antes de escrever a Inscrição Estadual.
+}
+
+# Perfis: pausa automática do PyAutoGUI e fator aplicado às esperas nomeadas.
+PERFIS_RITMO = {
+    "seguro": {"pausa_pyautogui": 0.1, "fator": 1.5},
+    "normal": {"pausa_pyautogui": 0.1, "fator": 1.0},
+    "turbo": {"pausa_pyautogui": 0.02, "fator": 0.5},
+}
+
+# --- Estado do Ritmo ---
+_PERFIL = None
+_ATRASOS: Dict[str, float] = {}
+
+
+def _ler_ajustes(ajustes: str) -> Dict[str, float]:
+    """
+    Função interna: lê os ajustes por ambiente no formato "nome=segundos,nome=segundos".
+
+    Raises:
+        ValueError: Se um ajuste estiver mal escrito ou nomear uma espera desconhecida.
+    """
+    resultado = {}
+    for item in filter(None, (parte.strip() for parte in (ajustes or "").split(","))):
+        nome, _, valor = item.partition("=")
+        nome = nome.strip()
+        if nome not in ATRASOS_BASE:
+            raise ValueError(f"PACING_OVERRIDES: espera '{nome}' desconhecida. Esperas válidas: {list(ATRASOS_BASE)}")
+        try:
+            resultado[nome] = max(0.0, float(valor))
+        except ValueError:
+            raise ValueError(f"PACING_OVERRIDES: valor inválido para '{nome}' ('{valor.strip()}').")
+    return resultado
+
+
+def aplicar_perfil(nome_perfil: str, ajustes: str = ""):
+    """
+    Ativa um perfil de ritmo: ajusta `pyautogui.PAUSE` e recalcula todas as esperas nomeadas.
+
+    Args:
+        nome_perfil (str): "seguro", "normal" ou "turbo".
+        ajustes (str, optional): Esperas fixadas por ambiente ("nome=segundos,...").
+
+    Raises:
+        ValueError: Se o perfil ou algum ajuste for inválido.
+    """
+    global _PERFIL, _ATRASOS
+    if nome_perfil not in PERFIS_RITMO:
+        raise ValueError(f"Perfil de ritmo '{nome_perfil}' inválido. Perfis válidos: {list(PERFIS_RITMO)}")
+    perfil = PERFIS_RITMO[nome_perfil]
+    atrasos = {nome: round(segundos * perfil["fator"], 3) for nome, segundos in ATRASOS_BASE.items()}
+    atrasos.update(_ler_ajustes(ajustes))
+
+    pyautogui.PAUSE = perfil["pausa_pyautogui"]
+    _PERFIL, _ATRASOS = nome_perfil, atrasos
+
+
+def obter_perfil() -> str:
+    """Retorna o nome do perfil de ritmo ativo."""
+    return _PERFIL
+
+
+def atraso(nome: str) -> float:
+    """
+    Retorna a duração (segundos) de uma espera nomeada no perfil ativo.
+
+    Raises:
+        KeyError: Se a espera não existir em `ATRASOS_BASE`.
+    """
+    if nome not in _ATRASOS:
+        raise KeyError(f"Espera '{nome}' desconhecida. Esperas válidas: {list(ATRASOS_BASE)}")
+    return _ATRASOS[nome]
+
+
+def pausar(nome: str):
+    """Espera a duração da espera nomeada no perfil ativo."""
+    time.sleep(atraso(nome))
+
+
+# O perfil configurado vale desde a importação (antes da primeira ação na tela).
+aplicar_perfil(PERFIL_RITMO, AJUSTES_RITMO)
+
+
+# --- Camada de Teste Direto ---
+if __name__ == '__main__':
+    """
+    Bloco para conferir os perfis de ritmo (não executa nada na tela).
+    Execute a partir da raiz: python -m uteis.ritmo
+    """
+    print(">>> Iniciando teste dos perfis de ritmo...")
+
+    aplicar_perfil("turbo")
+    print(f"--- turbo: PAUSE={pyautogui.PAUSE} | carregar_aba={atraso('carregar_aba')} (Esperado: 1.5)")
+    assert atraso("carregar_aba") == 1.5, "Teste 1 Falhou"
+
+    aplicar_perfil("normal", "carregar_aba=2, apos_campo=0.6")
+    print(f"--- normal + ajustes: carregar_aba={atraso('carregar_aba')} apos_campo={atraso('apos_campo')} (Esperado: 2.0 e 0.6)")
+    assert atraso("carregar_aba") == 2.0 and atraso("apos_campo") == 0.6, "Teste 2 Falhou"
+
+    try:
+        aplicar_perfil("normal", "inexistente=1")
+        raise AssertionError("Teste 3 Falhou")
+    except ValueError:
+        print("--- Ajuste desconhecido rejeitado.")
+
+    print("\n--- Teste concluído com SUCESSO! ---")
@@ -8,8 +8,12 @@ antes do início da automação principal.
 # --- Imports de Módulos do Projeto ---
 
 import time
+import pyautogui
 from funcoes.localizar_elemento import localizar_elemento
 from uteis.sincronizador_assets import sincronizar_json_com_pasta_assets
+from uteis.compilador_assets import compilar_assets
+from configuracoes.carregar_config import NIVEIS_PIRAMIDE
+from uteis.registro_ancoras import carregar_ancoras
 from uteis.cores import VERDE, VERMELHO, RESET
 from uteis.gestor_sessao import iniciar_sessao
 
@@ -18,7 +22,7 @@ def executar_verificacoes_iniciais():
     """Verificações iniciais do ambiente de automação."""
     """
     Orquestra as checagens essenciais:
-    1. Sincroniza os assets (JSON e imagens).
+    1. Sincroniza os assets (JSON e imagens) e compila o pacote de âncoras.
     2. Verifica se a tela inicial do Cadastro de PN está visível.
 
     Levanta uma exceção em caso de qualquer falha.
@@ -32,6 +36,14 @@ def executar_verificacoes_iniciais():
         sincronizar_json_com_pasta_assets()
         print(f"    {VERDE}✔ Assets sincronizados.{RESET}")
 
+        # ETAPA 2.1: Compila as imagens no pacote pré-processado de temp/ (só as que mudaram).
+        compilacao = compilar_assets(NIVEIS_PIRAMIDE)
+        print(f"    {VERDE}✔ Assets compilados ({compilacao['recompiladas']} de {compilacao['total']} recompilado(s)).{RESET}")
+
+        # ETAPA 2.2: Carrega o registro de âncoras (JSON + imagens decodificadas) em memória.
+        total_templates = carregar_ancoras()
+        print(f"    {VERDE}✔ {total_templates} âncoras carregadas em memória.{RESET}")
+
         # ETAPA 3: Verifica se a tela inicial está visível.
         chave_tela_inicial = "tela_cadastro_parceirodeneg"
         localizar_elemento(chave_tela_inicial)
@@ -52,7 +64,7 @@ def executar_verificacoes_iniciais():
          print(f"    {VERMELHO}  -> Detalhe: {key_err}{RESET}")
          raise # Re-levanta para o Assistente executor executor
 
-    except pyautogui.ImageNotFoundException as img_err: # Import pyautogui if needed at top
+    except pyautogui.ImageNotFoundException as img_err:
          # Erro específico se a imagem da tela inicial não for encontrada na tela
          print(f"    {VERMELHO}✖ Falha na verificação: Tela inicial do cadastro NÃO encontrada.{RESET}")
          print(f"    {VERMELHO}  -> Detalhe: {img_err}{RESET}")